@@ -13,6 +13,9 @@ class User(Base):
     weight = Column(Integer)
     height = Column(Integer)
     nutrition_status = Column(String(10))
+    profile_version = Column(Integer, nullable=False, default=1)
+    # Bumped when the user's ingredient exclusions or need overrides change
+    preferences_version = Column(Integer, nullable=False, default=1)
 
 class Nutritions(Base):
     __tablename__ = 'nutritions'
@@ -20,11 +23,18 @@ class Nutritions(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255))
 
+class FoodCategories(Base):
+    __tablename__ = 'food_categories'
+
+    code = Column(Integer, primary_key=True)
+    name = Column(String(255))
+
 class Food(Base):
     __tablename__ = 'foods'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255))
+    category_code = Column(Integer, ForeignKey('food_categories.code'))
 
 class UserMinNutritions(Base):
     __tablename__ = 'user_minimum_nutritions'
@@ -33,6 +43,16 @@ class UserMinNutritions(Base):
     u_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     n_id = Column(Integer, ForeignKey('nutritions.id'), nullable=False)
     value = Column(Float)
+    # Only "clinician" rows are overrides; "computed" rows predate per-user overrides
+    source = Column(String(10), nullable=False, default="computed")
+
+class MinimumNeeds(Base):
+    __tablename__ = 'minimum_needs'
+
+    age_band = Column(String(10), primary_key=True)
+    nutrition_status = Column(String(50), primary_key=True)
+    n_id = Column(Integer, ForeignKey('nutritions.id'), primary_key=True)
+    value = Column(Float, nullable=False)
 
 class FoodHistories(Base):
     __tablename__ = 'food_histories'
@@ -42,14 +62,23 @@ class FoodHistories(Base):
     f_id = Column(Integer, ForeignKey('foods.id'), nullable=False)
     date = Column(Date)
 
+class FoodNutritions(Base):
+    __tablename__ = 'food_nutritions'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    f_id = Column(Integer, ForeignKey('foods.id'), nullable=False)
+    n_id = Column(Integer, ForeignKey('nutritions.id'), nullable=False)
+    value = Column(Float)
+
 class FoodBeverages(Base):
     __tablename__ = 'food_beverages'
     __table_args__ = {
-        'info': {'is_view': True}
+        'info': {'is_materialized_view': True}
     }
     
     f_id = Column(Integer, primary_key=True)
     f_name = Column(String(255))
+    category = Column(Integer)
     i_ids = Column(ARRAY(Integer))
     i_names = Column(ARRAY(String))
     calcium = Column(Float)
@@ -66,6 +95,12 @@ class Ingredients(Base):
     name = Column(String(255))
 
 
+class UserIngredientExclusions(Base):
+    __tablename__ = 'user_ingredient_exclusions'
+
+    u_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    i_id = Column(Integer, ForeignKey('ingredients.id'), primary_key=True)
+
 class UserGrowthRecords(Base):
     __tablename__ = 'user_growth_records'
 
@@ -76,3 +111,15 @@ class UserGrowthRecords(Base):
     nutrition_status = Column(String(10))
     date = Column(Date)
 
+class UserDailyIntake(Base):
+    __tablename__ = 'user_daily_intake'
+
+    u_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    date = Column(Date, primary_key=True)
+    calcium = Column(Float, nullable=False, default=0)
+    carbohydrate = Column(Float, nullable=False, default=0)
+    energy = Column(Float, nullable=False, default=0)
+    iron = Column(Float, nullable=False, default=0)
+    protein = Column(Float, nullable=False, default=0)
+    fat = Column(Float, nullable=False, default=0)
+    food_count = Column(Integer, nullable=False, default=0)
@@ -1,21 +1,127 @@
-from helper import verify_password
+from helper import verify_and_update_password_async, create_access_token
 from Model import User
 from typing import Annotated
+from datetime import date, timedelta
+import hmac
+import threading
+import time
 import jwt
-from fastapi import Depends, HTTPException, status
-from core.core import SECRET_KEY, ALGORITHM, db, oauth2_scheme
+from decouple import config
+from fastapi import Depends, Header, HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.core import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, get_db, oauth2_scheme
 from jwt.exceptions import InvalidTokenError
 
 
+# "lookup" loads the user row on every request; "claims" trusts the profile
+# carried in the token and only checks that its version is still current
+AUTH_MODE = config("AUTH_MODE", default="lookup")
+# How long a worker trusts its cached copy of a user's profile version
+PROFILE_VERSION_TTL = config("PROFILE_VERSION_TTL", default=60, cast=int)
+# Shared key for clinic integrations; clinic endpoints are disabled when unset
+CLINIC_API_KEY = config("CLINIC_API_KEY", default="")
 
-async def authenticate_user(username: str, password: str) -> User | bool:
+
+class Principal(BaseModel):
+    """The authenticated user as seen by the endpoints"""
+    id: int
+    username: str
+    gender: str | None = None
+    date_of_birth: date | None = None
+    nutrition_status: str | None = None
+    profile_version: int = 1
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            gender=user.gender,
+            date_of_birth=user.date_of_birth,
+            nutrition_status=user.nutrition_status,
+            profile_version=user.profile_version or 1,
+        )
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "Principal":
+        profile = claims["profile"]
+        return cls(
+            id=claims["id"],
+            username=claims["username"],
+            gender=profile.get("g"),
+            date_of_birth=profile.get("dob"),
+            nutrition_status=profile.get("ns"),
+            profile_version=profile["v"],
+        )
+
+
+def token_claims(user: User) -> dict:
+    """JWT claims for a user, including the compact profile claim"""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "profile": {
+            "g": user.gender,
+            "dob": user.date_of_birth.isoformat() if user.date_of_birth else None,
+            "ns": user.nutrition_status,
+            "v": user.profile_version or 1,
+        },
+    }
+
+
+def issue_access_token(user: User) -> str:
+    return create_access_token(
+        data=token_claims(user),
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+
+class ProfileVersions:
+    """Per-user profile versions, cached in process for a short TTL"""
+
+    def __init__(self, ttl: int = PROFILE_VERSION_TTL):
+        self.ttl = ttl
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    async def get(self, db: AsyncSession, user_id: int) -> int | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(user_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        version = await db.scalar(select(User.profile_version).where(User.id == user_id))
+        if version is not None:
+            self.set(user_id, version)
+        return version
+
+    def set(self, user_id: int, version: int) -> None:
+        with self._lock:
+            self._versions[user_id] = (version, time.monotonic() + self.ttl)
+
+
+profile_versions = ProfileVersions()
+
+
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> User | bool:
     """Authenticate user credentials"""
-    user = db.query(User).filter_by(username=username).first()
-    if not user or not verify_password(password, user.password):
+    user = await db.scalar(select(User).filter_by(username=username))
+    if not user:
+        return False
+    valid, new_hash = await verify_and_update_password_async(password, user.password)
+    if not valid:
         return False
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
     return user
 
-async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> User:
+async def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Principal:
     """Get current user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -24,9 +130,28 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> Use
     )
     try:
         token_data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user = db.query(User).filter_by(username=token_data.get("username")).first()
-        if not user:
-            raise credentials_exception
-        return user
     except InvalidTokenError:
         raise credentials_exception
+
+    if AUTH_MODE == "claims" and "profile" in token_data:
+        # Tokens issued before the profile last changed are no longer valid
+        try:
+            principal = Principal.from_claims(token_data)
+        except (KeyError, ValidationError):
+            raise credentials_exception
+        if await profile_versions.get(db, principal.id) != principal.profile_version:
+            raise credentials_exception
+        return principal
+
+    user = await db.scalar(select(User).filter_by(username=token_data.get("username")))
+    if not user:
+        raise credentials_exception
+    return Principal.from_user(user)
+
+async def require_clinic_key(x_api_key: Annotated[str | None, Header()] = None) -> None:
+    """Allow the request only with the configured clinic API key"""
+    if not CLINIC_API_KEY or not x_api_key or not hmac.compare_digest(x_api_key.encode(), CLINIC_API_KEY.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid clinic API key",
+        )
@@ -0,0 +1,108 @@
+from datetime import date
+
+import numpy as np
+from decouple import config
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from Model import User, UserMinNutritions, FoodHistories, UserDailyIntake, UserIngredientExclusions
+from helper import NUTRITION_FEATURES, nutrition_mapping, resolve_minimum_nutrition, age_band, age_in_months
+from intake import summarize_intake
+from catalog import FoodCatalog
+from recommender import top_deficient_nutrients, recommend_foods_batch
+
+
+# Largest number of users accepted in one batch recommendation request
+BATCH_MAX_USERS = config("BATCH_MAX_USERS", default=500, cast=int)
+
+
+# ======================
+# Batch Recommendations
+# ======================
+
+async def load_batch_inputs(db: AsyncSession, user_ids: list, day: date) -> dict:
+    """Profile, intake summary, eaten foods and exclusions of many users, one query per table"""
+    id_to_nutrition = {v: k for k, v in nutrition_mapping.items()}
+    users = (await db.execute(
+        select(User.id, User.date_of_birth, User.nutrition_status).where(User.id.in_(user_ids))
+    )).all()
+    inputs = {row.id: {"user": row, "overrides": {}, "consumed": {}, "history": [], "excluded": []} for row in users}
+
+    for row in (await db.execute(
+        select(UserMinNutritions.u_id, UserMinNutritions.n_id, UserMinNutritions.value)
+        .where(UserMinNutritions.u_id.in_(user_ids), UserMinNutritions.source == "clinician")
+    )).all():
+        inputs[row.u_id]["overrides"][id_to_nutrition[row.n_id]] = row.value
+    for row in (await db.scalars(
+        select(UserDailyIntake).where(UserDailyIntake.u_id.in_(user_ids), UserDailyIntake.date == day)
+    )).all():
+        inputs[row.u_id]["consumed"] = {nutrisi: getattr(row, nutrisi) for nutrisi in NUTRITION_FEATURES}
+    for row in (await db.execute(
+        select(FoodHistories.u_id, FoodHistories.f_id)
+        .where(FoodHistories.u_id.in_(user_ids), FoodHistories.date == day)
+    )).all():
+        inputs[row.u_id]["history"].append(row.f_id)
+    for row in (await db.execute(
+        select(UserIngredientExclusions.u_id, UserIngredientExclusions.i_id)
+        .where(UserIngredientExclusions.u_id.in_(user_ids))
+    )).all():
+        inputs[row.u_id]["excluded"].append(row.i_id)
+
+    for entry in inputs.values():
+        user = entry["user"]
+        needs = resolve_minimum_nutrition(
+            age_in_months(user.date_of_birth, day), user.nutrition_status, entry["overrides"]
+        ) if user.date_of_birth else {}
+        entry["summary"] = summarize_intake(needs, entry["consumed"])
+        entry["age_band"] = age_band(age_in_months(user.date_of_birth, day)) if user.date_of_birth else None
+    return inputs
+
+
+async def run_batch_recommendations(db: AsyncSession, catalog: FoodCatalog, user_ids: list, k: int = 3) -> list:
+    """Recommendations for many users, scored together in one pass
+
+    Users are answered like /food_recommendations would answer them; the
+    ones it would reject get an error or message entry instead. Returns one
+    result per requested user, in request order.
+    """
+    day = date.today()
+    inputs = await load_batch_inputs(db, sorted(set(user_ids)), day)
+
+    results = {}
+    scored = []
+    for user_id, entry in inputs.items():
+        if not entry["history"]:
+            results[user_id] = {"user_id": user_id, "status": "error", "detail": "Belum ada histori makanan untuk user ini."}
+        elif all(val == 0 for val in entry["summary"]["residue"].values()):
+            results[user_id] = {
+                "user_id": user_id, "status": "ok",
+                "message": "User telah memenuhi kebutuhan nutrisi", "recommendations": [],
+            }
+        else:
+            scored.append(user_id)
+
+    if scored:
+        residues = np.array(
+            [[inputs[u]["summary"]["residue"][nutrisi] for nutrisi in NUTRITION_FEATURES] for u in scored],
+            dtype=np.float32,
+        )
+        nutrient_masks = np.zeros((len(scored), len(NUTRITION_FEATURES)), dtype=bool)
+        available = np.empty((len(scored), len(catalog)), dtype=bool)
+        for i, u in enumerate(scored):
+            entry = inputs[u]
+            nutrient_masks[i, catalog.columns_for(top_deficient_nutrients(entry["summary"]["deficiency_percent"]))] = True
+            available[i] = ~catalog.mask_for(entry["history"])
+            if entry["age_band"] is not None:
+                available[i] &= catalog.age_mask(entry["age_band"])
+            if entry["excluded"]:
+                available[i] &= ~catalog.ingredient_mask(entry["excluded"])
+
+        history_rows = [catalog.rows_for(inputs[u]["history"]) for u in scored]
+        top_rows = recommend_foods_batch(catalog, residues, nutrient_masks, available, history_rows, k)
+        for u, rows in zip(scored, top_rows):
+            results[u] = {"user_id": u, "status": "ok", "recommendations": [catalog.foods[row] for row in rows]}
+
+    return [
+        results.get(user_id, {"user_id": user_id, "status": "error", "detail": "User not found"})
+        for user_id in user_ids
+    ]
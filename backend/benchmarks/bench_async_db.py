@@ -0,0 +1,78 @@
+"""Compare DB throughput of the sync (thread pool) and async (asyncpg) paths.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_async_db --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import select
+
+from core.core import SessionLocal, AsyncSessionLocal, async_engine, engine
+from Model import User, FoodHistories
+
+# Starlette runs sync endpoints on an anyio thread pool of 40 workers
+SYNC_THREADS = 40
+
+
+def sync_request(username: str) -> None:
+    with SessionLocal() as db:
+        user = db.scalar(select(User).filter_by(username=username))
+        db.scalars(select(FoodHistories).where(
+            FoodHistories.u_id == (user.id if user else 0),
+            FoodHistories.date == date.today(),
+        )).all()
+
+
+async def async_request(username: str) -> None:
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).filter_by(username=username))
+        (await db.scalars(select(FoodHistories).where(
+            FoodHistories.u_id == (user.id if user else 0),
+            FoodHistories.date == date.today(),
+        ))).all()
+
+
+def bench_sync(n_requests: int, username: str) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SYNC_THREADS) as pool:
+        list(pool.map(sync_request, [username] * n_requests))
+    return time.perf_counter() - start
+
+
+async def bench_async(n_requests: int, concurrency: int, username: str) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded() -> None:
+        async with semaphore:
+            await async_request(username)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded() for _ in range(n_requests)))
+    elapsed = time.perf_counter() - start
+    await async_engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--username", default="benchmark")
+    args = parser.parse_args()
+
+    sync_elapsed = bench_sync(args.requests, args.username)
+    engine.dispose()
+    async_elapsed = asyncio.run(bench_async(args.requests, args.concurrency, args.username))
+
+    print(f"{'path':<8}{'requests':>10}{'seconds':>10}{'req/s':>10}")
+    for name, elapsed in (("sync", sync_elapsed), ("async", async_elapsed)):
+        print(f"{name:<8}{args.requests:>10}{elapsed:>10.2f}{args.requests / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure how a login storm affects the latency of other endpoints.
+
+Fires concurrent logins at the app in process while a probe keeps calling a
+cheap endpoint, then reports the probe's latency. Run it once with bcrypt on
+the thread pool and once inline to compare. Run from the backend directory:
+
+    python -m benchmarks.bench_login --logins 50
+    PASSWORD_HASH_WORKERS=0 python -m benchmarks.bench_login --logins 50
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+
+import main
+from helper import PASSWORD_HASH_WORKERS
+from core.core import BCRYPT_ROUNDS
+
+
+PROBE_INTERVAL = 0.005
+
+
+async def probe(client: httpx.AsyncClient, path: str, stop: asyncio.Event, timings: list) -> None:
+    # Timed from when the probe was due, so a stalled event loop counts too
+    while not stop.is_set():
+        due = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        await client.get(path)
+        timings.append(time.perf_counter() - due)
+
+
+async def run(args) -> dict:
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        username, password = f"bench-{uuid.uuid4().hex[:12]}", "bench-password"
+        response = await client.post("/register", json={
+            "username": username, "password": password, "confirm_password": password,
+            "weight": 10, "height": 80, "gender": "l", "date_of_birth": "2023-01-01",
+        })
+        response.raise_for_status()
+
+        baseline, during = [], []
+        stop = asyncio.Event()
+        task = asyncio.create_task(probe(client, args.probe, stop, baseline))
+        await asyncio.sleep(1.0)
+        stop.set()
+        await task
+
+        stop = asyncio.Event()
+        task = asyncio.create_task(probe(client, args.probe, stop, during))
+        start = time.perf_counter()
+        logins = await asyncio.gather(*[
+            client.post("/login", data={"username": username, "password": password})
+            for _ in range(args.logins)
+        ])
+        storm = time.perf_counter() - start
+        stop.set()
+        await task
+
+    assert all(r.status_code == 200 for r in logins)
+    summary = lambda timings: {
+        "p50_ms": float(np.percentile(timings, 50) * 1000),
+        "p99_ms": float(np.percentile(timings, 99) * 1000),
+        "max_ms": float(max(timings) * 1000),
+    }
+    return {
+        "workers": PASSWORD_HASH_WORKERS,
+        "rounds": BCRYPT_ROUNDS,
+        "logins": args.logins,
+        "storm_s": storm,
+        "baseline": summary(baseline),
+        "during_storm": summary(during),
+    }
+
+
+def main_() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--probe", default="/db_pool_status", help="endpoint timed during the storm")
+    parser.add_argument("--output", help="append results as a JSON line to this file")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    mode = f"{result['workers']} bcrypt threads" if result["workers"] else "inline bcrypt"
+    print(f"{mode}, cost {result['rounds']}: {result['logins']} logins in {result['storm_s']:.2f}s")
+    for phase in ("baseline", "during_storm"):
+        stats = result[phase]
+        print(f"  {phase:<13} p50 {stats['p50_ms']:8.2f}ms  p99 {stats['p99_ms']:8.2f}ms  max {stats['max_ms']:8.2f}ms")
+
+    if args.output:
+        with open(args.output, "a") as f:
+            f.write(json.dumps({"recorded_at": datetime.now(timezone.utc).isoformat(), **result}) + "\n")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,87 @@
+"""Measure /foods/search latency against the loaded catalog.
+
+Queries are sampled from real food names: one to three leading words, cut
+at a random length to mimic autocomplete, with some adjacent letters swapped
+to exercise the typo path. Typo recall is the share of misspelled queries
+that still return the food they were sampled from, among those whose
+correctly spelled query returns it. Run from the backend directory:
+
+    python -m benchmarks.bench_search --queries 5000 --output search.jsonl
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from search import get_search_index
+
+
+def sample_queries(names: list, count: int, typo_rate: float, seed: int) -> list:
+    """(query, correctly spelled query, row of the sampled food) triples"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        row = rng.randrange(len(names))
+        words = names[row].lower().split()
+        clean = " ".join(words[:rng.randint(1, min(3, len(words)))])
+        clean = clean[:rng.randint(1, len(clean))]
+        query = clean
+        if len(clean) > 3 and rng.random() < typo_rate:
+            i = rng.randrange(len(clean) - 1)
+            query = clean[:i] + clean[i + 1] + clean[i] + clean[i + 2:]
+        queries.append((query, clean, row))
+    return queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--typo-rate", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="append results as a JSON line to this file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_search_index()
+    build = time.perf_counter() - start
+
+    names = [food["f_name"] for food in index.catalog.foods]
+    timings = []
+    typos = found = 0
+    for query, clean, row in sample_queries(names, args.queries, args.typo_rate, args.seed):
+        start = time.perf_counter()
+        results = index.search(query, args.k)
+        timings.append(time.perf_counter() - start)
+
+        if query != clean:
+            food_id = index.catalog.foods[row]["f_id"]
+            if any(result["id"] == food_id for result in index.search(clean, args.k)):
+                typos += 1
+                found += any(result["id"] == food_id for result in results)
+
+    p50, p95, p99 = (np.percentile(timings, [50, 95, 99]) * 1000).tolist()
+    typo_recall = found / typos if typos else None
+    print(f"{len(names)} foods, {len(index.vocabulary)} tokens, index built in {build:.3f}s")
+    print(f"p50 {p50:.3f}ms  p95 {p95:.3f}ms  p99 {p99:.3f}ms")
+    if typos:
+        print(f"typo recall {typo_recall:.1%} over {typos} misspelled queries")
+
+    if args.output:
+        with open(args.output, "a") as f:
+            f.write(json.dumps({
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+                "foods": len(names),
+                "queries": args.queries,
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "typo_recall": typo_recall,
+            }) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure backend cold-start latency with and without the catalog artifact.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_startup --runs 3 --output startup.jsonl
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+# Imports main (the same work a uvicorn worker does before serving) and
+# forces the catalog to load, then prints the elapsed wall time.
+COLD_START = """
+import time
+start = time.perf_counter()
+import main
+from catalog import get_catalog
+get_catalog()
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(artifact_dir: str) -> float:
+    env = {**os.environ, "CATALOG_ARTIFACT_DIR": artifact_dir}
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="append results as a JSON line to this file")
+    args = parser.parse_args()
+
+    results = {"rebuild": [], "artifact": []}
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as empty_dir:
+            results["rebuild"].append(cold_start(empty_dir))
+    with tempfile.TemporaryDirectory() as artifact_dir:
+        cold_start(artifact_dir)
+        for _ in range(args.runs):
+            results["artifact"].append(cold_start(artifact_dir))
+
+    print(f"{'mode':<10}{'min (s)':>10}{'mean (s)':>10}")
+    for mode, timings in results.items():
+        print(f"{mode:<10}{min(timings):>10.3f}{sum(timings) / len(timings):>10.3f}")
+
+    if args.output:
+        with open(args.output, "a") as f:
+            f.write(json.dumps({"recorded_at": datetime.now(timezone.utc).isoformat(), **results}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
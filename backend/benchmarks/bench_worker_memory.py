@@ -0,0 +1,71 @@
+"""Measure per-worker memory of the catalog, memory-mapped vs copied.
+
+Starts N worker processes that each open the catalog artifact and touch
+every page, then reports the growth in RSS and PSS (proportional set size,
+where shared pages are split between the processes mapping them).
+Linux only; build the artifact first with ``python manage.py build-catalog``.
+
+    python -m benchmarks.bench_worker_memory --workers 4
+"""
+import argparse
+import multiprocessing as mp
+
+import numpy as np
+
+
+def memory_kb() -> dict:
+    usage = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss"):
+                usage[key] = int(value.split()[0])
+    return usage
+
+
+def worker(artifact_dir: str, copy: bool, loaded: mp.Barrier, measured: mp.Barrier, results: mp.Queue) -> None:
+    from catalog import FoodCatalog
+
+    before = memory_kb()
+    catalog = FoodCatalog.load(artifact_dir)
+    arrays = [np.array(a) if copy else a for a in catalog.arrays().values()]
+    checksum = sum(float(np.asarray(a, dtype=np.float64).sum()) for a in arrays)
+    loaded.wait()
+    after = memory_kb()
+    results.put({key: after[key] - before[key] for key in after} | {"checksum": checksum})
+    measured.wait()
+
+
+def run(workers: int, artifact_dir: str, copy: bool) -> list:
+    ctx = mp.get_context("spawn")
+    loaded, measured, results = ctx.Barrier(workers), ctx.Barrier(workers), ctx.Queue()
+    processes = [
+        ctx.Process(target=worker, args=(artifact_dir, copy, loaded, measured, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    usage = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return usage
+
+
+def main() -> None:
+    from catalog import CATALOG_ARTIFACT_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--artifact-dir", default=CATALOG_ARTIFACT_DIR)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'workers':>8}{'RSS/worker (KiB)':>18}{'PSS/worker (KiB)':>18}{'PSS total (KiB)':>17}")
+    for mode in ("mmap", "copy"):
+        usage = run(args.workers, args.artifact_dir, copy=mode == "copy")
+        rss = sum(u["Rss"] for u in usage) / len(usage)
+        pss = sum(u["Pss"] for u in usage)
+        print(f"{mode:<8}{args.workers:>8}{rss:>18.0f}{pss / len(usage):>18.0f}{pss:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
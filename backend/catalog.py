@@ -0,0 +1,447 @@
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from itertools import combinations
+from datetime import datetime, timezone
+import numpy as np
+import scipy.sparse as sp
+from decouple import config
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from core.core import SessionLocal
+from Model import FoodBeverages
+from helper import NUTRITION_FEATURES, BASE_NEEDS, age_band_allows
+
+
+# Size of the precomputed per-food neighbour table (0 disables it)
+INGREDIENT_NEIGHBOURS = config("INGREDIENT_NEIGHBOURS", default=0, cast=int)
+
+# Length of the cached candidate list of each three-nutrient combination
+TOP_FOODS_PER_COMBO = config("TOP_FOODS_PER_COMBO", default=100, cast=int)
+
+# Every combination of three nutrients, in the row order of combo_rows
+NUTRIENT_COMBOS = list(combinations(NUTRITION_FEATURES, 3))
+
+# Where built catalog artifacts live; bump ARTIFACT_FORMAT when the layout changes
+CATALOG_ARTIFACT_DIR = config(
+    "CATALOG_ARTIFACT_DIR",
+    default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "artifacts"),
+)
+ARTIFACT_FORMAT = 5
+
+CATALOG_CHECKSUM_SQL = text("""
+    SELECT md5(coalesce(string_agg(
+        concat_ws('|', f_id, f_name, category, calcium, carbohydrate, energy, fat, iron, protein,
+                  array_to_string(i_ids, ';'), array_to_string(i_names, ';')),
+        ',' ORDER BY f_id
+    ), ''))
+    FROM food_beverages
+""")
+
+
+# ======================
+# Food Catalog
+# ======================
+
+def ingredient_document(i_names) -> str:
+    """Turn a food's normalised ingredient names into one TF-IDF document"""
+    return " ".join(name.replace(";", " ").replace("_", " ") for name in i_names or [])
+
+
+class FoodRecords:
+    """Read-only sequence of food records, decoded on access from a memory-mapped JSON-lines file"""
+
+    def __init__(self, path: str, offsets: np.ndarray):
+        self.offsets = offsets
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if len(offsets) > 1 else b""
+
+    @staticmethod
+    def write(path: str, foods: list) -> np.ndarray:
+        """Write records as JSON lines and return the byte offset of each one"""
+        offsets = [0]
+        with open(path, "wb") as f:
+            for food in foods:
+                offsets.append(offsets[-1] + f.write(json.dumps(food).encode() + b"\n"))
+        return np.array(offsets, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> dict:
+        row = int(row)
+        return json.loads(self.buffer[self.offsets[row]:self.offsets[row + 1]])
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+
+class FoodCatalog:
+    """Food catalog held in process as a (foods x NUTRITION_FEATURES) float32 matrix"""
+
+    def __init__(self, food_ids, nutrients, foods, ingredient_vectors=None,
+                 vocabulary: dict | None = None, idf=None, checksum: str | None = None):
+        self.checksum = checksum
+        self.vocabulary = vocabulary
+        self.idf = idf
+        # Sorted, so id -> row lookups are a binary search over the (shared) array
+        self.food_ids = np.asarray(food_ids, dtype=np.int64)
+        self.nutrients = np.ascontiguousarray(nutrients, dtype=np.float32)
+        self.foods = foods
+        self.feature_index = {nutrient: col for col, nutrient in enumerate(NUTRITION_FEATURES)}
+        # Sparse TF-IDF rows aligned with food_ids (L2-normalised, so dot product = cosine)
+        self.ingredient_vectors = ingredient_vectors
+        self.neighbour_rows = None
+        self.neighbour_scores = None
+        # Rows by descending amount, one column per nutrient
+        self.nutrient_order = None
+        # Cached top rows of each NUTRIENT_COMBOS entry
+        self.combo_rows = None
+        # Sorted ingredient ids, and per ingredient a bit-packed mask of the foods containing it
+        self.ingredient_ids = None
+        self.ingredient_bitmap = None
+        # WWEIA category per row (-1 when unknown), and per age band of BASE_NEEDS the rows suitable for it
+        self.categories = None
+        self.age_masks = None
+
+    def __len__(self) -> int:
+        return len(self.food_ids)
+
+    @classmethod
+    def from_db(cls, db: Session, checksum: str | None = None) -> "FoodCatalog":
+        rows = db.scalars(select(FoodBeverages).order_by(FoodBeverages.f_id)).all()
+        foods = [
+            {
+                "f_id": r.f_id,
+                "f_name": r.f_name,
+                "category": r.category,
+                "i_ids": r.i_ids,
+                "i_names": r.i_names,
+                **{nutrisi: getattr(r, nutrisi) for nutrisi in NUTRITION_FEATURES},
+            }
+            for r in rows
+        ]
+        nutrients = np.array(
+            [[food[nutrisi] or 0 for nutrisi in NUTRITION_FEATURES] for food in foods],
+            dtype=np.float32,
+        ).reshape(len(foods), len(NUTRITION_FEATURES))
+        # scikit-learn is only needed to build, not to load an artifact
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(dtype=np.float32)
+        ingredient_vectors = vectorizer.fit_transform([ingredient_document(food["i_names"]) for food in foods])
+        catalog = cls(
+            [food["f_id"] for food in foods], nutrients, foods, ingredient_vectors.tocsr(),
+            vocabulary={term: int(col) for term, col in vectorizer.vocabulary_.items()},
+            idf=vectorizer.idf_.astype(np.float32),
+            checksum=checksum,
+        )
+        catalog.build_ingredient_bitmap()
+        catalog.build_age_masks()
+        return catalog
+
+    @property
+    def neighbour_count(self) -> int:
+        return 0 if self.neighbour_rows is None else self.neighbour_rows.shape[1]
+
+    @property
+    def combo_size(self) -> int:
+        return 0 if self.combo_rows is None else self.combo_rows.shape[1]
+
+    def arrays(self) -> dict:
+        """Every numeric array of the catalog, sparse vectors split into CSR components"""
+        arrays = {
+            "food_ids": self.food_ids,
+            "nutrients": self.nutrients,
+            "idf": self.idf,
+            "ingredients_data": self.ingredient_vectors.data,
+            "ingredients_indices": self.ingredient_vectors.indices,
+            "ingredients_indptr": self.ingredient_vectors.indptr,
+            "ingredient_ids": self.ingredient_ids,
+            "ingredient_bitmap": self.ingredient_bitmap,
+            "categories": self.categories,
+            "age_masks": self.age_masks,
+        }
+        if self.neighbour_rows is not None:
+            arrays["neighbour_rows"] = self.neighbour_rows
+            arrays["neighbour_scores"] = self.neighbour_scores
+        if self.nutrient_order is not None:
+            arrays["nutrient_order"] = self.nutrient_order
+            arrays["combo_rows"] = self.combo_rows
+        return arrays
+
+    def save(self, artifact_dir: str = CATALOG_ARTIFACT_DIR) -> str:
+        """Write the catalog as a versioned artifact and point CURRENT at it"""
+        os.makedirs(artifact_dir, exist_ok=True)
+        version = f"catalog-v{ARTIFACT_FORMAT}-{self.checksum}-n{self.neighbour_count}-t{self.combo_size}"
+        target = os.path.join(artifact_dir, version)
+        if not os.path.isdir(target):
+            staging = tempfile.mkdtemp(prefix=".build-", dir=artifact_dir)
+            arrays = self.arrays()
+            arrays["food_offsets"] = FoodRecords.write(os.path.join(staging, "foods.jsonl"), self.foods)
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(array))
+            with open(os.path.join(staging, "vocabulary.json"), "w") as f:
+                json.dump(self.vocabulary, f)
+            with open(os.path.join(staging, "manifest.json"), "w") as f:
+                json.dump({
+                    "format": ARTIFACT_FORMAT,
+                    "checksum": self.checksum,
+                    "foods": len(self),
+                    "features": NUTRITION_FEATURES,
+                    "arrays": list(arrays),
+                    "ingredients_shape": list(self.ingredient_vectors.shape),
+                    "neighbours": self.neighbour_count,
+                    "combos": [list(combo) for combo in NUTRIENT_COMBOS],
+                    "age_bands": list(BASE_NEEDS),
+                    "built_at": datetime.now(timezone.utc).isoformat(),
+                }, f)
+            os.chmod(staging, 0o755)
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another worker published the same version first
+                shutil.rmtree(staging, ignore_errors=True)
+
+        pointer = os.path.join(artifact_dir, f".CURRENT-{os.getpid()}")
+        with open(pointer, "w") as f:
+            f.write(version)
+        os.replace(pointer, os.path.join(artifact_dir, "CURRENT"))
+        return target
+
+    @classmethod
+    def load(cls, artifact_dir: str = CATALOG_ARTIFACT_DIR) -> "FoodCatalog | None":
+        """Memory-map the artifact CURRENT points at, or None if there is no usable one
+
+        Arrays are opened read-only with mmap, so every worker shares the same
+        physical pages through the page cache instead of holding its own copy.
+        """
+        try:
+            with open(os.path.join(artifact_dir, "CURRENT")) as f:
+                path = os.path.join(artifact_dir, f.read().strip())
+            with open(os.path.join(path, "manifest.json")) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            manifest.get("format") != ARTIFACT_FORMAT
+            or manifest.get("features") != NUTRITION_FEATURES
+            or manifest.get("age_bands") != list(BASE_NEEDS)
+        ):
+            return None
+
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in manifest["arrays"]
+        }
+        foods = FoodRecords(os.path.join(path, "foods.jsonl"), arrays.pop("food_offsets"))
+        with open(os.path.join(path, "vocabulary.json")) as f:
+            vocabulary = json.load(f)
+
+        catalog = cls(
+            arrays["food_ids"],
+            arrays["nutrients"],
+            foods,
+            sp.csr_matrix(
+                (arrays["ingredients_data"], arrays["ingredients_indices"], arrays["ingredients_indptr"]),
+                shape=tuple(manifest["ingredients_shape"]),
+                copy=False,
+            ),
+            vocabulary=vocabulary,
+            idf=arrays["idf"],
+            checksum=manifest["checksum"],
+        )
+        catalog.ingredient_ids = arrays["ingredient_ids"]
+        catalog.ingredient_bitmap = arrays["ingredient_bitmap"]
+        catalog.categories = arrays["categories"]
+        catalog.age_masks = arrays["age_masks"]
+        catalog.neighbour_rows = arrays.get("neighbour_rows")
+        catalog.neighbour_scores = arrays.get("neighbour_scores")
+        if manifest.get("combos") == [list(combo) for combo in NUTRIENT_COMBOS]:
+            catalog.nutrient_order = arrays.get("nutrient_order")
+            catalog.combo_rows = arrays.get("combo_rows")
+        return catalog
+
+    def row(self, f_id: int) -> int | None:
+        """Row number of a food id, or None if it is not in the catalog"""
+        row = int(np.searchsorted(self.food_ids, f_id))
+        return row if row < len(self) and self.food_ids[row] == f_id else None
+
+    def rows_for(self, f_ids) -> np.ndarray:
+        """Row numbers of the given food ids, skipping ids not in the catalog"""
+        f_ids = np.asarray(f_ids, dtype=np.int64).ravel()
+        rows = np.minimum(np.searchsorted(self.food_ids, f_ids), max(len(self) - 1, 0))
+        return rows[self.food_ids[rows] == f_ids] if len(self) else rows[:0]
+
+    def mask_for(self, f_ids) -> np.ndarray:
+        """Boolean row mask that is True for the given food ids"""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.rows_for(f_ids)] = True
+        return mask
+
+    def build_ingredient_bitmap(self) -> None:
+        """Pack a food x ingredient membership matrix, one row of food bits per ingredient"""
+        pairs = [(row, i_id) for row, food in enumerate(self.foods) for i_id in food["i_ids"] or []]
+        food_rows = np.array([row for row, _ in pairs], dtype=np.int64)
+        i_ids = np.array([i_id for _, i_id in pairs], dtype=np.int64)
+        self.ingredient_ids = np.unique(i_ids)
+        membership = np.zeros((len(self.ingredient_ids), len(self)), dtype=bool)
+        membership[np.searchsorted(self.ingredient_ids, i_ids), food_rows] = True
+        self.ingredient_bitmap = np.packbits(membership, axis=1, bitorder="little")
+
+    def ingredient_mask(self, i_ids) -> np.ndarray:
+        """Boolean row mask that is True for foods containing any of the given ingredients"""
+        i_ids = np.asarray(i_ids, dtype=np.int64).ravel()
+        if len(i_ids) == 0 or len(self.ingredient_ids) == 0:
+            return np.zeros(len(self), dtype=bool)
+        rows = np.minimum(np.searchsorted(self.ingredient_ids, i_ids), len(self.ingredient_ids) - 1)
+        rows = rows[self.ingredient_ids[rows] == i_ids]
+        packed = np.bitwise_or.reduce(self.ingredient_bitmap[rows], axis=0)
+        return np.unpackbits(packed, count=len(self), bitorder="little").astype(bool)
+
+    def build_age_masks(self) -> None:
+        """Precompute, per age band, which foods suit it from their WWEIA category"""
+        self.categories = np.array(
+            [-1 if food["category"] is None else food["category"] for food in self.foods], dtype=np.int32
+        )
+        masks = np.zeros((len(BASE_NEEDS), len(self)), dtype=bool)
+        codes = np.unique(self.categories)
+        for i, band in enumerate(BASE_NEEDS):
+            allowed = [code for code in codes if age_band_allows(band, None if code < 0 else int(code))]
+            masks[i] = np.isin(self.categories, allowed)
+        self.age_masks = masks
+
+    def age_mask(self, band: str) -> np.ndarray:
+        """Boolean row mask of the foods suitable for an age band"""
+        return self.age_masks[list(BASE_NEEDS).index(band)]
+
+    def columns_for(self, nutrients) -> np.ndarray:
+        return np.array([self.feature_index[nutrient] for nutrient in nutrients], dtype=np.int64)
+
+    def ingredient_similarity(self, history_rows: np.ndarray, candidate_rows: np.ndarray | None = None) -> np.ndarray:
+        """Mean cosine similarity of each candidate (every food by default) to the history foods
+
+        The mean of the dot products equals the dot product with the mean
+        history vector, so this is one sparse matrix-vector product.
+        """
+        vectors = self.ingredient_vectors if candidate_rows is None else self.ingredient_vectors[candidate_rows]
+        if len(history_rows) == 0 or vectors.shape[0] == 0:
+            return np.zeros(vectors.shape[0])
+        profile = np.asarray(self.ingredient_vectors[history_rows].sum(axis=0)).ravel() / len(history_rows)
+        return vectors @ profile
+
+    def build_neighbours(self, top_n: int, chunk_size: int = 1024) -> None:
+        """Precompute the top_n most similar foods of every food"""
+        top_n = min(top_n, len(self) - 1)
+        rows = np.empty((len(self), top_n), dtype=np.int32)
+        scores = np.empty((len(self), top_n), dtype=np.float32)
+        vectors_t = self.ingredient_vectors.T.tocsc()
+        for start in range(0, len(self), chunk_size):
+            stop = min(start + chunk_size, len(self))
+            block = (self.ingredient_vectors[start:stop] @ vectors_t).toarray()
+            block[np.arange(stop - start), np.arange(start, stop)] = -1.0
+            top = np.argpartition(-block, top_n - 1, axis=1)[:, :top_n]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            rows[start:stop] = np.take_along_axis(top, order, axis=1)
+            scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+        self.neighbour_rows = rows
+        self.neighbour_scores = scores
+
+    def build_rankings(self, top_n: int) -> None:
+        """Sort the foods by every nutrient and cache the top_n of each three-nutrient combination
+
+        A combination ranks foods by the sum of its nutrients, each scaled by
+        the largest amount in the catalog so no unit dominates.
+        """
+        top_n = min(top_n, len(self))
+        self.nutrient_order = np.argsort(-self.nutrients, axis=0, kind="stable").astype(np.int32)
+        scaled = self.nutrients / np.maximum(self.nutrients.max(axis=0, initial=0), 1e-8)
+        rows = np.empty((len(NUTRIENT_COMBOS), top_n), dtype=np.int32)
+        for i, combo in enumerate(NUTRIENT_COMBOS):
+            totals = scaled[:, self.columns_for(combo)].sum(axis=1)
+            top = np.argpartition(-totals, top_n - 1)[:top_n] if top_n < len(self) else np.arange(len(self))
+            rows[i] = top[np.argsort(-totals[top], kind="stable")]
+        self.combo_rows = rows
+
+    def combo_candidates(self, nutrients) -> np.ndarray:
+        """Cached top rows for a three-nutrient combination, empty for any other set"""
+        key = tuple(sorted(nutrients, key=NUTRITION_FEATURES.index))
+        if self.combo_rows is None or key not in NUTRIENT_COMBOS:
+            return np.empty(0, dtype=np.int32)
+        return self.combo_rows[NUTRIENT_COMBOS.index(key)]
+
+    def top_foods(self, nutrient: str, k: int = 20) -> list:
+        """Foods with the most of one nutrient, read from the ranked index"""
+        col = self.feature_index[nutrient]
+        if self.nutrient_order is not None:
+            rows = self.nutrient_order[:k, col]
+        else:
+            rows = np.argsort(-self.nutrients[:, col], kind="stable")[:k]
+        return [self.foods[row] for row in rows]
+
+    def similar_foods(self, f_id: int, k: int = 10) -> list:
+        """Foods with the most similar ingredients, from the neighbour table when built"""
+        row = self.row(f_id)
+        if self.neighbour_rows is not None and k <= self.neighbour_rows.shape[1]:
+            rows, scores = self.neighbour_rows[row, :k], self.neighbour_scores[row, :k]
+        else:
+            sims = (self.ingredient_vectors @ self.ingredient_vectors[row].T).toarray().ravel()
+            sims[row] = -1.0
+            k = min(k, len(self) - 1)
+            rows = np.argpartition(-sims, k - 1)[:k]
+            rows = rows[np.argsort(-sims[rows], kind="stable")]
+            scores = sims[rows]
+        return [{**self.foods[r], "similarity": float(score)} for r, score in zip(rows, scores)]
+
+
+def catalog_checksum(db: Session) -> str:
+    """Fingerprint of everything the catalog is built from"""
+    return db.execute(CATALOG_CHECKSUM_SQL).scalar_one()
+
+
+def build_catalog(
+    db: Session,
+    artifact_dir: str = CATALOG_ARTIFACT_DIR,
+    force: bool = False,
+    neighbours: int = INGREDIENT_NEIGHBOURS,
+    top_per_combo: int = TOP_FOODS_PER_COMBO
+) -> FoodCatalog:
+    """Load the stored artifact, rebuilding it only when the catalog checksum changed"""
+    checksum = catalog_checksum(db)
+    catalog = None if force else FoodCatalog.load(artifact_dir)
+    if (
+        catalog is None
+        or catalog.checksum != checksum
+        or catalog.neighbour_count != min(neighbours, len(catalog) - 1)
+        or catalog.combo_size != min(top_per_combo, len(catalog))
+    ):
+        built = FoodCatalog.from_db(db, checksum)
+        if neighbours:
+            built.build_neighbours(neighbours)
+        if top_per_combo:
+            built.build_rankings(top_per_combo)
+        built.save(artifact_dir)
+        # Serve from the mapped files so this worker shares pages with the others
+        catalog = FoodCatalog.load(artifact_dir) or built
+    return catalog
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> FoodCatalog:
+    """Return the process-wide food catalog, loading it on first use"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                with SessionLocal() as db:
+                    _catalog = build_catalog(db)
+    return _catalog
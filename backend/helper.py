@@ -1,10 +1,21 @@
 from core.core import pwd_context, SECRET_KEY, ALGORITHM
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hmac
+import os
 import jwt
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from Model import Ingredients
-from core.core import db
+from decouple import config
+from dateutil.relativedelta import relativedelta
+from zscore import get_zscore_engine
+
+
+# Threads available for bcrypt work; 0 runs it inline on the calling thread
+PASSWORD_HASH_WORKERS = config("PASSWORD_HASH_WORKERS", default=min(4, os.cpu_count() or 1), cast=int)
+_password_executor = (
+    ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+    if PASSWORD_HASH_WORKERS > 0 else None
+)
 
 
 # ======================
@@ -17,9 +28,32 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hashed password"""
-    if plain_password == hashed_password:
-        hashed_password = get_password_hash(plain_password)
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_and_update_password(plain_password, hashed_password)[0]
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password and return a replacement hash when the stored one is outdated
+
+    Passwords stored in plain text (older accounts) are compared directly and
+    always come back with a bcrypt hash to store instead.
+    """
+    if not pwd_context.identify(hashed_password):
+        if hmac.compare_digest(plain_password.encode(), (hashed_password or "").strip().encode()):
+            return True, pwd_context.hash(plain_password)
+        return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+async def _run_password_work(func, *args):
+    if _password_executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the bcrypt thread pool"""
+    return await _run_password_work(get_password_hash, password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """verify_and_update_password on the bcrypt thread pool"""
+    return await _run_password_work(verify_and_update_password, plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create JWT token with expiration"""
@@ -82,109 +116,128 @@ NUTRITION_RULES = {
 
 def load_who_zscores(age_months: int, gender: str, height_cm: float) -> dict:
     """Load WHO z-scores based on age and gender"""
-    if age_months <= 24:
-        file_path = "data/wfl_boys_0-to-2-years_zscores.xlsx" if gender.lower() == 'l' else 'data/wfl_girls_0-to-2-years_zscores.xlsx'
-        height_col = 'Length'
-    else:
-        file_path = 'data/wfh_boys_2-to-5-years_zscores.xlsx' if gender.lower() == 'l' else 'data/wfh_girls_2-to-5-years_zscores.xlsx'
-        height_col = 'Height'
-
     try:
-        df = pd.read_excel(file_path)
-        df['diff'] = abs(df[height_col] - height_cm)
-        closest_row = df.loc[df['diff'].idxmin()]
-        
-        return {
-            'SD-3': closest_row['SD2neg'],
-            'SD-2': closest_row['SD2neg'],
-            'SD-1': closest_row['SD1neg'],
-            'Median': closest_row['SD0'],
-            'SD+1': closest_row['SD1'],
-            'SD+2': closest_row['SD2'],
-            'SD+3': closest_row['SD3']
-        }
+        return get_zscore_engine().lookup(age_months, gender, height_cm)
     except Exception as e:
         raise ValueError(f"Error processing WHO data: {str(e)}")
 
 def calculate_nutrition_status(age_months: int, gender: str, height_cm: float, weight_kg: float) -> str:
     """Calculate nutrition status based on WHO standards"""
-    z_scores = load_who_zscores(age_months, gender, height_cm)
-    
-    if weight_kg < z_scores['SD-3']:
-        return "severely low"
-    elif weight_kg < z_scores['SD-2']:
-        return "low"
-    elif weight_kg <= z_scores['SD+1']:
-        return "good"
-    elif weight_kg <= z_scores['SD+2']:
-        return "possible risk of excessive"
-    elif weight_kg <= z_scores['SD+3']:
-        return "excessive"
-    return "obese"
+    return get_zscore_engine().classify(age_months, gender, height_cm, weight_kg)
 
-def calculate_minimum_nutrition(age_months: int, status: str) -> dict:
-    """Calculate daily nutritional needs based on age and status"""
-    base_needs = {
-        "0-5": {
-            "calcium": 200,  # mg
-            "carbohydrate": 59,  # g
-            "energy": 550,  # kcal
-            "iron": 0.3,  # mg
-            "protein": 9,  # g
-            "fat": 31  # g
-        },
-        "6-11": {
-            "calcium": 270,
-            "carbohydrate": 105,
-            "energy": 800,
-            "iron": 11,
-            "protein": 15,
-            "fat": 35
-        },
-        "12-36": {
-            "calcium": 650,
-            "carbohydrate": 215,
-            "energy": 1350,
-            "iron": 7,
-            "protein": 20,
-            "fat": 45
-        },
-        "37-60": {
-            "calcium": 1000,
-            "carbohydrate": 220,
-            "energy": 1400,
-            "iron": 10,
-            "protein": 25,
-            "fat": 50
-        }
+def calculate_nutrition_status_batch(ages_months, genders, heights_cm, weights_kg):
+    """Calculate nutrition status for many children in one vectorized call"""
+    return get_zscore_engine().classify_batch(ages_months, genders, heights_cm, weights_kg)
+
+# Daily needs per age band (months), before the nutrition status adjustment
+BASE_NEEDS = {
+    "0-5": {
+        "calcium": 200,  # mg
+        "carbohydrate": 59,  # g
+        "energy": 550,  # kcal
+        "iron": 0.3,  # mg
+        "protein": 9,  # g
+        "fat": 31  # g
+    },
+    "6-11": {
+        "calcium": 270,
+        "carbohydrate": 105,
+        "energy": 800,
+        "iron": 11,
+        "protein": 15,
+        "fat": 35
+    },
+    "12-36": {
+        "calcium": 650,
+        "carbohydrate": 215,
+        "energy": 1350,
+        "iron": 7,
+        "protein": 20,
+        "fat": 45
+    },
+    "37-60": {
+        "calcium": 1000,
+        "carbohydrate": 220,
+        "energy": 1400,
+        "iron": 10,
+        "protein": 25,
+        "fat": 50
     }
-    
-    # Select age group
+}
+
+def age_band(age_months: int) -> str:
+    """Age band of BASE_NEEDS a child falls in"""
     if age_months < 6:
-        needs = base_needs["0-5"].copy()
+        return "0-5"
     elif age_months < 12:
-        needs = base_needs["6-11"].copy()
+        return "6-11"
     elif age_months < 37:
-        needs = base_needs["12-36"].copy()
-    else:
-        needs = base_needs["37-60"].copy()
-    
+        return "12-36"
+    return "37-60"
+
+# WWEIA categories (foods.category_code) grouped for the age band rules below
+INFANT_MILK = {9402, 9404, 9602}  # formula and human milk
+BABY_FOODS = {9002, 9004, 9006, 9007, 9008, 9010, 9012, 9204}  # excludes baby juice (9202)
+FIRST_FOODS = {
+    1820, 1822,  # yogurt
+    2502,  # eggs
+    2802,  # beans, peas, legumes
+    4002, 4004, 4802, 4804,  # rice, pasta and cooked cereals
+    6002, 6004, 6006, 6008, 6009, 6011, 6014, 6018, 6020, 6022, 6024,  # fruit
+    6402, 6404, 6406, 6407, 6409, 6411, 6412, 6413, 6416, 6418, 6420,  # vegetables
+    6802, 6806,  # boiled and mashed potatoes
+}
+
+# Categories suitable for each age band of BASE_NEEDS: the band's "only" set
+# when it has one, otherwise every category not in its "except" set.
+# Foods without a category are only offered where there is no "only" set.
+AGE_BAND_CATEGORIES = {
+    "0-5": {"only": INFANT_MILK},
+    "6-11": {"only": INFANT_MILK | BABY_FOODS | FIRST_FOODS},
+    "12-36": {"except": {9402, 9404, 9204}},
+    "37-60": {"except": INFANT_MILK | BABY_FOODS | {9202}},
+}
+
+def age_band_allows(band: str, category: int | None) -> bool:
+    """Whether foods of a WWEIA category are suitable for an age band"""
+    rule = AGE_BAND_CATEGORIES[band]
+    if "only" in rule:
+        return category in rule["only"]
+    return category not in rule["except"]
+
+def age_in_months(date_of_birth, on=None) -> int:
+    """Whole months between a date of birth and a day (today by default)"""
+    delta = relativedelta(on or datetime.now().date(), date_of_birth)
+    return delta.years * 12 + delta.months
+
+def _minimum_nutrition(band: str, status: str) -> dict:
+    needs = BASE_NEEDS[band].copy()
+
     # Apply status adjustments
     status_rules = NUTRITION_RULES[status]
     for nutrient in needs:
         adjustment = status_rules["faktor"].get(nutrient, status_rules["faktor"]["default"])
         needs[nutrient] *= adjustment
-    
+
     return needs
 
-NUTRITION_FEATURES = ["calcium", "carbohydrate", "energy", "iron", "protein", "fat"]
-nutrition_mapping = {"calcium": 1, "carbohydrate": 2, "energy": 3, "iron": 4, "protein": 5, "fat": 6}
+# Needs depend only on the age band and status, so every combination is
+# computed once: (age band, nutrition status) -> {nutrient: value}
+MINIMUM_NEEDS = {
+    (band, status): _minimum_nutrition(band, status)
+    for band in BASE_NEEDS
+    for status in NUTRITION_RULES
+}
 
-vectorizer = TfidfVectorizer()
-ingredients = db.query(Ingredients).all()
-ingredients_name = [ingredient.name for ingredient in ingredients]
-ingredients_id = [ingredient.id for ingredient in ingredients]
+def calculate_minimum_nutrition(age_months: int, status: str) -> dict:
+    """Calculate daily nutritional needs based on age and status"""
+    return MINIMUM_NEEDS[(age_band(age_months), status)].copy()
 
-INGREDIENT_VECTORIZED = vectorizer.fit_transform(ingredients_name)
+def resolve_minimum_nutrition(age_months: int, status: str, overrides: dict | None = None) -> dict:
+    """Daily needs from the precomputed table, with any clinician overrides applied"""
+    needs = calculate_minimum_nutrition(age_months, status) if status in NUTRITION_RULES else {}
+    needs.update(overrides or {})
+    return needs
 
-id_to_index = {id_: idx for idx, id_ in enumerate(ingredients_id)}
\ No newline at end of file
+NUTRITION_FEATURES = ["calcium", "carbohydrate", "energy", "iron", "protein", "fat"]
+nutrition_mapping = {"calcium": 1, "carbohydrate": 2, "energy": 3, "iron": 4, "protein": 5, "fat": 6}
@@ -0,0 +1,149 @@
+from datetime import date
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy import Date, Integer, cast, delete, select, func, and_, literal
+from sqlalchemy.dialects.postgresql import array, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.core import get_db
+from Model import User, Nutritions, UserMinNutritions, FoodHistories, FoodNutritions, UserDailyIntake
+from helper import NUTRITION_FEATURES, nutrition_mapping, resolve_minimum_nutrition, age_in_months
+from auth import Principal, get_current_user
+
+
+# ======================
+# Daily Intake Rollup
+# ======================
+
+ROLLUP_COLUMNS = [*NUTRITION_FEATURES, "food_count"]
+
+
+def _nutrient_sums() -> list:
+    """One summed column per nutrient over joined food_nutritions rows"""
+    return [
+        func.coalesce(func.sum(FoodNutritions.value).filter(FoodNutritions.n_id == nutrition_mapping[nutrisi]), 0)
+        for nutrisi in NUTRITION_FEATURES
+    ]
+
+
+async def add_daily_intake(db: AsyncSession, user_id: int, day: date, f_ids: list) -> None:
+    """Add newly eaten foods to the user's row for the day, in the caller's transaction"""
+    if not f_ids:
+        return
+    posted = func.unnest(array(f_ids, type_=Integer)).table_valued("f_id").render_derived()
+    # Each posted food joins one row per nutrient, so the food count is
+    # taken from the request rather than count(*)
+    totals = (
+        select(literal(user_id), literal(day, Date), *_nutrient_sums(), literal(len(f_ids)))
+        .select_from(posted.outerjoin(FoodNutritions, FoodNutritions.f_id == posted.c.f_id))
+    )
+    stmt = insert(UserDailyIntake).from_select(["u_id", "date", *ROLLUP_COLUMNS], totals)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserDailyIntake.u_id, UserDailyIntake.date],
+        set_={column: getattr(UserDailyIntake, column) + getattr(stmt.excluded, column) for column in ROLLUP_COLUMNS},
+    )
+    await db.execute(stmt)
+
+
+def rebuild_daily_intake(
+    db: Session,
+    user_id: int | None = None,
+    since: date | None = None,
+    until: date | None = None
+) -> int:
+    """Recompute rollup rows from food_histories, optionally for one user or a range of days
+
+    Days older than the oldest remaining history row (archived months) are
+    left alone, since their detail is no longer in the database.
+    """
+    history_day = cast(FoodHistories.date, Date)
+    conditions = []
+    if user_id is not None:
+        conditions.append(FoodHistories.u_id == user_id)
+    if since is not None:
+        conditions.append(history_day >= since)
+    if until is not None:
+        conditions.append(history_day < until)
+
+    oldest_history = select(func.min(history_day)).scalar_subquery()
+    stale = delete(UserDailyIntake).where(UserDailyIntake.date >= oldest_history)
+    if user_id is not None:
+        stale = stale.where(UserDailyIntake.u_id == user_id)
+    if since is not None:
+        stale = stale.where(UserDailyIntake.date >= since)
+    if until is not None:
+        stale = stale.where(UserDailyIntake.date < until)
+    db.execute(stale)
+
+    totals = (
+        select(
+            FoodHistories.u_id,
+            history_day,
+            *_nutrient_sums(),
+            func.count(FoodHistories.id.distinct()),
+        )
+        .outerjoin(FoodNutritions, FoodNutritions.f_id == FoodHistories.f_id)
+        .where(*conditions)
+        .group_by(FoodHistories.u_id, history_day)
+    )
+    result = db.execute(insert(UserDailyIntake).from_select(["u_id", "date", *ROLLUP_COLUMNS], totals))
+    db.commit()
+    return result.rowcount
+
+
+# ======================
+# Intake Summary
+# ======================
+
+def intake_summary_query(user_id: int, day: date):
+    """Each nutrient with the user's need override, if any, and the day's rollup totals"""
+    return (
+        select(Nutritions.name, UserMinNutritions.value, *[getattr(UserDailyIntake, n) for n in NUTRITION_FEATURES])
+        .outerjoin(UserMinNutritions, and_(
+            UserMinNutritions.n_id == Nutritions.id,
+            UserMinNutritions.u_id == user_id,
+            UserMinNutritions.source == "clinician"
+        ))
+        .outerjoin(UserDailyIntake, and_(
+            UserDailyIntake.u_id == user_id,
+            UserDailyIntake.date == day
+        ))
+    )
+
+def summarize_intake(needs: dict, consumed: dict) -> dict:
+    """Consumed totals, needs, residue and deficiency percent from a day's needs and totals"""
+    summary = {"consumed": {}, "needs": {}, "residue": {}, "deficiency_percent": {}}
+    for nutrisi in NUTRITION_FEATURES:
+        need, total = needs.get(nutrisi, 0), consumed.get(nutrisi) or 0
+        residue = max(0, need - total)
+        summary["consumed"][nutrisi] = total
+        summary["needs"][nutrisi] = need
+        summary["residue"][nutrisi] = residue
+        summary["deficiency_percent"][nutrisi] = round((residue / need) * 100, 2) if need > 0 else 0.0
+    return summary
+
+async def get_intake_summary(db: AsyncSession, user: Principal, day: date | None = None) -> dict:
+    """Intake summary for one user and day from a single query"""
+    day = day or date.today()
+    rows = (await db.execute(intake_summary_query(user.id, day))).all()
+    overrides = {row[0].lower(): row[1] for row in rows if row[1] is not None}
+    needs = resolve_minimum_nutrition(age_in_months(user.date_of_birth, day), user.nutrition_status, overrides)
+    consumed = dict(zip(NUTRITION_FEATURES, rows[0][2:])) if rows else {}
+    return summarize_intake(needs, consumed)
+
+async def get_intake_versions(db: AsyncSession, user_id: int, day: date) -> tuple:
+    """The user's food count for a day and preferences version, from two primary-key probes in one query"""
+    row = (await db.execute(
+        select(func.coalesce(UserDailyIntake.food_count, 0), User.preferences_version)
+        .outerjoin(UserDailyIntake, and_(UserDailyIntake.u_id == User.id, UserDailyIntake.date == day))
+        .where(User.id == user_id)
+    )).first()
+    return tuple(row) if row else (0, 1)
+
+async def get_current_intake(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> dict:
+    """Today's intake summary for the current user, computed once per request"""
+    return await get_intake_summary(db, current_user)
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+from decouple import config
+
+from catalog import FoodCatalog, get_catalog
+
+
+# How long clients may reuse a /foods response before revalidating it
+FOODS_CACHE_MAX_AGE = config("FOODS_CACHE_MAX_AGE", default=300, cast=int)
+# Encoded pages kept per catalog version
+FOODS_CACHED_PAGES = config("FOODS_CACHED_PAGES", default=128, cast=int)
+
+# Public name of each field and the catalog record key it is read from
+FOOD_FIELDS = {
+    "id": "f_id",
+    "name": "f_name",
+    "calcium": "calcium",
+    "carbohydrate": "carbohydrate",
+    "energy": "energy",
+    "fat": "fat",
+    "iron": "iron",
+    "protein": "protein",
+}
+
+
+# ======================
+# Food Listing
+# ======================
+
+class FoodPage(NamedTuple):
+    body: bytes
+    etag: str
+    next_cursor: int | None
+
+
+def parse_fields(fields: str | None) -> tuple:
+    """Validate a comma separated field list, defaulting to every field"""
+    if not fields:
+        return tuple(FOOD_FIELDS)
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in FOOD_FIELDS]
+    if unknown or not names:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested")
+    return names
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+class FoodListing:
+    """JSON-encoded /foods pages for one catalog version, encoded once and reused"""
+
+    def __init__(self, catalog: FoodCatalog, max_pages: int = FOODS_CACHED_PAGES):
+        self.catalog = catalog
+        self.version = catalog.checksum
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+
+    def etag(self, fields: tuple, cursor: int | None, limit: int | None) -> str:
+        """ETag of a page, derived from the catalog version without encoding the page"""
+        key = f"{','.join(fields)}|{cursor}|{limit}".encode()
+        return f'"{self.version}-{hashlib.md5(key).hexdigest()[:12]}"'
+
+    def _bounds(self, cursor: int | None, limit: int | None) -> tuple:
+        # Keyset pagination: the cursor is the last food id the client has seen
+        start = 0 if cursor is None else int(np.searchsorted(self.catalog.food_ids, cursor, side="right"))
+        stop = len(self.catalog) if limit is None else min(start + limit, len(self.catalog))
+        return start, stop
+
+    def page(self, fields: tuple, cursor: int | None = None, limit: int | None = None) -> FoodPage:
+        key = (fields, cursor, limit)
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                return page
+
+        start, stop = self._bounds(cursor, limit)
+        columns = [(name, FOOD_FIELDS[name]) for name in fields]
+        records = [
+            {name: food[column] for name, column in columns}
+            for food in (self.catalog.foods[row] for row in range(start, stop))
+        ]
+        next_cursor = int(self.catalog.food_ids[stop - 1]) if stop < len(self.catalog) and stop > start else None
+        page = FoodPage(
+            json.dumps(records, separators=(",", ":")).encode(),
+            self.etag(fields, cursor, limit),
+            next_cursor,
+        )
+
+        with self._lock:
+            self._pages[key] = page
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+
+
+_listing = None
+_listing_lock = threading.Lock()
+
+
+def get_food_listing() -> FoodListing:
+    """Return the listing cache for the current catalog version"""
+    global _listing
+    catalog = get_catalog()
+    if _listing is None or _listing.catalog is not catalog:
+        with _listing_lock:
+            if _listing is None or _listing.catalog is not catalog:
+                _listing = FoodListing(catalog)
+    return _listing
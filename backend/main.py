@@ -1,21 +1,36 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field
-from datetime import datetime, timedelta, timezone, date
+from datetime import datetime, timezone, date
 from dateutil.relativedelta import relativedelta
 from typing import Annotated, Literal, List
-from sqlalchemy import desc, func, extract, and_
-import numpy as np
-from sklearn.metrics.pairwise import linear_kernel
+from sqlalchemy import select, delete, func, update, literal_column
+from sqlalchemy.dialects.postgresql import distinct_on, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local imports
-from core.core import ACCESS_TOKEN_EXPIRE_MINUTES, db, app
-from Model import User, UserMinNutritions, Food, Nutritions, FoodHistories, FoodBeverages, UserGrowthRecords
+from core.core import SessionLocal, app, get_db, pool_status
+from Model import (
+    User, UserMinNutritions, Food, FoodHistories, FoodBeverages, UserGrowthRecords,
+    Ingredients, UserIngredientExclusions
+)
 from helper import (
-    get_password_hash, create_access_token, calculate_nutrition_status,
-    calculate_minimum_nutrition, INGREDIENT_VECTORIZED, NUTRITION_FEATURES, id_to_index, nutrition_mapping
+    get_password_hash_async, calculate_nutrition_status,
+    resolve_minimum_nutrition, age_band, age_in_months, nutrition_mapping
 )
-from auth import authenticate_user, get_current_user
+from auth import Principal, authenticate_user, get_current_user, issue_access_token, profile_versions, require_clinic_key
+from intake import add_daily_intake, get_current_intake, get_intake_summary, get_intake_versions
+from catalog import get_catalog
+from recommender import recommend_foods
+from listing import FOODS_CACHE_MAX_AGE, get_food_listing, parse_fields, etag_matches
+from search import get_search_index
+from partitions import ensure_partitions
+from zscore import get_zscore_engine
+from screening import parse_measurements, run_screening, ndjson_lines
+from batch import BATCH_MAX_USERS, run_batch_recommendations
+from rec_cache import recommendation_cache
 
 # ======================
 # Models
@@ -38,6 +53,22 @@ class NutritionUpdateForm(BaseModel):
     height: float
     weight: float
 
+class MinimumNutritionOverrideForm(BaseModel):
+    # A value overrides the computed need, null removes the override
+    calcium: float | None = None
+    carbohydrate: float | None = None
+    energy: float | None = None
+    iron: float | None = None
+    protein: float | None = None
+    fat: float | None = None
+
+class ExclusionsForm(BaseModel):
+    ingredient_ids: List[int] = Field(..., max_length=200)
+
+class BatchRecommendationForm(BaseModel):
+    user_ids: List[int] = Field(..., min_length=1, max_length=BATCH_MAX_USERS)
+    k: int = Field(3, ge=1, le=20)
+
 class FoodHistoriesForm(BaseModel):
     f_id: int
 
@@ -48,30 +79,32 @@ class FoodHistoriesBulkForm(BaseModel):
 # API Endpoints
 # ======================
 
+@app.on_event("startup")
+def load_catalog():
+    get_catalog()
+    get_search_index()
+
+@app.on_event("startup")
+def create_history_partitions():
+    with SessionLocal() as db:
+        ensure_partitions(db)
+
 @app.post("/login", response_model=Token)
-async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> Token:
-    user = await authenticate_user(form_data.username, form_data.password)
+async def login(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Token:
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = create_access_token(
-        data={"id": user.id, "username": user.username},
-        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
-    return Token(access_token=access_token, token_type="bearer")
+    return Token(access_token=issue_access_token(user), token_type="bearer")
 
 @app.post("/register", response_model=Token)
-def register(form_data: RegisterForm):
-    existing_user = db.query(User).filter(User.username == form_data.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username sudah digunakan"
-        )
-
+async def register(form_data: RegisterForm, db: Annotated[AsyncSession, Depends(get_db)]):
     if form_data.password != form_data.confirm_password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -81,89 +114,81 @@ def register(form_data: RegisterForm):
     date_of_birth = datetime.strptime(form_data.date_of_birth, "%Y-%m-%d")
     age_months = relativedelta(datetime.now(), date_of_birth).years * 12 + \
                  relativedelta(datetime.now(), date_of_birth).months
+    nutrition_status = calculate_nutrition_status(age_months, form_data.gender, form_data.height, form_data.weight)
 
-    user_id = (db.query(User).order_by(desc(User.id)).first().id + 1) if db.query(User).count() else 1
-
+    # ids come from the SERIAL sequences; the unique username constraint
+    # settles concurrent registrations for the same name
     new_user = User(
-        id=user_id,
         username=form_data.username,
-        password=get_password_hash(form_data.password),
+        password=await get_password_hash_async(form_data.password),
         weight=form_data.weight,
         height=form_data.height,
         gender=form_data.gender,
         date_of_birth=date_of_birth,
-        nutrition_status=calculate_nutrition_status(age_months, form_data.gender, form_data.height, form_data.weight),
+        nutrition_status=nutrition_status,
     )
     db.add(new_user)
-    db.commit()
-
-    user_record_id = (db.query(UserGrowthRecords).order_by(desc(UserGrowthRecords.id)).first().id + 1) if db.query(UserGrowthRecords).count() else 1
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username sudah digunakan"
+        )
 
-    recorder = UserGrowthRecords(
-        id=user_record_id,
-        u_id=user_id,
+    db.add(UserGrowthRecords(
+        u_id=new_user.id,
         weight=form_data.weight,
         height=form_data.height,
-        nutrition_status=calculate_nutrition_status(age_months, form_data.gender, form_data.height, form_data.weight),
+        nutrition_status=nutrition_status,
         date=date.today(),
-    )
-    db.add(recorder)
-    db.commit()
+    ))
+    await db.commit()
 
-    nutrition_data = calculate_minimum_nutrition(age_months, new_user.nutrition_status)
-
-    next_id = lambda: (db.query(UserMinNutritions).order_by(desc(UserMinNutritions.id)).first().id + 1) if db.query(UserMinNutritions).count() else 1
-
-    nutrition_objects = [
-        UserMinNutritions(
-            id=next_id() + i,
-            u_id=new_user.id,
-            n_id=nutrition_mapping[key],
-            value=value
-        ) for i, (key, value) in enumerate(nutrition_data.items())
-    ]
-    db.add_all(nutrition_objects)
-    db.commit()
-
-    return Token(
-        access_token=create_access_token(
-            data={"id": new_user.id, "username": new_user.username},
-            expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        ),
-        token_type="bearer"
-    )
+    return Token(access_token=issue_access_token(new_user), token_type="bearer")
 
 @app.get("/foods")
-def get_all_foods():
-    result = db.query(
-        FoodBeverages.f_id,
-        FoodBeverages.f_name,
-        FoodBeverages.calcium,
-        FoodBeverages.carbohydrate,
-        FoodBeverages.energy,
-        FoodBeverages.fat,
-        FoodBeverages.iron,
-        FoodBeverages.protein
-    ).all()
-    # Ubah hasil query menjadi list of dict
-    foods = [
-        {
-            "id": r.f_id,
-            "name": r.f_name,
-            "calcium": r.calcium,
-            "carbohydrate": r.carbohydrate,
-            "energy": r.energy,
-            "fat": r.fat,
-            "iron": r.iron,
-            "protein": r.protein
-        }
-        for r in result
-    ]
-    return foods
+async def get_all_foods(
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+    limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None
+):
+    try:
+        field_names = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    listing = get_food_listing()
+    headers = {"Cache-Control": f"public, max-age={FOODS_CACHE_MAX_AGE}"}
+    etag = listing.etag(field_names, cursor, limit)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": etag})
+
+    page = listing.page(field_names, cursor, limit)
+    headers["ETag"] = page.etag
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = str(page.next_cursor)
+    return Response(content=page.body, media_type="application/json", headers=headers)
+
+@app.get("/foods/search")
+async def search_foods(
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    k: Annotated[int, Query(ge=1, le=50)] = 10
+):
+    return get_search_index().search(q, k)
+
+@app.get("/foods/top")
+async def get_top_foods(
+    nutrient: Literal["calcium", "carbohydrate", "energy", "iron", "protein", "fat"],
+    k: Annotated[int, Query(ge=1, le=100)] = 20
+):
+    return get_catalog().top_foods(nutrient, k)
 
 @app.get("/foods/{f_id}")
-def get_detail_foods(f_id: int):
-    result = db.query(
+async def get_detail_foods(f_id: int, db: Annotated[AsyncSession, Depends(get_db)]):
+    result = (await db.execute(select(
         FoodBeverages.f_id,
         FoodBeverages.f_name,
         FoodBeverages.calcium,
@@ -172,7 +197,7 @@ def get_detail_foods(f_id: int):
         FoodBeverages.fat,
         FoodBeverages.iron,
         FoodBeverages.protein
-    ).filter(FoodBeverages.f_id == f_id).first()
+    ).where(FoodBeverages.f_id == f_id))).first()
     
     if result is None:
         return {"error": "Food not found"}
@@ -189,130 +214,190 @@ def get_detail_foods(f_id: int):
     }
     return food
 
-@app.get("/track_record")
-def get_track_record(current_user: Annotated[User, Depends(get_current_user)]):
-    subq = (
-        db.query(
-            func.min(UserGrowthRecords.date).label("min_date"),
-            extract('year', UserGrowthRecords.date).label('year'),
-            extract('month', UserGrowthRecords.date).label('month')
-        )
-        .filter(UserGrowthRecords.u_id == current_user.id)
-        .group_by(
-            extract('year', UserGrowthRecords.date),
-            extract('month', UserGrowthRecords.date)
+@app.get("/foods/{f_id}/similar")
+async def get_similar_foods(f_id: int, k: Annotated[int, Query(ge=1, le=100)] = 10):
+    catalog = get_catalog()
+    if catalog.row(f_id) is None:
+        return {"error": "Food not found"}
+    return catalog.similar_foods(f_id, k)
+
+def track_record_query(user_id: int):
+    """First growth record of each month for a user, newest month first"""
+    # 'month' is inlined so the expression matches the index on date_trunc('month', date)
+    month = func.date_trunc(literal_column("'month'"), UserGrowthRecords.date)
+    return (
+        select(
+            UserGrowthRecords.id,
+            UserGrowthRecords.u_id,
+            UserGrowthRecords.date,
+            UserGrowthRecords.weight,
+            UserGrowthRecords.height,
+            UserGrowthRecords.nutrition_status,
         )
-        .subquery()
+        .where(UserGrowthRecords.u_id == user_id)
+        .ext(distinct_on(month))
+        .order_by(month.desc(), UserGrowthRecords.date, UserGrowthRecords.id)
     )
 
-    results = (
-        db.query(UserGrowthRecords)
-        .join(
-            subq,
-            and_(
-                extract('year', UserGrowthRecords.date) == subq.c.year,
-                extract('month', UserGrowthRecords.date) == subq.c.month,
-                UserGrowthRecords.date == subq.c.min_date
-            )
+@app.get("/track_record")
+async def get_track_record(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    zscores: bool = False
+):
+    results = [dict(row._mapping) for row in (await db.execute(track_record_query(current_user.id))).all()]
+    if zscores and results:
+        ages_months = [
+            relativedelta(record["date"], current_user.date_of_birth).years * 12 +
+            relativedelta(record["date"], current_user.date_of_birth).months
+            for record in results
+        ]
+        values = get_zscore_engine().zscore_batch(
+            ages_months,
+            [current_user.gender] * len(results),
+            [record["height"] for record in results],
+            [record["weight"] for record in results],
         )
-        .filter(UserGrowthRecords.u_id == current_user.id)
-        .order_by(UserGrowthRecords.date.desc())
-        .all()
-    )
-
+        for record, value in zip(results, values):
+            record["zscore"] = round(float(value), 2)
     return results
 
+@app.get("/db_pool_status", dependencies=[Depends(require_clinic_key)])
+async def get_db_pool_status():
+    return pool_status()
+
 @app.get("/get_status_nutritions")
-def get_status_nutritions(current_user: Annotated[User, Depends(get_current_user)]):
+async def get_status_nutritions(current_user: Annotated[Principal, Depends(get_current_user)]):
     return current_user.nutrition_status
 
-@app.get("/get_minimum_nutrition")
-def get_minimum_nutrition(current_user: Annotated[User, Depends(get_current_user)]):
+def minimum_nutrition_query(user_id: int):
+    """Clinician overrides of a user's daily needs"""
+    return select(UserMinNutritions).where(
+        UserMinNutritions.u_id == user_id, UserMinNutritions.source == "clinician"
+    )
+
+async def get_needs_overrides(db: AsyncSession, user_id: int) -> dict:
     id_to_nutrition = {v: k for k, v in nutrition_mapping.items()}
-    results = db.query(UserMinNutritions).filter(UserMinNutritions.u_id == current_user.id).all()
-    output = {}
-    for row in results:
-        nutrition_name = id_to_nutrition.get(row.n_id, "unknown")
-        output[nutrition_name] = row.value
-    return output
+    results = (await db.scalars(minimum_nutrition_query(user_id))).all()
+    return {id_to_nutrition.get(row.n_id, "unknown"): row.value for row in results}
 
-@app.put("/update_user_nutritions")
-def update_user_nutritions(form_data: NutritionUpdateForm, current_user: Annotated[User, Depends(get_current_user)]):
-    age_months = relativedelta(datetime.now(), current_user.date_of_birth).years * 12 + \
-                 relativedelta(datetime.now(), current_user.date_of_birth).months
-    current_user.weight = form_data.weight
-    current_user.height = form_data.height
-    current_user.nutrition_status = calculate_nutrition_status(age_months, current_user.gender, form_data.height, form_data.weight)
-    db.commit()
-
-    user_record_id = (db.query(UserGrowthRecords).order_by(desc(UserGrowthRecords.id)).first().id + 1) if db.query(UserGrowthRecords).count() else 1
-    recorder = UserGrowthRecords(
-    id=user_record_id,
-    u_id=current_user.id,
-    weight=form_data.weight,
-    height=form_data.height,
-    nutrition_status=calculate_nutrition_status(age_months, current_user.gender, form_data.height, form_data.weight),
-    date=date.today())
-    db.add(recorder)
-    db.commit()
-
-    nutrition_data = calculate_minimum_nutrition(age_months, current_user.nutrition_status)
-    db.query(UserMinNutritions).filter(UserMinNutritions.u_id == current_user.id).delete()
-    next_id = lambda: (db.query(UserMinNutritions).order_by(desc(UserMinNutritions.id)).first().id + 1) if db.query(UserMinNutritions).count() else 1
-    nutrition_objects = [
-        UserMinNutritions(
-            id=next_id() + i,
-            u_id=current_user.id,
-            n_id=nutrition_mapping[key],
-            value=value
-        ) for i, (key, value) in enumerate(nutrition_data.items())
+@app.get("/get_minimum_nutrition")
+async def get_minimum_nutrition(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    return resolve_minimum_nutrition(
+        age_in_months(current_user.date_of_birth),
+        current_user.nutrition_status,
+        await get_needs_overrides(db, current_user.id)
+    )
+
+@app.put("/users/{user_id}/minimum_nutrition", dependencies=[Depends(require_clinic_key)])
+async def set_minimum_nutrition_overrides(
+    user_id: int,
+    form_data: MinimumNutritionOverrideForm,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    user = await db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    overrides = form_data.model_dump(exclude_unset=True)
+    cleared = [nutrition_mapping[key] for key, value in overrides.items() if value is None]
+    values = [
+        {"u_id": user_id, "n_id": nutrition_mapping[key], "value": value, "source": "clinician"}
+        for key, value in overrides.items() if value is not None
     ]
-    db.add_all(nutrition_objects)
-    db.commit()
+    if cleared:
+        await db.execute(delete(UserMinNutritions).where(
+            UserMinNutritions.u_id == user_id, UserMinNutritions.n_id.in_(cleared)
+        ))
+    if values:
+        stmt = pg_insert(UserMinNutritions).values(values)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[UserMinNutritions.u_id, UserMinNutritions.n_id],
+            set_={"value": stmt.excluded.value, "source": stmt.excluded.source},
+        ))
+    await db.execute(
+        update(User).where(User.id == user_id).values(preferences_version=User.preferences_version + 1)
+    )
+    await db.commit()
+
+    return resolve_minimum_nutrition(
+        age_in_months(user.date_of_birth),
+        user.nutrition_status,
+        await get_needs_overrides(db, user_id)
+    )
+
+@app.put("/update_user_nutritions")
+async def update_user_nutritions(
+    form_data: NutritionUpdateForm,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    user = await db.get(User, current_user.id)
+    age_months = relativedelta(datetime.now(), user.date_of_birth).years * 12 + \
+                 relativedelta(datetime.now(), user.date_of_birth).months
+    user.weight = form_data.weight
+    user.height = form_data.height
+    user.nutrition_status = calculate_nutrition_status(age_months, user.gender, form_data.height, form_data.weight)
+    # Invalidates tokens that still carry the old profile
+    user.profile_version = (user.profile_version or 1) + 1
+
+    db.add(UserGrowthRecords(
+        u_id=user.id,
+        weight=form_data.weight,
+        height=form_data.height,
+        nutrition_status=user.nutrition_status,
+        date=date.today(),
+    ))
+    await db.commit()
+    profile_versions.set(user.id, user.profile_version)
 
-    return {"status": "success"}
+    return {"status": "success", "access_token": issue_access_token(user), "token_type": "bearer"}
+
+@app.post("/screenings", dependencies=[Depends(require_clinic_key)])
+async def post_screenings(request: Request, db: Annotated[AsyncSession, Depends(get_db)]):
+    try:
+        measurements = parse_measurements(request.headers.get("content-type", ""), await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    results = await run_screening(db, measurements)
+    return StreamingResponse(ndjson_lines(results), media_type="application/x-ndjson")
 
 @app.post("/post_food_histories")
-def post_food_histories(
+async def post_food_histories(
     form_data: FoodHistoriesBulkForm,
-    current_user: Annotated[User, Depends(get_current_user)]
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
 ):
     current_date = date.today()
-    last_record = db.query(FoodHistories).order_by(desc(FoodHistories.id)).first()
-    next_id = last_record.id + 1 if last_record else 1
-
-    new_records = []
-    for i, item in enumerate(form_data.items):
-        new_food = FoodHistories(
-            id=next_id + i,
-            f_id=item.f_id,
-            u_id=current_user.id,
-            date=current_date
-        )
-        new_records.append(new_food)
-
+    new_records = [
+        FoodHistories(f_id=item.f_id, u_id=current_user.id, date=current_date)
+        for item in form_data.items
+    ]
     db.add_all(new_records)
-    db.commit()
+    await add_daily_intake(db, current_user.id, current_date, [item.f_id for item in form_data.items])
+    await db.commit()
 
     return {"status": "success", "inserted": len(new_records)}
 
-def get_food_histories_for_user(user_id: int) -> List[FoodHistories]:
-    return db.query(FoodHistories).filter(
-        FoodHistories.u_id == user_id,
-        FoodHistories.date == date.today()
-    ).all()
+def food_histories_query(user_id: int, day: date):
+    """Foods a user ate on a day, answered from the covering (u_id, date) index"""
+    return select(FoodHistories.f_id).where(FoodHistories.u_id == user_id, FoodHistories.date == day)
+
+async def get_food_histories_for_user(db: AsyncSession, user_id: int) -> list:
+    return (await db.execute(food_histories_query(user_id, date.today()))).all()
 
 @app.get("/get_food_histories")
-def get_food_histories(
-    current_user: Annotated[User, Depends(get_current_user)]
+async def get_food_histories(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
 ):
-    food_histories = db.query(FoodHistories).filter(
-        FoodHistories.u_id == current_user.id,
-        FoodHistories.date == date.today()
-    ).all()
+    food_histories = await get_food_histories_for_user(db, current_user.id)
     food_histories_id = [food.f_id for food in food_histories]
 
-    result = db.query(
+    result = (await db.execute(select(
         FoodBeverages.f_name,
         FoodBeverages.i_names,
         FoodBeverages.calcium,
@@ -321,7 +406,7 @@ def get_food_histories(
         FoodBeverages.fat,
         FoodBeverages.iron,
         FoodBeverages.protein
-    ).filter(FoodBeverages.f_id.in_(food_histories_id)).all()
+    ).where(FoodBeverages.f_id.in_(food_histories_id)))).all()
 
     data = [
         {
@@ -338,179 +423,107 @@ def get_food_histories(
     ]
     return data
 
-def get_current_nutrient_residue(current_user: User):
-    food_histories = get_food_histories_for_user(current_user.id)
-    total_nutrition_consumed = []
-
-    for food_nutrition in food_histories:
-        food_histories_nutrition = db.query(FoodBeverages).filter(
-            FoodBeverages.f_id == food_nutrition.f_id
-        ).first()
-        food_histories_nutrition = {
-            nutrisi: getattr(food_histories_nutrition, nutrisi, 0) or 0
-            for nutrisi in NUTRITION_FEATURES
-        }
-        total_nutrition_consumed.append(food_histories_nutrition)
-
-    aggregated_nutrition = {nutrisi: 0 for nutrisi in NUTRITION_FEATURES}
-    for nutrition in total_nutrition_consumed:
-        for nutrisi, value in nutrition.items():
-            aggregated_nutrition[nutrisi] += value
-
-    rows = (
-        db.query(UserMinNutritions.value, Nutritions.name)
-        .join(Nutritions, UserMinNutritions.n_id == Nutritions.id)
-        .filter(UserMinNutritions.u_id == current_user.id)
-        .all()
-    )
-    min_nutrition_needs = {name.lower(): value for value, name in rows}
-
-    nutrient_residue = {}
-    for nutrisi in NUTRITION_FEATURES:
-        need = min_nutrition_needs.get(nutrisi, 0)
-        consumed = aggregated_nutrition.get(nutrisi, 0)
-        residue = max(0, need - consumed)
-        nutrient_residue[nutrisi] = residue
+@app.get("/get_nutrient_current")
+async def get_nutrient_current(
+    intake: Annotated[dict, Depends(get_current_intake)]
+):
+    return intake["consumed"]
 
-    return nutrient_residue
+async def get_excluded_ingredients(db: AsyncSession, user_id: int) -> list:
+    return (await db.scalars(
+        select(UserIngredientExclusions.i_id).where(UserIngredientExclusions.u_id == user_id)
+    )).all()
 
-@app.get("/get_nutrient_current")
-def get_nutrient_current(
-    current_user: User = Depends(get_current_user)
+@app.get("/exclusions")
+async def get_exclusions(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
 ):
-    food_histories = get_food_histories_for_user(current_user.id)
-    total_nutrition_consumed = []
-
-    for food_nutrition in food_histories:
-        food_histories_nutrition = db.query(FoodBeverages).filter(
-            FoodBeverages.f_id == food_nutrition.f_id
-        ).first()
-        food_histories_nutrition = {
-            nutrisi: getattr(food_histories_nutrition, nutrisi, 0) or 0
-            for nutrisi in NUTRITION_FEATURES
-        }
-        total_nutrition_consumed.append(food_histories_nutrition)
-
-    aggregated_nutrition = {nutrisi: 0 for nutrisi in NUTRITION_FEATURES}
-    for nutrition in total_nutrition_consumed:
-        for nutrisi, value in nutrition.items():
-            aggregated_nutrition[nutrisi] += value
-
-    return aggregated_nutrition
-
-def get_current_nutrient_deficiency_percent(current_user: User):
-    food_histories = get_food_histories_for_user(current_user.id)
-    total_nutrition_consumed = []
-
-    for food_nutrition in food_histories:
-        food_histories_nutrition = db.query(FoodBeverages).filter(
-            FoodBeverages.f_id == food_nutrition.f_id
-        ).first()
-        food_histories_nutrition = {
-            nutrisi: getattr(food_histories_nutrition, nutrisi, 0) or 0
-            for nutrisi in NUTRITION_FEATURES
-        }
-        total_nutrition_consumed.append(food_histories_nutrition)
-
-    aggregated_nutrition = {nutrisi: 0 for nutrisi in NUTRITION_FEATURES}
-    for nutrition in total_nutrition_consumed:
-        for nutrisi, value in nutrition.items():
-            aggregated_nutrition[nutrisi] += value
-
-    rows = (
-        db.query(UserMinNutritions.value, Nutritions.name)
-        .join(Nutritions, UserMinNutritions.n_id == Nutritions.id)
-        .filter(UserMinNutritions.u_id == current_user.id)
-        .all()
-    )
-    min_nutrition_needs = {name.lower(): value for value, name in rows}
+    result = (await db.execute(
+        select(Ingredients.id, Ingredients.name)
+        .join(UserIngredientExclusions, UserIngredientExclusions.i_id == Ingredients.id)
+        .where(UserIngredientExclusions.u_id == current_user.id)
+        .order_by(Ingredients.id)
+    )).all()
+    return [{"id": r.id, "name": r.name} for r in result]
+
+@app.put("/exclusions")
+async def update_exclusions(
+    form_data: ExclusionsForm,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    ingredient_ids = sorted(set(form_data.ingredient_ids))
+    known = set((await db.scalars(select(Ingredients.id).where(Ingredients.id.in_(ingredient_ids)))).all())
+    unknown = [i_id for i_id in ingredient_ids if i_id not in known]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Bahan tidak ditemukan: {unknown}"
+        )
 
-    nutrient_deficiency_percent = {}
-    for nutrisi in NUTRITION_FEATURES:
-        need = min_nutrition_needs.get(nutrisi, 0)
-        consumed = aggregated_nutrition.get(nutrisi, 0)
-        if need > 0:
-            residue = max(0, need - consumed)
-            deficiency_percent = (residue / need) * 100
-            nutrient_deficiency_percent[nutrisi] = round(deficiency_percent, 2)
-        else:
-            nutrient_deficiency_percent[nutrisi] = 0.0
+    await db.execute(delete(UserIngredientExclusions).where(UserIngredientExclusions.u_id == current_user.id))
+    db.add_all([UserIngredientExclusions(u_id=current_user.id, i_id=i_id) for i_id in ingredient_ids])
+    await db.execute(
+        update(User).where(User.id == current_user.id).values(preferences_version=User.preferences_version + 1)
+    )
+    await db.commit()
 
-    return nutrient_deficiency_percent
+    return {"status": "success", "ingredient_ids": ingredient_ids}
 
 @app.get("/food_recommendations")
-def get_recommendations(
-    current_user: Annotated[User, Depends(get_current_user)]
+async def get_recommendations(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)]
 ):
-    remaining_percent = get_current_nutrient_deficiency_percent(current_user)
-    remaining = get_current_nutrient_residue(current_user)
+    catalog = get_catalog()
+    today = date.today()
+    food_count, preferences_version = await get_intake_versions(db, current_user.id, today)
+    cache_key = recommendation_cache.key(
+        current_user.id, today, food_count, current_user.profile_version, preferences_version, catalog.checksum
+    )
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    intake = await get_intake_summary(db, current_user)
+    remaining_percent = intake["deficiency_percent"]
+    remaining = intake["residue"]
 
-    food_histories = get_food_histories_for_user(current_user.id)
+    food_histories = await get_food_histories_for_user(db, current_user.id)
     if not food_histories:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Belum ada histori makanan untuk user ini."
         )
 
-    food_histories_id = [i.f_id for i in food_histories]
-    food_beverages = db.query(FoodBeverages).all()
-    food_beverages_id = [i.f_id for i in food_beverages]
-    filter_foods_id = [f_id for f_id in food_beverages_id if f_id not in food_histories_id]
-
     if all(val == 0 for val in remaining.values()):
-        return {
+        result = {
             "message": "User telah memenuhi kebutuhan nutrisi",
             "recommendations": []
         }
+        recommendation_cache.set(cache_key, result)
+        return result
 
-    valid_history_idx = [id_to_index[i] for i in food_histories_id if i in id_to_index]
-    valid_beverage_idx = [id_to_index[i] for i in filter_foods_id if i in id_to_index]
-
-    if not valid_history_idx or not valid_beverage_idx:
-        avg_ingredient_similarity = np.zeros(len(valid_beverage_idx))
-    else:
-        avg_ingredient_similarity = np.mean([
-            linear_kernel(INGREDIENT_VECTORIZED[i:i+1], INGREDIENT_VECTORIZED[valid_beverage_idx])[0]
-            for i in valid_history_idx
-        ], axis=0)
-        avg_ingredient_similarity = avg_ingredient_similarity.tolist()
-
-    sorted_remaining = sorted(remaining_percent.items(), key=lambda x: x[1], reverse=True)
-    top_nutrients = [nutrient for nutrient, amount in sorted_remaining[:3] if amount > 0]
-    if not top_nutrients:
-        top_nutrients = list(remaining_percent.keys())
-
-    food_nutrition_matrix = []
-    for idx in valid_beverage_idx:
-        food = db.query(FoodBeverages).filter(FoodBeverages.f_id == filter_foods_id[valid_beverage_idx.index(idx)]).first()
-        if not food:
-            food_nutrition_matrix.append([0.0 for _ in top_nutrients])
-        else:
-            food_nutrition_matrix.append([
-                getattr(food, nutrient, 0) or 0 for nutrient in top_nutrients
-            ])
-    food_nutrition_matrix = np.array(food_nutrition_matrix)
-
-    max_residue = np.array([remaining[nutrient] for nutrient in top_nutrients]) + 1e-8
-    nutrition_score = np.sum(np.clip(food_nutrition_matrix, 0, max_residue) / max_residue, axis=1) / len(top_nutrients)
-
-    if len(avg_ingredient_similarity) > 0 and np.max(avg_ingredient_similarity) > 0:
-        ingredient_sim_norm = avg_ingredient_similarity / np.max(avg_ingredient_similarity)
-    else:
-        ingredient_sim_norm = np.zeros_like(nutrition_score)
-
-    hybrid_score = 0.8 * nutrition_score + 0.2 * ingredient_sim_norm
-
-    top_indices = np.argsort(-hybrid_score)
-    top_food_ids = [filter_foods_id[i] for i in top_indices]
-
-    n_recommend = min(3, len(top_food_ids))
-    recommended_food_ids = top_food_ids[:n_recommend]
-
-    recomendation_food = (
-        db.query(FoodBeverages)
-        .filter(FoodBeverages.f_id.in_(recommended_food_ids))
-        .all()
+    food_histories_id = [i.f_id for i in food_histories]
+    excluded = await get_excluded_ingredients(db, current_user.id)
+    band = age_band(age_in_months(current_user.date_of_birth)) if current_user.date_of_birth else None
+    recomendation_food = recommend_foods(
+        catalog, remaining, remaining_percent, food_histories_id,
+        excluded_ingredients=excluded, age_band=band
     )
 
-    return recomendation_food
\ No newline at end of file
+    recommendation_cache.set(cache_key, recomendation_food)
+    return recomendation_food
+
+@app.get("/recommendation_cache_status", dependencies=[Depends(require_clinic_key)])
+async def get_recommendation_cache_status():
+    return recommendation_cache.stats()
+
+@app.post("/food_recommendations/batch", dependencies=[Depends(require_clinic_key)])
+async def get_batch_recommendations(
+    form_data: BatchRecommendationForm,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    results = await run_batch_recommendations(db, get_catalog(), form_data.user_ids, form_data.k)
+    return StreamingResponse(ndjson_lines(results), media_type="application/x-ndjson")
@@ -0,0 +1,210 @@
+"""Maintenance commands for the Nutrivana backend.
+
+Run from the backend directory, e.g. ``python manage.py build-catalog``.
+"""
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import text
+
+from core.core import SessionLocal
+
+
+def build_catalog_command(args) -> None:
+    from catalog import build_catalog
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        catalog = build_catalog(db, args.artifact_dir, force=args.force)
+    print(f"catalog {catalog.checksum}: {len(catalog)} foods ({time.perf_counter() - start:.2f}s)")
+
+
+def refresh_catalog_command(args) -> None:
+    from catalog import build_catalog
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        db.execute(text("SELECT refresh_food_beverages()"))
+        db.commit()
+        print(f"food_beverages refreshed ({time.perf_counter() - start:.2f}s)")
+        catalog = build_catalog(db, args.artifact_dir)
+    print(f"catalog {catalog.checksum}: {len(catalog)} foods ({time.perf_counter() - start:.2f}s)")
+
+
+SERIAL_TABLES = ["users", "user_growth_records", "user_minimum_nutritions", "food_histories"]
+
+
+def sync_sequences_command(args) -> None:
+    # Rows written while ids were allocated as max(id) + 1 never advanced the
+    # SERIAL sequences; move each one past the highest id already in use.
+    with SessionLocal() as db:
+        for table in SERIAL_TABLES:
+            value = db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+            )).scalar_one()
+            print(f"{table}: next id {value}")
+        db.commit()
+
+
+def rebuild_intake_command(args) -> None:
+    from intake import rebuild_daily_intake
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        rows = rebuild_daily_intake(db, args.user, args.since)
+    print(f"user_daily_intake: {rows} rows rebuilt ({time.perf_counter() - start:.2f}s)")
+
+
+def sync_needs_command(args) -> None:
+    from helper import MINIMUM_NEEDS, nutrition_mapping
+    from Model import MinimumNeeds
+
+    with SessionLocal() as db:
+        db.query(MinimumNeeds).delete()
+        db.add_all([
+            MinimumNeeds(age_band=band, nutrition_status=status, n_id=nutrition_mapping[key], value=value)
+            for (band, status), needs in MINIMUM_NEEDS.items()
+            for key, value in needs.items()
+        ])
+        db.commit()
+    print(f"minimum_needs: {sum(len(needs) for needs in MINIMUM_NEEDS.values())} rows")
+
+
+# Lookup tables small enough that a sequential scan is always fine
+PLAN_CHECK_SMALL_TABLES = {"nutritions"}
+
+
+def hot_queries(user_id: int, day: date) -> dict:
+    """The per-request queries behind the dashboard, built exactly as the API builds them"""
+    from sqlalchemy import select
+    from Model import User, FoodBeverages
+    from intake import intake_summary_query
+    from main import food_histories_query, minimum_nutrition_query, track_record_query
+
+    return {
+        "user by username": select(User).filter_by(username="plan-check"),
+        "profile version": select(User.profile_version).where(User.id == user_id),
+        "food histories of the day": food_histories_query(user_id, day),
+        "track record": track_record_query(user_id),
+        "minimum nutrition": minimum_nutrition_query(user_id),
+        "intake summary": intake_summary_query(user_id, day),
+        "eaten foods": select(FoodBeverages).where(FoodBeverages.f_id.in_([1, 2, 3])),
+    }
+
+
+def seq_scans(plan: dict) -> list:
+    found = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+
+def sorts(plan: dict) -> int:
+    found = int(plan["Node Type"] == "Sort")
+    for child in plan.get("Plans", []):
+        found += sorts(child)
+    return found
+
+
+def check_plans_command(args) -> None:
+    # With sequential scans and sorts disabled the planner only picks one when
+    # no index can serve the query or its order, so the check does not depend
+    # on table sizes
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    # Compiled as the API's asyncpg driver sends them, with $n parameters, and
+    # planned as the generic plan a prepared statement ends up using
+    dialect = asyncpg.dialect()
+    failures = 0
+    with SessionLocal() as db:
+        for name, query in hot_queries(args.user, date.today()).items():
+            sql = str(query.compile(dialect=dialect, compile_kwargs={"render_postcompile": True}))
+            db.execute(text("SET LOCAL enable_seqscan = off"))
+            db.execute(text("SET LOCAL enable_sort = off"))
+            plan = db.connection().exec_driver_sql(
+                f"EXPLAIN (GENERIC_PLAN, FORMAT JSON) {sql}"
+            ).scalar_one()[0]["Plan"]
+            db.rollback()
+            problems = [f"seq scan on {table}" for table in sorted(set(seq_scans(plan)) - PLAN_CHECK_SMALL_TABLES)]
+            if sorts(plan):
+                problems.append("sort")
+            failures += bool(problems)
+            print(f"{'FAIL' if problems else 'ok':<5}{name}" + (f": {', '.join(problems)}" if problems else ""))
+    if failures:
+        raise SystemExit(f"{failures} hot queries fall back to a sequential scan or a sort")
+
+
+def ensure_partitions_command(args) -> None:
+    from partitions import ensure_partitions
+
+    with SessionLocal() as db:
+        created = ensure_partitions(db, args.months_ahead)
+    print(f"created {', '.join(created)}" if created else "food_histories partitions up to date")
+
+
+def archive_histories_command(args) -> None:
+    from partitions import archive_partitions, retention_cutoff
+
+    before = args.before or retention_cutoff(args.retention_months)
+    with SessionLocal() as db:
+        archived = archive_partitions(db, before, args.archive_dir)
+    for name, rows in archived:
+        print(f"{name}: {rows} rows archived")
+    if not archived:
+        print(f"no food_histories partitions end before {before}")
+
+
+def main() -> None:
+    from catalog import CATALOG_ARTIFACT_DIR
+    from partitions import FOOD_HISTORY_ARCHIVE_DIR, FOOD_HISTORY_MONTHS_AHEAD, FOOD_HISTORY_RETENTION_MONTHS
+
+    parser = argparse.ArgumentParser(description="Nutrivana maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build-catalog", help="build the recommendation catalog artifact")
+    build.add_argument("--artifact-dir", default=CATALOG_ARTIFACT_DIR)
+    build.add_argument("--force", action="store_true", help="rebuild even if the checksum is unchanged")
+    build.set_defaults(handler=build_catalog_command)
+
+    refresh = commands.add_parser(
+        "refresh-catalog",
+        help="refresh the food_beverages materialized view and rebuild the catalog artifact if it changed",
+    )
+    refresh.add_argument("--artifact-dir", default=CATALOG_ARTIFACT_DIR)
+    refresh.set_defaults(handler=refresh_catalog_command)
+
+    sync = commands.add_parser("sync-sequences", help="move the id sequences past existing rows")
+    sync.set_defaults(handler=sync_sequences_command)
+
+    intake = commands.add_parser("rebuild-intake", help="recompute user_daily_intake from food_histories")
+    intake.add_argument("--user", type=int, help="only this user id")
+    intake.add_argument("--since", type=date.fromisoformat, help="only days from this date (YYYY-MM-DD)")
+    intake.set_defaults(handler=rebuild_intake_command)
+
+    needs = commands.add_parser("sync-needs", help="mirror the precomputed minimum needs into minimum_needs")
+    needs.set_defaults(handler=sync_needs_command)
+
+    plans = commands.add_parser("check-plans", help="fail if a hot query needs a sequential scan or a sort")
+    plans.add_argument("--user", type=int, default=1, help="user id to plan the queries for")
+    plans.set_defaults(handler=check_plans_command)
+
+    ensure = commands.add_parser("ensure-partitions", help="create upcoming monthly food_histories partitions")
+    ensure.add_argument("--months-ahead", type=int, default=FOOD_HISTORY_MONTHS_AHEAD)
+    ensure.set_defaults(handler=ensure_partitions_command)
+
+    archive = commands.add_parser(
+        "archive-histories", help="move old food_histories partitions to Parquet and drop them"
+    )
+    archive.add_argument("--retention-months", type=int, default=FOOD_HISTORY_RETENTION_MONTHS)
+    archive.add_argument("--before", type=date.fromisoformat, help="archive partitions ending on or before this date")
+    archive.add_argument("--archive-dir", default=FOOD_HISTORY_ARCHIVE_DIR)
+    archive.set_defaults(handler=archive_histories_command)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import os
+from datetime import date
+
+from decouple import config
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from intake import rebuild_daily_intake
+
+
+# Monthly food_histories partitions created ahead of the current month
+FOOD_HISTORY_MONTHS_AHEAD = config("FOOD_HISTORY_MONTHS_AHEAD", default=3, cast=int)
+# Months of food history kept in the database before archival
+FOOD_HISTORY_RETENTION_MONTHS = config("FOOD_HISTORY_RETENTION_MONTHS", default=12, cast=int)
+FOOD_HISTORY_ARCHIVE_DIR = config(
+    "FOOD_HISTORY_ARCHIVE_DIR",
+    default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "archive", "food_histories"),
+)
+
+PARTITIONS_SQL = text("""
+    SELECT c.relname AS name,
+           (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'FROM \\(''([^'']+)''\\)'))[1]::date AS lower_bound,
+           (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \\(''([^'']+)''\\)'))[1]::date AS upper_bound
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'food_histories'::regclass
+    ORDER BY lower_bound NULLS LAST
+""")
+
+
+# ======================
+# Food History Partitions
+# ======================
+
+def is_partitioned(db: Session) -> bool:
+    return db.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('food_histories'))"
+    )).scalar_one()
+
+
+def ensure_partitions(db: Session, months_ahead: int = FOOD_HISTORY_MONTHS_AHEAD) -> list:
+    """Create the partitions for this month and the next months_ahead, returning the new ones"""
+    if not is_partitioned(db):
+        return []
+    created = db.execute(
+        text("SELECT ensure_food_histories_partitions(:start, :months)"),
+        {"start": date.today().replace(day=1), "months": months_ahead + 1},
+    ).scalars().all()
+    db.commit()
+    return created
+
+
+def list_partitions(db: Session) -> list:
+    """Monthly partitions as (name, lower_bound, upper_bound); the default partition has no bounds"""
+    return [tuple(row) for row in db.execute(PARTITIONS_SQL).all()]
+
+
+def archive_partition(db: Session, name: str, lower_bound: date, upper_bound: date, archive_dir: str) -> int:
+    """Write one monthly partition to Parquet, then detach and drop it
+
+    The day totals in user_daily_intake are recomputed from the partition
+    first, so the rollup keeps covering the archived month.
+    """
+    # pyarrow is only needed by this maintenance job
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = db.execute(text(f'SELECT id, f_id, u_id, date FROM "{name}" ORDER BY u_id, date, id')).all()
+    table = pa.table({
+        "id": pa.array([r.id for r in rows], pa.int32()),
+        "f_id": pa.array([r.f_id for r in rows], pa.int32()),
+        "u_id": pa.array([r.u_id for r in rows], pa.int32()),
+        "date": pa.array([r.date for r in rows], pa.timestamp("us")),
+    })
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{lower_bound:%Y_%m}.parquet")
+    staging = f"{path}.tmp"
+    pq.write_table(table, staging, compression="zstd")
+    if pq.read_metadata(staging).num_rows != len(rows):
+        os.remove(staging)
+        raise RuntimeError(f"{name}: archive row count does not match the partition")
+    os.replace(staging, path)
+
+    rebuild_daily_intake(db, since=lower_bound, until=upper_bound)
+    db.execute(text(f'ALTER TABLE food_histories DETACH PARTITION "{name}"'))
+    db.execute(text(f'DROP TABLE "{name}"'))
+    db.commit()
+    return len(rows)
+
+
+def split_default_partition(db: Session, before: date) -> list:
+    """Move rows of the default partition older than the given month into monthly partitions"""
+    if not is_partitioned(db):
+        return []
+    oldest = db.execute(text(
+        "SELECT date_trunc('month', min(date))::date FROM food_histories_default WHERE date < :before"
+    ), {"before": before.replace(day=1)}).scalar_one()
+    if oldest is None:
+        return []
+    months = (before.year - oldest.year) * 12 + before.month - oldest.month
+    created = db.execute(
+        text("SELECT ensure_food_histories_partitions(:start, :months)"),
+        {"start": oldest, "months": months},
+    ).scalars().all()
+    db.commit()
+    return created
+
+
+def archive_partitions(db: Session, before: date, archive_dir: str = FOOD_HISTORY_ARCHIVE_DIR) -> list:
+    """Archive every monthly partition that ends on or before the given date
+
+    Old rows still sitting in the default partition are split out into their
+    monthly partitions first, so they are archived along with the rest.
+    """
+    split_default_partition(db, before)
+    archived = []
+    for name, lower_bound, upper_bound in list_partitions(db):
+        if upper_bound is not None and upper_bound <= before:
+            archived.append((name, archive_partition(db, name, lower_bound, upper_bound, archive_dir)))
+    return archived
+
+
+def retention_cutoff(months: int = FOOD_HISTORY_RETENTION_MONTHS) -> date:
+    """First day of the oldest month that is kept"""
+    return date.today().replace(day=1) - relativedelta(months=months)
@@ -0,0 +1,124 @@
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+from decouple import config
+
+
+# "memory" for the in-process LRU, "none" to disable, or "module:Class" for a
+# shared backend implementing get/set
+RECOMMENDATION_CACHE_BACKEND = config("RECOMMENDATION_CACHE_BACKEND", default="memory")
+RECOMMENDATION_CACHE_SIZE = config("RECOMMENDATION_CACHE_SIZE", default=10000, cast=int)
+RECOMMENDATION_CACHE_TTL = config("RECOMMENDATION_CACHE_TTL", default=300, cast=int)
+
+
+# ======================
+# Cache Backends
+# ======================
+
+class MemoryBackend:
+    """In-process LRU with a per-entry TTL"""
+
+    def __init__(self, max_entries: int = RECOMMENDATION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class NullBackend:
+    """Caches nothing"""
+
+    def get(self, key: str):
+        return None
+
+    def set(self, key: str, value, ttl: int) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+
+def load_backend(name: str = RECOMMENDATION_CACHE_BACKEND):
+    if name == "memory":
+        return MemoryBackend()
+    if name == "none":
+        return NullBackend()
+    module, _, attr = name.partition(":")
+    return getattr(importlib.import_module(module), attr)()
+
+
+# ======================
+# Recommendation Cache
+# ======================
+
+class RecommendationCache:
+    """Per-user recommendation results, keyed by user, day, intake version and catalog version
+
+    The intake version is made of the day's logged food count, the profile
+    version and the preferences version, all read from the database, so a
+    write on any worker changes the key and a stale result is never served.
+    Superseded entries are left to the LRU and the TTL.
+    """
+
+    def __init__(self, backend=None, ttl: int = RECOMMENDATION_CACHE_TTL):
+        self.backend = backend if backend is not None else load_backend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(
+        self, user_id: int, day: date, food_count: int, profile_version: int, preferences_version: int,
+        catalog_version: str
+    ) -> str:
+        return f"rec:{user_id}:{day.isoformat()}:{food_count}.{profile_version}.{preferences_version}:{catalog_version}"
+
+    def get(self, key: str):
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value) -> None:
+        self.backend.set(key, value, self.ttl)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "entries": len(self.backend),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+recommendation_cache = RecommendationCache()
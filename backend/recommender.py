@@ -0,0 +1,170 @@
+import numpy as np
+import scipy.sparse as sp
+from decouple import config
+
+from catalog import FoodCatalog
+
+
+# ======================
+# Food Recommendation
+# ======================
+
+NUTRITION_WEIGHT = 0.8
+INGREDIENT_WEIGHT = 0.2
+# Rows read from each nutrient ranking before the first threshold check
+CANDIDATE_DEPTH = config("CANDIDATE_DEPTH", default=32, cast=int)
+# Users scored together in one (users x foods x nutrients) block of a batch
+BATCH_SCORE_CHUNK = config("BATCH_SCORE_CHUNK", default=64, cast=int)
+
+
+def top_deficient_nutrients(deficiency_percent: dict, n: int = 3) -> list:
+    """The n most deficient nutrients, or every nutrient when nothing is missing"""
+    sorted_remaining = sorted(deficiency_percent.items(), key=lambda x: x[1], reverse=True)
+    top_nutrients = [nutrient for nutrient, amount in sorted_remaining[:n] if amount > 0]
+    return top_nutrients or list(deficiency_percent.keys())
+
+
+def top_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n highest finite scores, best first, ties going to the lower index"""
+    n = min(n, len(scores))
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    kth = -np.partition(-scores, n - 1)[n - 1]
+    candidates = np.flatnonzero((scores >= kth) & np.isfinite(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:n]
+
+
+def nutrition_scores(catalog: FoodCatalog, rows: np.ndarray, residue: dict, nutrients: list) -> np.ndarray:
+    """Share of the remaining need each food covers, clipped to the residue"""
+    # Summed in feature order, like recommend_foods_batch
+    nutrients = sorted(nutrients, key=catalog.feature_index.get)
+    max_residue = np.array([residue[nutrient] for nutrient in nutrients], dtype=np.float32) + 1e-8
+    matrix = catalog.nutrients[np.ix_(rows, catalog.columns_for(nutrients))]
+    return (np.clip(matrix, 0, max_residue) / max_residue).sum(axis=1) / len(nutrients)
+
+
+def candidate_rows(
+    catalog: FoodCatalog,
+    available: np.ndarray,
+    residue: dict,
+    nutrients: list,
+    n_recommend: int
+) -> np.ndarray:
+    """Available rows that can still make the top n_recommend, read from the ranked indexes
+
+    Threshold algorithm: after reading the first `depth` rows of every
+    nutrient ranking, no unread food scores more on nutrition than the
+    clipped amounts at that depth. Once n_recommend read foods beat that
+    bound even with the full ingredient bonus added, the unread foods cannot
+    reach the top. Reading starts from the combination's cached top list and
+    the depth doubles until the check passes, falling back to every row.
+    """
+    rows = np.flatnonzero(available)
+    if catalog.nutrient_order is None or len(rows) <= CANDIDATE_DEPTH * len(nutrients):
+        # Few enough foods left that scoring them all is cheaper than walking the rankings
+        return rows
+    cols = catalog.columns_for(nutrients)
+    max_residue = np.array([residue[nutrient] for nutrient in nutrients], dtype=np.float32) + 1e-8
+    order = catalog.nutrient_order[:, cols]
+
+    read = np.zeros(len(catalog), dtype=bool)
+    read[catalog.combo_candidates(nutrients)] = True
+    depth = max(CANDIDATE_DEPTH, n_recommend)
+    while depth < len(catalog):
+        read[order[:depth].ravel()] = True
+        rows = np.flatnonzero(read & available)
+        if len(rows) >= n_recommend:
+            edge = catalog.nutrients[order[depth - 1], cols]
+            threshold = (np.clip(edge, 0, max_residue) / max_residue).sum() / len(nutrients)
+            scores = nutrition_scores(catalog, rows, residue, nutrients)
+            kth = np.partition(scores, len(rows) - n_recommend)[len(rows) - n_recommend]
+            if NUTRITION_WEIGHT * kth > NUTRITION_WEIGHT * threshold + INGREDIENT_WEIGHT:
+                return rows
+        depth *= 2
+    return np.flatnonzero(available)
+
+
+def recommend_foods(
+    catalog: FoodCatalog,
+    residue: dict,
+    deficiency_percent: dict,
+    history_ids: list,
+    n_recommend: int = 3,
+    excluded_ingredients: list | None = None,
+    age_band: str | None = None
+) -> list:
+    """Top foods for the remaining nutrient need, as catalog records
+
+    Foods unsuitable for the age band, or containing any excluded
+    ingredient, are masked out before scoring.
+    """
+    available = ~catalog.mask_for(history_ids)
+    if age_band is not None:
+        available &= catalog.age_mask(age_band)
+    if excluded_ingredients:
+        available &= ~catalog.ingredient_mask(excluded_ingredients)
+    if not available.any():
+        return []
+
+    # Normalised over every available food, so pruning never changes the ranking
+    similarity = catalog.ingredient_similarity(catalog.rows_for(history_ids))
+    max_similarity = similarity[available].max()
+
+    nutrients = top_deficient_nutrients(deficiency_percent)
+    rows = candidate_rows(catalog, available, residue, nutrients, min(n_recommend, int(available.sum())))
+    nutrition_score = nutrition_scores(catalog, rows, residue, nutrients)
+    ingredient_sim_norm = similarity[rows] / max_similarity if max_similarity > 0 else np.zeros_like(nutrition_score)
+
+    hybrid_score = NUTRITION_WEIGHT * nutrition_score + INGREDIENT_WEIGHT * ingredient_sim_norm
+
+    return [catalog.foods[row] for row in rows[top_indices(hybrid_score, n_recommend)]]
+
+
+def recommend_foods_batch(
+    catalog: FoodCatalog,
+    residues: np.ndarray,
+    nutrient_masks: np.ndarray,
+    available: np.ndarray,
+    history_rows: list,
+    n_recommend: int = 3
+) -> list:
+    """Top rows for many users at once, scored the same way as recommend_foods
+
+    residues and nutrient_masks are (users x NUTRITION_FEATURES): the
+    remaining need, and which nutrients each user is scored on. available
+    is a (users x foods) mask and history_rows holds each user's eaten rows.
+    Returns one array of rows per user, best first.
+    """
+    n_users = len(residues)
+    max_residue = residues.astype(np.float32) + 1e-8
+    counts = nutrient_masks.sum(axis=1, keepdims=True).astype(np.float32)
+    nutrition_score = np.empty((n_users, len(catalog)), dtype=np.float32)
+    for start in range(0, n_users, BATCH_SCORE_CHUNK):
+        stop = min(start + BATCH_SCORE_CHUNK, n_users)
+        limit = max_residue[start:stop, None, :]
+        covered = np.clip(catalog.nutrients[None, :, :], 0, limit) / limit
+        nutrition_score[start:stop] = (covered * nutrient_masks[start:stop, None, :]).sum(axis=2) / counts[start:stop]
+
+    # Each user's mean history vector, then every user against every food in one product
+    lengths = np.array([len(rows) for rows in history_rows])
+    history = sp.csr_matrix(
+        (np.ones(lengths.sum(), dtype=np.float32),
+         (np.repeat(np.arange(n_users), lengths), np.concatenate(history_rows).astype(np.int64))),
+        shape=(n_users, len(catalog)),
+    )
+    profiles = (history @ catalog.ingredient_vectors).toarray() / np.maximum(lengths, 1)[:, None]
+    similarity = np.asarray(catalog.ingredient_vectors @ profiles.T).T
+    max_similarity = np.where(available, similarity, -np.inf).max(axis=1, keepdims=True)
+    ingredient_sim_norm = np.where(max_similarity > 0, similarity / np.where(max_similarity > 0, max_similarity, 1), 0)
+
+    hybrid_score = NUTRITION_WEIGHT * nutrition_score + INGREDIENT_WEIGHT * ingredient_sim_norm
+    hybrid_score[~available] = -np.inf
+
+    # Each user's n-th best score from one partition, then the rows at or above it
+    n_recommend = min(n_recommend, len(catalog))
+    kth = -np.partition(-hybrid_score, n_recommend - 1, axis=1)[:, n_recommend - 1]
+    top = []
+    for scores, threshold in zip(hybrid_score, kth):
+        rows = np.flatnonzero((scores >= threshold) & np.isfinite(scores))
+        top.append(rows[np.argsort(-scores[rows], kind="stable")][:n_recommend])
+    return top
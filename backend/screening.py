@@ -0,0 +1,189 @@
+import csv
+import io
+import json
+from datetime import date
+
+import numpy as np
+from decouple import config
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy import Date, bindparam, cast, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from Model import User, UserGrowthRecords, UserMinNutritions
+from helper import resolve_minimum_nutrition, age_in_months, nutrition_mapping
+from auth import profile_versions
+from zscore import get_zscore_engine
+
+
+# Largest number of measurements accepted in one screening request
+SCREENING_MAX_ROWS = config("SCREENING_MAX_ROWS", default=1000, cast=int)
+
+
+# Aliased so the field below can be called "date"
+MeasurementDate = date | None
+
+
+class Measurement(BaseModel):
+    user_id: int
+    height: float = Field(..., gt=0)
+    weight: float = Field(..., gt=0)
+    date: MeasurementDate = None
+
+
+measurement_list = TypeAdapter(list[Measurement])
+
+
+# ======================
+# Batch Growth Screening
+# ======================
+
+def parse_measurements(content_type: str, body: bytes) -> list:
+    """Measurements from a JSON array or a CSV with a user_id,height,weight[,date] header"""
+    try:
+        if content_type.split(";")[0].strip() in ("text/csv", "application/csv"):
+            rows = [
+                {key: value for key, value in row.items() if value not in (None, "")}
+                for row in csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            ]
+            measurements = measurement_list.validate_python(rows)
+        else:
+            measurements = measurement_list.validate_json(body)
+    except (ValidationError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid measurements: {e}")
+    if len(measurements) > SCREENING_MAX_ROWS:
+        raise ValueError(f"At most {SCREENING_MAX_ROWS} measurements per request")
+    return measurements
+
+
+async def run_screening(db: AsyncSession, measurements: list) -> list:
+    """Classify every measurement in one pass and store the results in one transaction
+
+    Every measurement becomes a growth record. The latest measurement of each
+    child (by date, then position) updates the user unless an already stored
+    record is newer, and its needs are reported from the precomputed table
+    plus any clinician overrides. Measurements dated in the future or before
+    the child's birth are rejected, as are children without a date of birth
+    or gender to classify them by. Returns one result per measurement, in
+    input order.
+    """
+    today = date.today()
+    user_ids = sorted({m.user_id for m in measurements})
+    users = {
+        row.id: row for row in (await db.execute(
+            select(User.id, User.gender, User.date_of_birth).where(User.id.in_(user_ids))
+        )).all()
+    }
+    id_to_nutrition = {v: k for k, v in nutrition_mapping.items()}
+    overrides = {}
+    for row in (await db.execute(
+        select(UserMinNutritions.u_id, UserMinNutritions.n_id, UserMinNutritions.value)
+        .where(UserMinNutritions.u_id.in_(user_ids), UserMinNutritions.source == "clinician")
+    )).all():
+        overrides.setdefault(row.u_id, {})[id_to_nutrition[row.n_id]] = row.value
+
+    results = [None] * len(measurements)
+    valid = []
+    for i, m in enumerate(measurements):
+        user = users.get(m.user_id)
+        if user is None:
+            results[i] = {"user_id": m.user_id, "status": "error", "detail": "User not found"}
+        elif user.date_of_birth is None:
+            results[i] = {"user_id": m.user_id, "status": "error", "detail": "User has no date of birth"}
+        elif user.gender is None:
+            results[i] = {"user_id": m.user_id, "status": "error", "detail": "User has no gender"}
+        elif m.date is not None and m.date > today:
+            results[i] = {"user_id": m.user_id, "status": "error", "detail": "Measurement date is in the future"}
+        elif m.date is not None and m.date < user.date_of_birth:
+            results[i] = {"user_id": m.user_id, "status": "error", "detail": "Measurement date is before the date of birth"}
+        else:
+            valid.append(i)
+    if not valid:
+        return results
+
+    dates = [measurements[i].date or today for i in valid]
+    ages = np.array([age_in_months(users[measurements[i].user_id].date_of_birth, d) for i, d in zip(valid, dates)])
+    genders = [users[measurements[i].user_id].gender for i in valid]
+    heights = np.array([measurements[i].height for i in valid])
+    weights = np.array([measurements[i].weight for i in valid])
+
+    engine = get_zscore_engine()
+    statuses = engine.classify_batch(ages, genders, heights, weights)
+    zscores = engine.zscore_batch(ages, genders, heights, weights)
+
+    latest = {}
+    for k, i in enumerate(valid):
+        current = latest.get(measurements[i].user_id)
+        if current is None or dates[k] >= dates[current]:
+            latest[measurements[i].user_id] = k
+
+    # Only a measurement at least as new as every stored record updates the user
+    newest = dict((await db.execute(
+        select(UserGrowthRecords.u_id, cast(func.max(UserGrowthRecords.date), Date))
+        .where(UserGrowthRecords.u_id.in_(list(latest)))
+        .group_by(UserGrowthRecords.u_id)
+    )).all())
+    latest = {
+        user_id: k for user_id, k in latest.items()
+        if newest.get(user_id) is None or dates[k] >= newest[user_id]
+    }
+
+    needs = {
+        user_id: resolve_minimum_nutrition(int(ages[k]), str(statuses[k]), overrides.get(user_id))
+        for user_id, k in latest.items()
+    }
+
+    await db.execute(insert(UserGrowthRecords), [
+        {
+            "u_id": measurements[i].user_id,
+            "weight": measurements[i].weight,
+            "height": measurements[i].height,
+            "nutrition_status": str(statuses[k]),
+            "date": dates[k],
+        }
+        for k, i in enumerate(valid)
+    ])
+    if latest:
+        await db.execute(
+            update(User.__table__)
+            .where(User.__table__.c.id == bindparam("b_id"))
+            .values(
+                weight=bindparam("b_weight"),
+                height=bindparam("b_height"),
+                nutrition_status=bindparam("b_status"),
+                profile_version=User.__table__.c.profile_version + 1,
+            ),
+            [
+                {
+                    "b_id": user_id,
+                    "b_weight": measurements[valid[k]].weight,
+                    "b_height": measurements[valid[k]].height,
+                    "b_status": str(statuses[k]),
+                }
+                for user_id, k in latest.items()
+            ],
+        )
+    versions = dict((await db.execute(
+        select(User.id, User.profile_version).where(User.id.in_(list(latest)))
+    )).all())
+    await db.commit()
+
+    for user_id, version in versions.items():
+        profile_versions.set(user_id, version)
+    for k, i in enumerate(valid):
+        user_id = measurements[i].user_id
+        results[i] = {
+            "user_id": user_id,
+            "status": "ok",
+            "date": dates[k].isoformat(),
+            "age_months": int(ages[k]),
+            "nutrition_status": str(statuses[k]),
+            "zscore": round(float(zscores[k]), 2),
+            "minimum_nutrition": needs[user_id] if latest.get(user_id) == k else None,
+        }
+    return results
+
+
+def ndjson_lines(results: list):
+    for result in results:
+        yield json.dumps(result) + "\n"
@@ -0,0 +1,220 @@
+import re
+import threading
+
+import numpy as np
+
+from catalog import FoodCatalog, get_catalog
+from listing import FOOD_FIELDS
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Per query token: an exact word beats a prefix of a word beats a near miss
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.8
+FUZZY_SCORE = 0.6
+# Tokens shorter than this are only matched as prefixes
+FUZZY_MIN_LENGTH = 3
+# Minimum trigram Dice similarity for a near miss
+FUZZY_THRESHOLD = 0.5
+# Short tokens share too few trigrams with their typos, so tokens in this
+# length range also match words one edit (or adjacent swap) away
+EDIT_MIN_LENGTH = 4
+EDIT_MAX_LENGTH = 6
+# Small bonus when the match is the first word of the name
+LEADING_BONUS = 0.1
+# Tie-breaker towards shorter names
+LENGTH_PENALTY = 0.001
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def deletions(token: str) -> set:
+    """token and every string made by deleting one of its letters"""
+    return {token} | {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """Whether a and b are at most one insertion, deletion, substitution or adjacent swap apart"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return a[i + 1:] == b[i + 1:] or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i:i + 2][::-1])
+
+
+# ======================
+# Food Name Search
+# ======================
+
+class FoodSearchIndex:
+    """Prefix and trigram inverted index over the catalog's food names
+
+    Vocabulary tokens are sorted, so every token sharing a prefix sits in one
+    contiguous range and its postings are one contiguous slice of the CSR
+    posting arrays. Typos are caught by a trigram index over the vocabulary,
+    and in short tokens by a deletion index over the vocabulary's prefixes.
+    """
+
+    def __init__(self, catalog: FoodCatalog):
+        self.catalog = catalog
+        postings = {}
+        name_lengths = np.empty(len(catalog), dtype=np.int32)
+        for row, food in enumerate(catalog.foods):
+            tokens = tokenize(food["f_name"] or "")
+            name_lengths[row] = len(tokens)
+            for position, token in enumerate(tokens):
+                postings.setdefault(token, {}).setdefault(row, position)
+
+        self.vocabulary = np.array(sorted(postings), dtype=str)
+        self.token_ids = {token: i for i, token in enumerate(self.vocabulary.tolist())}
+        counts = [len(postings[token]) for token in self.token_ids]
+        self.indptr = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.rows = np.array(
+            [row for token in self.token_ids for row in postings[token]], dtype=np.int32
+        )
+        self.leading = np.array(
+            [position == 0 for token in self.token_ids for position in postings[token].values()], dtype=bool
+        )
+        self.length_penalty = (LENGTH_PENALTY * name_lengths).astype(np.float32)
+
+        grams = {}
+        self.token_grams = np.empty(len(self.vocabulary), dtype=np.int32)
+        for token, token_id in self.token_ids.items():
+            token_grams = trigrams(token)
+            self.token_grams[token_id] = len(token_grams)
+            for gram in token_grams:
+                grams.setdefault(gram, []).append(token_id)
+        self.gram_tokens = {gram: np.array(ids, dtype=np.int32) for gram, ids in grams.items()}
+
+        # Every prefix a short query could be one edit away from, with its one-letter deletions
+        self.words = self.vocabulary.tolist()
+        self.deletion_tokens = {}
+        for token, token_id in self.token_ids.items():
+            for length in range(EDIT_MIN_LENGTH - 1, min(len(token), EDIT_MAX_LENGTH + 1) + 1):
+                for variant in deletions(token[:length]):
+                    self.deletion_tokens.setdefault(variant, set()).add(token_id)
+
+    def _prefix_range(self, token: str) -> tuple:
+        lo = int(np.searchsorted(self.vocabulary, token, side="left"))
+        hi = int(np.searchsorted(self.vocabulary, token + "\uffff", side="left"))
+        return lo, hi
+
+    def _fuzzy_tokens(self, token: str) -> tuple:
+        """Vocabulary tokens whose trigram Dice similarity to token passes the threshold"""
+        query_grams = trigrams(token)
+        hits = [self.gram_tokens[gram] for gram in query_grams if gram in self.gram_tokens]
+        if not hits:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        token_ids, shared = np.unique(np.concatenate(hits), return_counts=True)
+        dice = 2.0 * shared / (len(query_grams) + self.token_grams[token_ids])
+        keep = dice >= FUZZY_THRESHOLD
+        return token_ids[keep], dice[keep].astype(np.float32)
+
+    def _edit_tokens(self, token: str) -> tuple:
+        """Vocabulary tokens one edit away from token, or starting one edit away from it
+
+        Whole words score 1 - 1 / len(token), words matched on a prefix
+        PREFIX_SCORE times that.
+        """
+        candidates = set()
+        for variant in deletions(token):
+            candidates.update(self.deletion_tokens.get(variant, ()))
+        similarity = 1.0 - 1.0 / len(token)
+        token_ids, scores = [], []
+        for token_id in candidates:
+            word = self.words[token_id]
+            if within_one_edit(token, word):
+                score = similarity
+            elif any(within_one_edit(token, word[:n]) for n in range(len(token) - 1, len(token) + 2) if n < len(word)):
+                score = PREFIX_SCORE * similarity
+            else:
+                continue
+            token_ids.append(token_id)
+            scores.append(score)
+        return np.array(token_ids, dtype=np.int32), np.array(scores, dtype=np.float32)
+
+    def _token_scores(self, token: str) -> np.ndarray:
+        """Best match score of one query token against every food"""
+        scores = np.zeros(len(self.catalog), dtype=np.float32)
+        lo, hi = self._prefix_range(token)
+        if hi > lo:
+            start, stop = self.indptr[lo], self.indptr[hi]
+            values = np.full(stop - start, PREFIX_SCORE, dtype=np.float32)
+            exact = self.token_ids.get(token)
+            if exact is not None:
+                values[self.indptr[exact] - start:self.indptr[exact + 1] - start] = EXACT_SCORE
+            values += LEADING_BONUS * self.leading[start:stop]
+            np.maximum.at(scores, self.rows[start:stop], values)
+
+        if len(token) >= FUZZY_MIN_LENGTH:
+            token_ids, similarity = self._fuzzy_tokens(token)
+            if EDIT_MIN_LENGTH <= len(token) <= EDIT_MAX_LENGTH:
+                edit_ids, edit_similarity = self._edit_tokens(token)
+                token_ids = np.concatenate([token_ids, edit_ids])
+                similarity = np.concatenate([similarity, edit_similarity])
+            outside = (token_ids < lo) | (token_ids >= hi)
+            for token_id, sim in zip(token_ids[outside], similarity[outside]):
+                start, stop = self.indptr[token_id], self.indptr[token_id + 1]
+                values = FUZZY_SCORE * sim + LEADING_BONUS * self.leading[start:stop]
+                np.maximum.at(scores, self.rows[start:stop], values)
+        return scores
+
+    def search(self, query: str, k: int = 10) -> list:
+        """Top k foods for a query, each with its match score
+
+        Foods matching the most query tokens win; within those, the summed
+        token scores rank them.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or len(self.catalog) == 0:
+            return []
+
+        token_scores = np.stack([self._token_scores(token) for token in tokens])
+        matched = (token_scores > 0).sum(axis=0)
+        best = matched.max()
+        if best == 0:
+            return []
+
+        candidates = np.flatnonzero(matched == best)
+        scores = token_scores[:, candidates].sum(axis=0) - self.length_penalty[candidates]
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for i in top:
+            food = self.catalog.foods[candidates[i]]
+            results.append({
+                **{name: food[column] for name, column in FOOD_FIELDS.items()},
+                "score": round(float(scores[i]), 4),
+            })
+        return results
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> FoodSearchIndex:
+    """Return the search index for the current catalog, building it on first use"""
+    global _index
+    catalog = get_catalog()
+    if _index is None or _index.catalog is not catalog:
+        with _index_lock:
+            if _index is None or _index.catalog is not catalog:
+                _index = FoodSearchIndex(catalog)
+    return _index
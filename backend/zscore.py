@@ -0,0 +1,190 @@
+import os
+import threading
+import numpy as np
+
+
+# ======================
+# WHO Z-Score Tables
+# ======================
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# (gender, table) -> (file name, height column)
+WHO_TABLE_FILES = {
+    ("l", "wfl"): ("wfl_boys_0-to-2-years_zscores.xlsx", "Length"),
+    ("p", "wfl"): ("wfl_girls_0-to-2-years_zscores.xlsx", "Length"),
+    ("l", "wfh"): ("wfh_boys_2-to-5-years_zscores.xlsx", "Height"),
+    ("p", "wfh"): ("wfh_girls_2-to-5-years_zscores.xlsx", "Height"),
+}
+
+# Keys returned by a lookup and the WHO column each one is read from
+ZSCORE_COLUMNS = {
+    "SD-3": "SD2neg",
+    "SD-2": "SD2neg",
+    "SD-1": "SD1neg",
+    "Median": "SD0",
+    "SD+1": "SD1",
+    "SD+2": "SD2",
+    "SD+3": "SD3",
+}
+ZSCORE_KEYS = list(ZSCORE_COLUMNS)
+
+NUTRITION_STATUSES = np.array([
+    "severely low",
+    "low",
+    "good",
+    "possible risk of excessive",
+    "excessive",
+    "obese",
+])
+
+
+def table_key(age_months: int, gender: str) -> tuple:
+    """Pick the WHO table used for an age and gender"""
+    return ("l" if gender.lower() == "l" else "p", "wfl" if age_months <= 24 else "wfh")
+
+
+class ZScoreTable:
+    """One WHO table as sorted NumPy arrays keyed by length/height"""
+
+    def __init__(self, heights: np.ndarray, values: np.ndarray, lms: np.ndarray):
+        order = np.argsort(heights, kind="stable")
+        self.heights = np.ascontiguousarray(heights[order], dtype=np.float64)
+        self.values = np.ascontiguousarray(values[order], dtype=np.float64)
+        self.lms = np.ascontiguousarray(lms[order], dtype=np.float64)
+
+    @classmethod
+    def from_excel(cls, file_path: str, height_col: str) -> "ZScoreTable":
+        import pandas as pd
+
+        df = pd.read_excel(file_path)
+        return cls(
+            df[height_col].to_numpy(),
+            df[list(ZSCORE_COLUMNS.values())].to_numpy(),
+            df[["L", "M", "S"]].to_numpy(),
+        )
+
+    def nearest_index(self, heights_cm) -> np.ndarray:
+        """Index of the closest row for each height (lower row wins ties)"""
+        heights_cm = np.asarray(heights_cm, dtype=np.float64)
+        right = np.clip(np.searchsorted(self.heights, heights_cm), 1, len(self.heights) - 1)
+        left = right - 1
+        take_left = (heights_cm - self.heights[left]) <= (self.heights[right] - heights_cm)
+        return np.where(take_left, left, right)
+
+    def _interpolate(self, columns: np.ndarray, heights_cm) -> np.ndarray:
+        heights_cm = np.clip(np.asarray(heights_cm, dtype=np.float64), self.heights[0], self.heights[-1])
+        right = np.clip(np.searchsorted(self.heights, heights_cm), 1, len(self.heights) - 1)
+        left = right - 1
+        span = self.heights[right] - self.heights[left]
+        weight = ((heights_cm - self.heights[left]) / span)[..., None]
+        return columns[left] + (columns[right] - columns[left]) * weight
+
+    def lookup(self, heights_cm, interpolate: bool = False) -> np.ndarray:
+        """Z-score cut-offs (columns ordered as ZSCORE_KEYS) for one or many heights"""
+        if interpolate:
+            return self._interpolate(self.values, heights_cm)
+        return self.values[self.nearest_index(heights_cm)]
+
+    def zscores(self, heights_cm, weights_kg) -> np.ndarray:
+        """Weight-for-length/height z-scores from the interpolated LMS parameters
+
+        Beyond +/-3 SD the WHO restricted adjustment is applied, measuring the
+        excess in units of the distance between the 2 and 3 SD curves.
+        """
+        weights_kg = np.asarray(weights_kg, dtype=np.float64)
+        lms = self._interpolate(self.lms, heights_cm)
+        l, m, s = lms[..., 0], lms[..., 1], lms[..., 2]
+        z = ((weights_kg / m) ** l - 1) / (l * s)
+
+        sd = lambda k: m * (1 + l * s * k) ** (1 / l)
+        sd3, sd2, sd3neg, sd2neg = sd(3), sd(2), sd(-3), sd(-2)
+        z = np.where(z > 3, 3 + (weights_kg - sd3) / (sd3 - sd2), z)
+        z = np.where(z < -3, -3 + (weights_kg - sd3neg) / (sd2neg - sd3neg), z)
+        return z
+
+
+class ZScoreEngine:
+    """The four WHO weight-for-length/height tables loaded once"""
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+
+    @classmethod
+    def load(cls, data_dir: str = DATA_DIR) -> "ZScoreEngine":
+        return cls({
+            key: ZScoreTable.from_excel(os.path.join(data_dir, file_name), height_col)
+            for key, (file_name, height_col) in WHO_TABLE_FILES.items()
+        })
+
+    def lookup(self, age_months: int, gender: str, height_cm: float, interpolate: bool = False) -> dict:
+        """Z-score cut-offs for a single child"""
+        row = self.tables[table_key(age_months, gender)].lookup(height_cm, interpolate)
+        return {key: float(value) for key, value in zip(ZSCORE_KEYS, row)}
+
+    def lookup_batch(self, ages_months, genders, heights_cm, interpolate: bool = False) -> np.ndarray:
+        """Z-score cut-offs for many children, shape (n, len(ZSCORE_KEYS))"""
+        ages_months = np.asarray(ages_months)
+        genders = np.char.lower(np.asarray(genders, dtype=str))
+        heights_cm = np.asarray(heights_cm, dtype=np.float64)
+
+        cutoffs = np.empty((len(heights_cm), len(ZSCORE_KEYS)), dtype=np.float64)
+        is_boy = genders == "l"
+        is_infant = ages_months <= 24
+        for (gender, kind), table in self.tables.items():
+            mask = (is_boy if gender == "l" else ~is_boy) & (is_infant if kind == "wfl" else ~is_infant)
+            if mask.any():
+                cutoffs[mask] = table.lookup(heights_cm[mask], interpolate)
+        return cutoffs
+
+    def zscore_batch(self, ages_months, genders, heights_cm, weights_kg) -> np.ndarray:
+        """Weight-for-length/height z-score for many children"""
+        ages_months = np.asarray(ages_months)
+        genders = np.char.lower(np.asarray(genders, dtype=str))
+        heights_cm = np.asarray(heights_cm, dtype=np.float64)
+        weights_kg = np.asarray(weights_kg, dtype=np.float64)
+
+        z = np.empty(len(heights_cm), dtype=np.float64)
+        is_boy = genders == "l"
+        is_infant = ages_months <= 24
+        for (gender, kind), table in self.tables.items():
+            mask = (is_boy if gender == "l" else ~is_boy) & (is_infant if kind == "wfl" else ~is_infant)
+            if mask.any():
+                z[mask] = table.zscores(heights_cm[mask], weights_kg[mask])
+        return z
+
+    def classify_batch(self, ages_months, genders, heights_cm, weights_kg, interpolate: bool = False) -> np.ndarray:
+        """Nutrition status for many children in one vectorized pass"""
+        cutoffs = self.lookup_batch(ages_months, genders, heights_cm, interpolate)
+        weights_kg = np.asarray(weights_kg, dtype=np.float64)
+        column = {key: cutoffs[:, i] for i, key in enumerate(ZSCORE_KEYS)}
+        status_index = np.select(
+            [
+                weights_kg < column["SD-3"],
+                weights_kg < column["SD-2"],
+                weights_kg <= column["SD+1"],
+                weights_kg <= column["SD+2"],
+                weights_kg <= column["SD+3"],
+            ],
+            [0, 1, 2, 3, 4],
+            default=5,
+        )
+        return NUTRITION_STATUSES[status_index]
+
+    def classify(self, age_months: int, gender: str, height_cm: float, weight_kg: float) -> str:
+        """Nutrition status for a single child"""
+        return str(self.classify_batch([age_months], [gender], [height_cm], [weight_kg])[0])
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_zscore_engine() -> ZScoreEngine:
+    """Return the process-wide z-score engine, loading the tables on first use"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ZScoreEngine.load()
+    return _engine
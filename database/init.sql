@@ -1,6 +1,14 @@
+-- WWEIA food categories (What We Eat in America)
+CREATE TABLE food_categories (
+    code INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL
+);
+
 CREATE TABLE foods (
     id SERIAL PRIMARY KEY,
-    name VARCHAR(255) NOT NULL
+    name VARCHAR(255) NOT NULL,
+    category_code INT,
+    FOREIGN KEY (category_code) REFERENCES food_categories (code)
 );
 
 CREATE TABLE ingredients (
@@ -30,17 +38,70 @@ CREATE TABLE users (
             'good',
             'obese'
         )
-    )
+    ),
+    profile_version INT NOT NULL DEFAULT 1,
+    -- Bumped when the user's ingredient exclusions or need overrides change
+    preferences_version INT NOT NULL DEFAULT 1
 );
 
+-- Range partitioned by month: today's reads touch one small partition and
+-- old months can be archived by detaching them
 CREATE TABLE food_histories (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     f_id INT NOT NULL,
     u_id INT NOT NULL,
-    date TIMESTAMP,
+    date TIMESTAMP NOT NULL,
+    PRIMARY KEY (id, date),
     FOREIGN KEY (f_id) REFERENCES foods (id),
     FOREIGN KEY (u_id) REFERENCES users (id)
-);
+) PARTITION BY RANGE (date);
+
+-- Catches rows outside every monthly partition
+CREATE TABLE food_histories_default PARTITION OF food_histories DEFAULT;
+
+-- Today's foods for a user; f_id is included so the lookup is index-only
+CREATE INDEX food_histories_u_id_date_idx ON food_histories (u_id, date) INCLUDE (f_id);
+
+-- Create the monthly partitions food_histories_YYYY_MM for the given number
+-- of months from start_month, moving any matching rows out of the default
+-- partition first. Returns the names of the partitions it created. Callers
+-- are serialized by an advisory lock, so workers starting together do not race
+-- on the same CREATE TABLE.
+CREATE OR REPLACE FUNCTION ensure_food_histories_partitions(start_month DATE, months INT)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    lower_bound DATE;
+    upper_bound DATE;
+    partition_name TEXT;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('ensure_food_histories_partitions'));
+    FOR i IN 0..months - 1 LOOP
+        lower_bound := date_trunc('month', start_month) + make_interval(months => i);
+        upper_bound := lower_bound + interval '1 month';
+        partition_name := 'food_histories_' || to_char(lower_bound, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE food_histories INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+            partition_name
+        );
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM food_histories_default WHERE date >= %L AND date < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            lower_bound, upper_bound, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE food_histories ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower_bound, upper_bound
+        );
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$;
+
+-- This month and the FOOD_HISTORY_MONTHS_AHEAD (3) after it, as at API startup
+SELECT ensure_food_histories_partitions(CURRENT_DATE, 4);
 
 CREATE TABLE food_ingredients (
     id SERIAL PRIMARY KEY,
@@ -59,7 +120,7 @@ CREATE TABLE food_nutritions (
     value FLOAT NOT NULL,
     FOREIGN KEY (f_id) REFERENCES foods (id),
     FOREIGN KEY (n_id) REFERENCES nutritions (id),
-    UNIQUE (f_id, n_id)
+    UNIQUE (f_id, n_id) INCLUDE (value)
 );
 
 CREATE TABLE user_minimum_nutritions (
@@ -67,9 +128,33 @@ CREATE TABLE user_minimum_nutritions (
     u_id INT NOT NULL,
     n_id INT NOT NULL,
     value FLOAT NOT NULL,
+    -- 'clinician' for overrides set through the API; rows copied from the
+    -- computed needs before they were resolved at read time are 'computed'
+    -- and ignored
+    source VARCHAR(10) NOT NULL DEFAULT 'computed' CHECK (source IN ('computed', 'clinician')),
     FOREIGN KEY (u_id) REFERENCES users (id),
     FOREIGN KEY (n_id) REFERENCES nutritions (id),
-    UNIQUE (u_id, n_id)
+    UNIQUE (u_id, n_id) INCLUDE (value, source)
+);
+
+-- Read-only mirror of helper.MINIMUM_NEEDS for reporting; the API resolves
+-- needs in memory and user_minimum_nutritions only holds clinician overrides
+CREATE TABLE minimum_needs (
+    age_band VARCHAR(10) NOT NULL,
+    nutrition_status VARCHAR(50) NOT NULL,
+    n_id INT NOT NULL,
+    value FLOAT NOT NULL,
+    FOREIGN KEY (n_id) REFERENCES nutritions (id),
+    PRIMARY KEY (age_band, nutrition_status, n_id)
+);
+
+-- Ingredients a parent wants kept out of a child's recommendations
+CREATE TABLE user_ingredient_exclusions (
+    u_id INT NOT NULL,
+    i_id INT NOT NULL,
+    FOREIGN KEY (u_id) REFERENCES users (id),
+    FOREIGN KEY (i_id) REFERENCES ingredients (id),
+    PRIMARY KEY (u_id, i_id)
 );
 
 CREATE TABLE user_growth_records (
@@ -90,12 +175,39 @@ CREATE TABLE user_growth_records (
     date TIMESTAMP
 );
 
-CREATE OR REPLACE VIEW food_beverages AS
+-- First record of each month per user, read in index order by /track_record
+CREATE INDEX user_growth_records_u_id_month_idx ON user_growth_records (
+    u_id,
+    date_trunc('month', date) DESC,
+    date,
+    id
+) INCLUDE (weight, height, nutrition_status);
+
+-- Per user and day nutrient totals, kept in step with food_histories by the
+-- API so intake reads are a single row lookup
+CREATE TABLE user_daily_intake (
+    u_id INT NOT NULL,
+    date DATE NOT NULL,
+    calcium FLOAT NOT NULL DEFAULT 0,
+    carbohydrate FLOAT NOT NULL DEFAULT 0,
+    energy FLOAT NOT NULL DEFAULT 0,
+    iron FLOAT NOT NULL DEFAULT 0,
+    protein FLOAT NOT NULL DEFAULT 0,
+    fat FLOAT NOT NULL DEFAULT 0,
+    food_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (u_id, date),
+    FOREIGN KEY (u_id) REFERENCES users (id)
+);
+
+-- Food catalog with ingredients and pivoted nutrients, materialized so reads
+-- are index probes instead of re-running the aggregation. Refresh it with
+-- SELECT refresh_food_beverages(); after loading or changing catalog data.
+CREATE MATERIALIZED VIEW food_beverages AS
 WITH
     ingredient_agg AS (
         SELECT
             fi.f_id,
-            array_agg(i.id::text) AS i_ids,
+            array_agg(i.id ORDER BY i.id) AS i_ids,
             array_agg(
                 regexp_replace(
                     regexp_replace(
@@ -104,6 +216,7 @@ WITH
                     ),
                     '\s+', '_', 'g'
                 )
+                ORDER BY i.id
             ) AS i_names
         FROM
             food_ingredients fi
@@ -114,6 +227,7 @@ WITH
 SELECT
     f.id AS f_id,
     f.name AS f_name,
+    f.category_code AS category,
     ia.i_ids,
     ia.i_names,
     MAX(
@@ -154,10 +268,202 @@ FROM
 GROUP BY
     f.id,
     f.name,
+    f.category_code,
     ia.i_ids,
-    ia.i_names;
+    ia.i_names
+WITH NO DATA;
+
+CREATE UNIQUE INDEX food_beverages_f_id_idx ON food_beverages (f_id);
+
+CREATE OR REPLACE FUNCTION refresh_food_beverages() RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF (SELECT ispopulated FROM pg_matviews WHERE matviewname = 'food_beverages') THEN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY food_beverages;
+    ELSE
+        REFRESH MATERIALIZED VIEW food_beverages;
+    END IF;
+END;
+$$;
 -- Seeding
 
+-- Food Categories Data (WWEIA), every category number of foods.csv
+INSERT INTO
+    public.food_categories (code, name)
+VALUES (1002, 'Milk, whole'),
+    (1004, 'Milk, reduced fat'),
+    (1006, 'Milk, lowfat'),
+    (1008, 'Milk, nonfat'),
+    (1202, 'Flavored milk, whole'),
+    (1204, 'Flavored milk, reduced fat'),
+    (1206, 'Flavored milk, lowfat'),
+    (1208, 'Flavored milk, nonfat'),
+    (1402, 'Milk shakes and other dairy drinks'),
+    (1602, 'Cheese'),
+    (1604, 'Cottage/ricotta cheese'),
+    (1820, 'Yogurt, regular'),
+    (1822, 'Yogurt, Greek'),
+    (1902, 'Plant-based milk'),
+    (1904, 'Plant-based yogurt'),
+    (2002, 'Beef, excludes ground'),
+    (2004, 'Ground beef'),
+    (2006, 'Pork'),
+    (2008, 'Lamb, goat, game'),
+    (2010, 'Liver and organ meats'),
+    (2202, 'Chicken, whole pieces'),
+    (2204, 'Chicken patties, nuggets and tenders'),
+    (2206, 'Turkey, duck, other poultry'),
+    (2402, 'Fish'),
+    (2404, 'Shellfish'),
+    (2502, 'Eggs and omelets'),
+    (2602, 'Cold cuts and cured meats'),
+    (2604, 'Bacon'),
+    (2606, 'Frankfurters'),
+    (2608, 'Sausages'),
+    (2802, 'Beans, peas, legumes'),
+    (2804, 'Nuts and seeds'),
+    (2806, 'Soy and meat-alternative products'),
+    (3002, 'Meat mixed dishes'),
+    (3004, 'Poultry mixed dishes'),
+    (3006, 'Seafood mixed dishes'),
+    (3102, 'Bean, pea, legume dishes'),
+    (3104, 'Vegetable dishes'),
+    (3202, 'Rice mixed dishes'),
+    (3204, 'Pasta mixed dishes, excludes macaroni and cheese'),
+    (3206, 'Macaroni and cheese'),
+    (3208, 'Turnovers and other grain-based items'),
+    (3402, 'Fried rice and lo/chow mein'),
+    (3404, 'Stir-fry and soy-based sauce mixtures'),
+    (3406, 'Egg rolls, dumplings, sushi'),
+    (3502, 'Burritos and tacos'),
+    (3504, 'Nachos'),
+    (3506, 'Other Mexican mixed dishes'),
+    (3602, 'Pizza'),
+    (3702, 'Burgers'),
+    (3703, 'Frankfurter sandwiches'),
+    (3704, 'Chicken fillet sandwiches'),
+    (3706, 'Egg/breakfast sandwiches'),
+    (3720, 'Cheese sandwiches'),
+    (3722, 'Peanut butter and jelly sandwiches'),
+    (3730, 'Seafood sandwiches'),
+    (3740, 'Deli and cured meat sandwiches'),
+    (3742, 'Meat and BBQ sandwiches'),
+    (3744, 'Vegetable sandwiches/burgers'),
+    (3804, 'Soups, broth-based'),
+    (3806, 'Soups, cream-based'),
+    (3808, 'Ramen and Asian broth-based soups'),
+    (4002, 'Rice'),
+    (4004, 'Pasta, noodles, cooked grains'),
+    (4202, 'Yeast breads'),
+    (4204, 'Rolls and buns'),
+    (4206, 'Bagels and English muffins'),
+    (4208, 'Tortillas'),
+    (4402, 'Biscuits, muffins, quick breads'),
+    (4404, 'Pancakes, waffles, French toast'),
+    (4602, 'Ready-to-eat cereal, higher sugar (>21.2g/100g)'),
+    (4604, 'Ready-to-eat cereal, lower sugar (=<21.2g/100g)'),
+    (4802, 'Oatmeal'),
+    (4804, 'Grits and other cooked cereals'),
+    (5002, 'Potato chips'),
+    (5004, 'Tortilla, corn, other chips'),
+    (5006, 'Popcorn'),
+    (5008, 'Pretzels/snack mix'),
+    (5202, 'Crackers, excludes saltines'),
+    (5204, 'Saltine crackers'),
+    (5402, 'Cereal bars'),
+    (5404, 'Nutrition bars'),
+    (5502, 'Cakes and pies'),
+    (5504, 'Cookies and brownies'),
+    (5506, 'Doughnuts, sweet rolls, pastries'),
+    (5702, 'Candy containing chocolate'),
+    (5704, 'Candy not containing chocolate'),
+    (5802, 'Ice cream and frozen dairy desserts'),
+    (5804, 'Pudding'),
+    (5806, 'Gelatins, ices, sorbets'),
+    (6002, 'Apples'),
+    (6004, 'Bananas'),
+    (6006, 'Grapes'),
+    (6008, 'Peaches and nectarines'),
+    (6009, 'Strawberries'),
+    (6011, 'Blueberries and other berries'),
+    (6012, 'Citrus fruits'),
+    (6014, 'Melons'),
+    (6016, 'Dried fruits'),
+    (6018, 'Other fruits and fruit salads'),
+    (6020, 'Pears'),
+    (6022, 'Pineapple'),
+    (6024, 'Mango and papaya'),
+    (6402, 'Tomatoes'),
+    (6404, 'Carrots'),
+    (6406, 'Other red and orange vegetables'),
+    (6407, 'Broccoli'),
+    (6409, 'Spinach'),
+    (6410, 'Lettuce and lettuce salads'),
+    (6411, 'Other dark green vegetables'),
+    (6412, 'String beans'),
+    (6413, 'Cabbage'),
+    (6414, 'Onions'),
+    (6416, 'Corn'),
+    (6418, 'Other starchy vegetables'),
+    (6420, 'Other vegetables and combinations'),
+    (6430, 'Fried vegetables'),
+    (6432, 'Coleslaw, non-lettuce salads'),
+    (6489, 'Vegetables on a sandwich'),
+    (6802, 'White potatoes, baked or boiled'),
+    (6804, 'French fries and other fried white potatoes'),
+    (6806, 'Mashed potatoes and white potato mixtures'),
+    (7002, 'Citrus juice'),
+    (7004, 'Apple juice'),
+    (7006, 'Other fruit juice'),
+    (7008, 'Vegetable juice'),
+    (7102, 'Diet soft drinks'),
+    (7104, 'Diet sport and energy drinks'),
+    (7106, 'Other diet drinks'),
+    (7202, 'Soft drinks'),
+    (7204, 'Fruit drinks'),
+    (7206, 'Sport and energy drinks'),
+    (7208, 'Nutritional beverages'),
+    (7220, 'Smoothies and grain drinks'),
+    (7302, 'Coffee'),
+    (7304, 'Tea'),
+    (7502, 'Beer'),
+    (7504, 'Wine'),
+    (7506, 'Liquor and cocktails'),
+    (7702, 'Tap water'),
+    (7704, 'Bottled water'),
+    (7802, 'Flavored or carbonated water'),
+    (7804, 'Enhanced water'),
+    (8002, 'Butter and animal fats'),
+    (8004, 'Margarine'),
+    (8006, 'Cream cheese, sour cream, whipped cream'),
+    (8008, 'Cream and cream substitutes'),
+    (8010, 'Mayonnaise'),
+    (8012, 'Salad dressings and vegetable oils'),
+    (8402, 'Tomato-based condiments'),
+    (8404, 'Soy-based condiments'),
+    (8406, 'Mustard and other condiments'),
+    (8408, 'Olives, pickles, pickled vegetables'),
+    (8410, 'Pasta sauces, tomato-based'),
+    (8412, 'Dips, gravies, other sauces'),
+    (8802, 'Sugars and honey'),
+    (8804, 'Sugar substitutes'),
+    (8806, 'Jams, syrups, toppings'),
+    (9002, 'Baby food: cereals'),
+    (9004, 'Baby food: fruit'),
+    (9006, 'Baby food: vegetables'),
+    (9007, 'Baby food: mixtures'),
+    (9008, 'Baby food: meat and dinners'),
+    (9010, 'Baby food: yogurt'),
+    (9012, 'Baby food: snacks and sweets'),
+    (9202, 'Baby juice'),
+    (9204, 'Baby water'),
+    (9402, 'Formula, ready-to-feed'),
+    (9404, 'Formula, prepared from powder'),
+    (9602, 'Human milk'),
+    (9802, 'Protein and nutritional powders'),
+    (9999, 'Not included in a food category'),
+    (14555, 'Water, bottled, generic');
+
 -- Foods Data
 INSERT INTO
     public.foods (name)
@@ -3390,6 +3696,1326 @@ VALUES (
     ('Water, baby'),
     ('Fruit juice, acai blend');
 
+-- Food Categories of Foods, from the WWEIA Category number in foods.csv
+UPDATE
+    public.foods f
+SET
+    category_code = c.code
+FROM (
+    VALUES ('Milk, NFS', 1004),
+        ('Milk, whole', 1002),
+        ('Milk, reduced fat (2%)', 1004),
+        ('Milk, low fat (1%)', 1006),
+        ('Milk, fat free (skim)', 1008),
+        ('Milk, lactose free, low fat (1%)', 1006),
+        ('Milk, lactose free, fat free (skim)', 1008),
+        ('Milk, lactose free, reduced fat (2%)', 1004),
+        ('Milk, lactose free, whole', 1002),
+        ('Buttermilk', 1002),
+        ('Kefir', 1006),
+        ('Goat milk', 1002),
+        ('Milk, dry, reconstituted, nonfat', 1008),
+        ('Milk, dry, reconstituted, whole', 1002),
+        ('Milk, evaporated, NS as to fat content', 1002),
+        ('Milk, evaporated, whole', 1002),
+        ('Milk, evaporated, reduced fat (2%)', 1004),
+        ('Milk, evaporated, fat free (skim)', 1008),
+        ('Yogurt, NFS', 1820),
+        ('Yogurt, Greek, NS as to type of milk or flavor', 1822),
+        ('Yogurt, NS as to type of milk or flavor', 1820),
+        ('Yogurt, NS as to type of milk, plain', 1820),
+        ('Yogurt, whole milk, plain', 1820),
+        ('Yogurt, low fat milk, plain', 1820),
+        ('Yogurt, nonfat milk, plain', 1820),
+        ('Yogurt, Greek, NS as to type of milk, plain', 1822),
+        ('Yogurt, Greek, whole milk, plain', 1822),
+        ('Yogurt, Greek, low fat milk, plain', 1822),
+        ('Yogurt, Greek, nonfat milk, plain', 1822),
+        ('Yogurt, NS as to type of milk, fruit', 1820),
+        ('Yogurt, whole milk, fruit', 1820),
+        ('Yogurt, low fat milk, fruit', 1820),
+        ('Yogurt, nonfat milk, fruit', 1820),
+        ('Yogurt, Greek, NS as to type of milk, fruit', 1822),
+        ('Yogurt, Greek, whole milk, fruit', 1822),
+        ('Yogurt, Greek, low fat milk, fruit', 1822),
+        ('Yogurt, Greek, nonfat milk, fruit', 1822),
+        ('Yogurt, NS as to type of milk, flavors other than fruit', 1820),
+        ('Yogurt, whole milk, flavors other than fruit', 1820),
+        ('Yogurt, low fat milk, flavors other than fruit', 1820),
+        ('Yogurt, nonfat milk, flavors other than fruit', 1820),
+        ('Yogurt, Greek, NS as to type of milk, flavors other than fruit', 1822),
+        ('Yogurt, Greek, whole milk, flavors other than fruit', 1822),
+        ('Yogurt, Greek, low fat milk, flavors other than fruit', 1822),
+        ('Yogurt, Greek, nonfat milk, flavors other than fruit', 1822),
+        ('Yogurt, Greek, with oats', 1822),
+        ('Yogurt, liquid', 1820),
+        ('Yogurt tube', 1820),
+        ('Yogurt parfait, with fruit', 1820),
+        ('Baby Toddler food, NFS', 9007),
+        ('Baby Toddler yogurt, plain', 9010),
+        ('Baby Toddler yogurt, with fruit', 9010),
+        ('Infant formula, NFS', 9404),
+        ('Infant formula, Similac, NFS', 9404),
+        ('Infant formula, Similac Alimentum, ready-to-feed', 9402),
+        ('Infant formula, Similac Alimentum, powder, made with water', 9404),
+        ('Infant formula, Similac Advance, ready-to-feed', 9402),
+        ('Infant formula, Similac Advance, powder, made with tap water', 9404),
+        ('Infant formula, Similac Advance, powder, made with bottled water', 9404),
+        ('Infant formula, Similac Advance, powder, made with baby water', 9404),
+        ('Infant formula, Similac Sensitive, ready-to-feed', 9402),
+        ('Infant formula, Similac Sensitive, powder, made with tap water', 9404),
+        ('Infant formula, Similac Sensitive, powder, made with bottled water', 9404),
+        ('Infant formula, Similac Sensitive, powder, made with baby water', 9404),
+        ('Infant formula, Similac for Spit-Up, ready-to-feed', 9402),
+        ('Infant formula, Similac for Spit-Up, powder, made with water', 9404),
+        ('Toddler formula, Similac Go and Grow', 9404),
+        ('Infant formula, Enfamil, NFS', 9404),
+        ('Infant formula, Enfamil Infant, ready-to-feed', 9402),
+        ('Infant formula, Enfamil Infant, powder, made with tap water', 9404),
+        ('Infant formula, Enfamil Infant, powder, made with bottled water', 9404),
+        ('Infant formula, Enfamil Infant, powder, made with baby water', 9404),
+        ('Infant formula, Enfamil AR, ready-to-feed', 9402),
+        ('Infant formula, Enfamil AR, powder, made with water', 9404),
+        ('Infant formula, Enfamil Gentlease, ready-to-feed', 9402),
+        ('Infant formula, Enfamil Gentlease, powder, made with tap water', 9404),
+        ('Infant formula, Enfamil Gentlease, powder, made with bottled water', 9404),
+        ('Infant formula, Enfamil Gentlease, powder, made with baby water', 9404),
+        ('Toddler formula, Enfamil Enfagrow', 9404),
+        ('Toddler formula, PediaSure', 9402),
+        ('Toddler formula, Nido Kinder', 9404),
+        ('Toddler formula, store brand, beginning or next stage', 9404),
+        ('Toddler formula, store brand, pediatric shake', 9404),
+        ('Infant formula, Gerber, NFS', 9404),
+        ('Infant formula, Gerber Good Start Gentle, Stage 1, ready-to-feed', 9402),
+        ('Infant formula, Gerber Good Start Gentle, Stage 1, powder, made with tap water', 9404),
+        ('Infant formula, Gerber Good Start Gentle, Stage 1, powder, made with bottled water', 9404),
+        ('Infant formula, Gerber Good Start Gentle, Stage 1, powder, made with baby water', 9404),
+        ('Infant formula, Gerber Good Start Gentle, Stage 2', 9404),
+        ('Toddler formula, Gerber Good Start, Stage 3', 9404),
+        ('Infant formula, premature, powder, made with water', 9404),
+        ('Infant formula, premature, ready-to-feed', 9402),
+        ('Infant formula, organic, powder, made with water', 9404),
+        ('Infant formula, organic, ready-to-feed', 9402),
+        ('Infant formula, store brand, advantage or tender, powder, made with tap water', 9404),
+        ('Infant formula, store brand, advantage or tender, powder, made with bottled water', 9404),
+        ('Infant formula, store brand, advantage or tender, powder, made with baby water', 9404),
+        ('Infant formula, store brand, gentle or sensitivity', 9404),
+        ('Infant formula, store brand, added rice', 9404),
+        ('Infant formula, Enfamil ProSobee, ready-to-feed', 9402),
+        ('Infant formula, Enfamil ProSobee, powder, made with tap water', 9404),
+        ('Infant formula, Enfamil ProSobee, powder, made with bottled water', 9404),
+        ('Infant formula, Enfamil ProSobee, powder, made with baby water', 9404),
+        ('Infant formula, Similac Isomil Soy, ready-to-feed', 9402),
+        ('Infant formula, Similac Isomil Soy, powder, made with tap water', 9404),
+        ('Infant formula, Similac Isomil Soy, powder, made with bottled water', 9404),
+        ('Infant formula, Similac Isomil Soy, powder, made with baby water', 9404),
+        ('Infant formula, Similac for Diarrhea', 9402),
+        ('Infant formula, Gerber Good Start Soy, Stage 1, ready-to-feed', 9402),
+        ('Infant formula, Gerber Good Start Soy, Stage 1, powder, made with tap water', 9404),
+        ('Infant formula, Gerber Good Start Soy, Stage 1, powder, made with bottled water', 9404),
+        ('Infant formula, Gerber Good Start Soy, Stage 1, powder, made with baby water', 9404),
+        ('Infant formula, store brand, soy', 9404),
+        ('Infant formula, Enfamil Nutramigen, ready-to-feed', 9402),
+        ('Infant formula, Enfamil Nutramigen, powder, made with water', 9404),
+        ('Infant formula, Enfamil Pregestimil, ready-to-feed', 9402),
+        ('Infant formula, Enfamil Pregestimil, powder, made with water', 9404),
+        ('Infant formula, amino acids', 9404),
+        ('Infant formula, low iron', 9404),
+        ('Pudding, chocolate, NFS', 5804),
+        ('Pudding, bread', 5804),
+        ('Pudding, flavors other than chocolate, NFS', 5804),
+        ('Custard', 5804),
+        ('Flan', 5804),
+        ('Creme brulee', 5804),
+        ('Pudding, rice', 5804),
+        ('Firni, Indian pudding', 5804),
+        ('Pudding, tapioca, made from dry mix', 5804),
+        ('Pudding, flavors other than chocolate, made from dry mix', 5804),
+        ('Pudding, chocolate, made from dry mix', 5804),
+        ('Pudding, flavors other than chocolate, made from dry mix, sugar free', 5804),
+        ('Pudding, chocolate, made from dry mix, sugar free', 5804),
+        ('Pudding, flavors other than chocolate, ready-to-eat', 5804),
+        ('Pudding, flavors other than chocolate, ready-to-eat, sugar free', 5804),
+        ('Pudding, chocolate, ready-to-eat', 5804),
+        ('Pudding, chocolate, ready-to-eat, sugar free', 5804),
+        ('Pudding, tapioca, ready-to-eat', 5804),
+        ('Banana pudding', 5804),
+        ('Mousse', 5804),
+        ('Dulce de leche', 5804),
+        ('Barfi or Burfi, Indian dessert', 5804),
+        ('Trifle', 5804),
+        ('Cheese souffle', 2502),
+        ('Baby Toddler meat, NFS', 9008),
+        ('Baby Toddler beef', 9008),
+        ('Baby Toddler ham', 9008),
+        ('Baby Toddler meat stick', 9008),
+        ('Baby Toddler chicken', 9008),
+        ('Baby Toddler turkey', 9008),
+        ('Greens with ham or pork', 6411),
+        ('Soup, meatball', 3804),
+        ('Soup, pho, with meat', 3808),
+        ('Soup, pho, no meat', 3808),
+        ('Soup, pepperpot', 3806),
+        ('Soup, beef, canned', 3804),
+        ('Soup, sopa or caldo de res', 3804),
+        ('Soup, pozole', 3804),
+        ('Soup, Italian wedding', 3804),
+        ('Soup, pork or ham', 3804),
+        ('Soup, broth', 3804),
+        ('Soup, chicken, canned', 3804),
+        ('Soup, chicken', 3804),
+        ('Soup, sopa or caldo de pollo', 3804),
+        ('Soup, hot and sour', 3808),
+        ('Soup, cream of chicken', 3806),
+        ('Soup, Manhattan clam chowder', 3804),
+        ('Soup, New England clam chowder', 3806),
+        ('Soup, bisque', 3806),
+        ('Soup, fish or shrimp', 3804),
+        ('Egg, whole, raw', 2502),
+        ('Egg, whole, cooked, NS as to cooking method', 2502),
+        ('Egg, whole, boiled or poached', 2502),
+        ('Egg, whole, fried, NS as to fat', 2502),
+        ('Egg, whole, fried no added fat', 2502),
+        ('Egg, whole, fried with margarine', 2502),
+        ('Egg, whole, fried with oil', 2502),
+        ('Egg, whole, fried with butter', 2502),
+        ('Egg, whole, fried with animal fat or meat drippings', 2502),
+        ('Egg, whole, fried with cooking spray', 2502),
+        ('Egg, whole, fried, NS as to fat type', 2502),
+        ('Egg, whole, fried, from fast food / restaurant', 2502),
+        ('Egg, whole, baked, NS as to fat', 2502),
+        ('Egg, whole, baked, no added fat', 2502),
+        ('Egg, whole, baked, fat added', 2502),
+        ('Egg, whole, pickled', 2502),
+        ('Egg, white only, raw', 2502),
+        ('Egg, white, cooked, NS as to fat', 2502),
+        ('Egg, white, cooked, no added fat', 2502),
+        ('Egg, white, cooked, fat added', 2502),
+        ('Egg, yolk only, raw', 2502),
+        ('Egg, yolk only, cooked, NS as to fat', 2502),
+        ('Egg, yolk only, cooked, no added fat', 2502),
+        ('Egg, yolk only, cooked, fat added', 2502),
+        ('Duck egg, cooked', 2502),
+        ('Goose egg, cooked', 2502),
+        ('Quail egg, canned', 2502),
+        ('Egg, creamed', 2502),
+        ('Egg, Benedict', 2502),
+        ('Egg, deviled', 2502),
+        ('Egg salad, made with mayonnaise', 2502),
+        ('Egg salad, made with light mayonnaise', 2502),
+        ('Egg salad, made with mayonnaise-type salad dressing', 2502),
+        ('Egg salad, made with light mayonnaise-type salad dressing', 2502),
+        ('Egg salad, made with creamy dressing', 2502),
+        ('Egg salad, made with light creamy dressing', 2502),
+        ('Egg salad, made with Italian dressing', 2502),
+        ('Egg salad, made with light Italian dressing', 2502),
+        ('Egg Salad, made with any type of fat free dressing', 2502),
+        ('Huevos rancheros', 2502),
+        ('Egg casserole with bread, cheese, milk and meat', 2502),
+        ('Egg omelet or scrambled egg, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, made with margarine', 2502),
+        ('Egg omelet or scrambled egg, made with oil', 2502),
+        ('Egg omelet or scrambled egg, made with butter', 2502),
+        ('Egg omelet or scrambled egg, made with animal fat or meat drippings', 2502),
+        ('Egg omelet or scrambled egg, made with cooking spray', 2502),
+        ('Egg omelet or scrambled egg, NS as to fat type', 2502),
+        ('Egg omelet or scrambled egg, no added fat', 2502),
+        ('Egg omelet or scrambled egg, from fast food / restaurant', 2502),
+        ('Egg omelet or scrambled egg, with cheese, made with margarine', 2502),
+        ('Egg omelet or scrambled egg, with cheese, made with oil', 2502),
+        ('Egg omelet or scrambled egg, with cheese, made with butter', 2502),
+        ('Egg omelet or scrambled egg, with cheese, made with animal fat or meat drippings', 2502),
+        ('Egg omelet or scrambled egg, with cheese, made with cooking spray', 2502),
+        ('Egg omelet or scrambled egg, with cheese, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with meat, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with meat, made with margarine', 2502),
+        ('Egg omelet or scrambled egg, with meat, made with oil', 2502),
+        ('Egg omelet or scrambled egg, with meat, made with butter', 2502),
+        ('Egg omelet or scrambled egg, with meat, made with animal fat or meat drippings', 2502),
+        ('Egg omelet or scrambled egg, with meat, made with cooking spray', 2502),
+        ('Egg omelet or scrambled egg, with meat, NS as to fat type', 2502),
+        ('Egg omelet or scrambled egg, with meat, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, made with margarine', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, made with oil', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, made with butter', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, made with animal fat or meat drippings', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, made with cooking spray', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, NS as to fat type', 2502),
+        ('Egg omelet or scrambled egg, with cheese and meat, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes and dark-green vegetables, no fat added', 2502),
+        ('Egg omelet or scrambled egg, with tomatoes and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with vegetables other than dark green and/or tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with vegetables other than dark green and/or tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with vegetables other than dark green and/or tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese and tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, tomatoes, and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese, tomatoes, and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, tomatoes, and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and vegetables other than dark green and/or tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese and vegetables other than dark green and/or tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese and vegetables other than dark green and/or tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with meat and tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with meat and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with meat, tomatoes, and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with meat, tomatoes, and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with meat, tomatoes, and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and vegetables other than dark-green and/or tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with meat and vegetables other than dark-green and/or tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with meat and vegetables other than dark-green and/or tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, tomatoes, and dark-green vegetables, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, tomatoes, and dark-green vegetables, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, tomatoes, and dark-green vegetables, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and vegetables other than dark-green and/or tomatoes, fat added', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and vegetables other than dark-green and/or tomatoes, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with cheese, meat, and vegetables other than dark-green and/or tomatoes, NS as to fat', 2502),
+        ('Egg omelet or scrambled egg, with potatoes and/or onions, fat added', 2502),
+        ('Egg omelet or scrambled egg, with potatoes and/or onions, no added fat', 2502),
+        ('Egg omelet or scrambled egg, with potatoes and/or onions, NS as to fat', 2502),
+        ('Soup, egg drop', 3808),
+        ('Egg white omelet, scrambled, or fried, NS as to fat', 2502),
+        ('Egg white omelet, scrambled, or fried, made with margarine', 2502),
+        ('Egg white omelet, scrambled, or fried, made with oil', 2502),
+        ('Egg white omelet, scrambled, or fried, made with butter', 2502),
+        ('Egg white omelet, scrambled, or fried, made with cooking spray', 2502),
+        ('Egg white omelet, scrambled, or fried, NS as to fat type', 2502),
+        ('Egg white omelet, scrambled, or fried, no added fat', 2502),
+        ('Egg white, omelet, scrambled, or fried, with cheese', 2502),
+        ('Egg white, omelet, scrambled, or fried, with meat', 2502),
+        ('Egg white, omelet, scrambled, or fried, with vegetables', 2502),
+        ('Egg white, omelet, scrambled, or fried, with cheese and meat', 2502),
+        ('Egg white, omelet, scrambled, or fried, with cheese and vegetables', 2502),
+        ('Egg white, omelet, scrambled, or fried, with meat and vegetables', 2502),
+        ('Egg white, omelet, scrambled, or fried, with cheese, meat, and vegetables', 2502),
+        ('Meringues', 5804),
+        ('Egg substitute, omelet, scrambled, or fried, fat added', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, no added fat', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with cheese', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with meat', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with vegetables', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with cheese and meat', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with cheese and vegetables', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with meat and vegetables', 2502),
+        ('Egg substitute, omelet, scrambled, or fried, with cheese, meat, and vegetables', 2502),
+        ('Beans, NFS', 2802),
+        ('Beans, from dried, NS as to type, fat added', 2802),
+        ('Beans, from dried, NS as to type, no added fat', 2802),
+        ('Beans, from canned, NS as to type, fat added', 2802),
+        ('Beans, from canned, NS as to type, no added fat', 2802),
+        ('Beans, from fast food / restaurant, NS as to type', 2802),
+        ('White beans, NFS', 2802),
+        ('White beans, from dried, fat added', 2802),
+        ('White beans, from dried, no added fat', 2802),
+        ('White beans, from canned, fat added', 2802),
+        ('White beans, from canned, no added fat', 2802),
+        ('White beans, from canned, reduced sodium', 2802),
+        ('Black beans, NFS', 2802),
+        ('Black beans, from dried, fat added', 2802),
+        ('Black beans, from dried, no added fat', 2802),
+        ('Black beans, from canned, fat added', 2802),
+        ('Black beans, from canned, no added fat', 2802),
+        ('Black beans, from canned, reduced sodium', 2802),
+        ('Black beans, from fast food / restaurant', 2802),
+        ('Black beans with meat', 2802),
+        ('Fava beans, cooked', 2802),
+        ('Lima beans, NFS', 2802),
+        ('Lima beans, from dried', 2802),
+        ('Pink beans, cooked', 2802),
+        ('Pinto beans, NFS', 2802),
+        ('Pinto beans, from dried, fat added', 2802),
+        ('Pinto beans, from dried, no added fat', 2802),
+        ('Pinto beans, from canned, fat added', 2802),
+        ('Pinto beans, from canned, no added fat', 2802),
+        ('Pinto beans, from canned, reduced sodium', 2802),
+        ('Pinto beans, from fast food / restaurant', 2802),
+        ('Pinto beans with meat', 2802),
+        ('Kidney beans, NFS', 2802),
+        ('Kidney beans, from dried, fat added', 2802),
+        ('Kidney beans, from dried, no added fat', 2802),
+        ('Kidney beans, from canned, fat added', 2802),
+        ('Kidney beans, from canned, no added fat', 2802),
+        ('Kidney beans, from canned, reduced sodium', 2802),
+        ('Kidney beans, from fast food / restaurant', 2802),
+        ('Kidney beans with meat', 2802),
+        ('Peruvian beans, from dried', 2802),
+        ('Soybeans, cooked', 2802),
+        ('Mung beans, cooked', 2802),
+        ('Baked beans', 2802),
+        ('Baked beans, vegetarian', 2802),
+        ('Baked beans from fast food / restaurant', 2802),
+        ('Beans and tomatoes, no added fat', 2802),
+        ('Beans and tomatoes, fat added', 2802),
+        ('Refried beans', 2802),
+        ('Refried beans, from fast food / restaurant', 2802),
+        ('Refried beans with meat', 2802),
+        ('Refried beans, from canned, reduced sodium', 2802),
+        ('Beans and franks', 2802),
+        ('Pork and beans', 2802),
+        ('Beans with meat, NS as to type', 2802),
+        ('Baked beans, reduced sodium', 2802),
+        ('Blackeyed peas, NFS', 2802),
+        ('Blackeyed peas, from dried', 2802),
+        ('Chickpeas, NFS', 2802),
+        ('Chickpeas, from dried, fat added', 2802),
+        ('Chickpeas, from dried, no added fat', 2802),
+        ('Chickpeas, from canned, fat added', 2802),
+        ('Chickpeas, from canned, no added fat', 2802),
+        ('Chickpeas, from canned, reduced sodium', 2802),
+        ('Split peas, from dried, no added fat', 2802),
+        ('Split peas, from dried, fat added', 2802),
+        ('Wasabi peas', 2802),
+        ('Lentils, NFS', 2802),
+        ('Lentils, from dried, fat added', 2802),
+        ('Lentils, from dried, no added fat', 2802),
+        ('Lentils, from canned', 2802),
+        ('Dal', 2802),
+        ('Papad, grilled or broiled', 2802),
+        ('Sambar, vegetable stew', 3104),
+        ('Soy nuts', 2802),
+        ('Edamame, cooked', 2802),
+        ('Soup, bean', 3804),
+        ('Soup, bean, canned', 3804),
+        ('Soup, miso or tofu', 3808),
+        ('Soup, bean, canned, reduced sodium', 3804),
+        ('Soup, bean, with meat', 3804),
+        ('Soup, split pea, with meat', 3804),
+        ('Soup, split pea', 3804),
+        ('Soup, lentil, canned', 3804),
+        ('Soup, lentil, canned, reduced sodium', 3804),
+        ('Soup, lentil', 3804),
+        ('Soup, lentil, with meat', 3804),
+        ('Soup, mulligatawany', 3804),
+        ('Vegetarian stew', 3104),
+        ('Veggie burger, on bun', 3744),
+        ('Veggie burger, on bun, with cheese', 3744),
+        ('Falafel sandwich', 3744),
+        ('Soup, peanut', 3806),
+        ('Coconut water, unsweetened', 7204),
+        ('Coconut water, sweetened', 7204),
+        ('Bruschetta', 3744),
+        ('Breadsticks, hard, NFS', 5202),
+        ('Breadsticks, hard, reduced sodium', 5202),
+        ('Croutons', 5202),
+        ('Melba toast', 5202),
+        ('Zwieback toast', 5202),
+        ('Breadsticks, hard, whole wheat', 5202),
+        ('Breadsticks, hard, gluten free', 5202),
+        ('Baby Toddler snack, NFS', 9012),
+        ('Baby Toddler bar', 9012),
+        ('Baby Toddler cookie', 9012),
+        ('Baby Toddler biscuit', 9012),
+        ('Crackers, NFS', 5202),
+        ('Crackers, oatmeal', 5202),
+        ('Crackers, breakfast biscuit', 5202),
+        ('Crackers, butter, reduced sodium', 5202),
+        ('Crackers, matzo, reduced sodium', 5202),
+        ('Crackers, wheat, reduced sodium', 5202),
+        ('Crackers, woven wheat, reduced sodium', 5202),
+        ('Crackers, butter, plain', 5202),
+        ('Crackers, butter, flavored', 5202),
+        ('Crackers, butter (Ritz)', 5202),
+        ('Crackers, butter, reduced fat', 5202),
+        ('Crackers, cheese', 5202),
+        ('Crackers, cheese (Cheez-It)', 5202),
+        ('Crackers, cheese (Goldfish)', 5202),
+        ('Crackers, cheese, reduced fat', 5202),
+        ('Crackers, cheese, reduced sodium', 5202),
+        ('Crackers, cheese, whole grain', 5202),
+        ('Crackers, crispbread', 5202),
+        ('Crackers, flatbread', 5202),
+        ('Crackers, matzo', 5202),
+        ('Crackers, milk', 5202),
+        ('Rice cake', 5202),
+        ('Crackers, rice', 5202),
+        ('Crackers, rice and nuts', 5202),
+        ('Popcorn cake', 5202),
+        ('Rice paper', 5202),
+        ('Crackers, multigrain', 5202),
+        ('Crackers, sandwich', 5202),
+        ('Crackers, sandwich, peanut butter filled', 5202),
+        ('Crackers, sandwich, peanut butter filled (Ritz)', 5202),
+        ('Crackers, sandwich, reduced fat, peanut butter filled', 5202),
+        ('Crackers, whole grain, sandwich, peanut butter filled', 5202),
+        ('Crackers, sandwich, cheese filled', 5202),
+        ('Crackers, sandwich, cheese filled (Ritz)', 5202),
+        ('Crackers, water', 5202),
+        ('Crackers, wonton', 5202),
+        ('Crackers, woven wheat', 5202),
+        ('Crackers, woven wheat, plain (Triscuit)', 5202),
+        ('Crackers, woven wheat, flavored (Triscuit)', 5202),
+        ('Crackers, woven wheat, reduced fat', 5202),
+        ('Crackers, wheat', 5202),
+        ('Crackers, wheat, plain (Wheat Thins)', 5202),
+        ('Crackers, wheat, flavored (Wheat Thins)', 5202),
+        ('Crackers, wheat, reduced fat', 5202),
+        ('Crackers, gluten free, plain', 5202),
+        ('Crackers, gluten free, flavored', 5202),
+        ('Baby Toddler crackers', 9012),
+        ('Baby Toddler puffs, fruit', 9012),
+        ('Baby Toddler puffs, vegetable', 9012),
+        ('Baby Toddler crunchies', 9012),
+        ('Baby Toddler wheels', 9012),
+        ('Pita chips', 5202),
+        ('Bagel chips', 5202),
+        ('Pasta, vegetable, cooked', 4004),
+        ('Noodles, cooked', 4004),
+        ('Noodles, whole grain, cooked', 4004),
+        ('Noodles, chow mein', 5202),
+        ('Long rice noodles, made from mung beans, cooked', 4004),
+        ('Rice noodles, cooked', 4004),
+        ('Pasta, cooked', 4004),
+        ('Pasta, whole grain, cooked', 4004),
+        ('Pasta, gluten free', 4004),
+        ('Barley', 4004),
+        ('Buckwheat groats', 4004),
+        ('Millet', 4004),
+        ('Oatmeal, fast food, plain', 4802),
+        ('Oatmeal, fast food, flavored', 4802),
+        ('Oatmeal, NFS', 4802),
+        ('Oatmeal, regular or quick, made with water, no added fat', 4802),
+        ('Oatmeal, regular or quick, made with water, fat added', 4802),
+        ('Oatmeal, regular or quick, made with milk, no added fat', 4802),
+        ('Oatmeal, regular or quick, made with milk, fat added', 4802),
+        ('Oatmeal, regular or quick, made with non-dairy milk, no added fat', 4802),
+        ('Oatmeal, regular or quick, made with non-dairy milk, fat added', 4802),
+        ('Oatmeal, instant, plain, made with water, no added fat', 4802),
+        ('Oatmeal, instant, plain, made with water, fat added', 4802),
+        ('Oatmeal, instant, plain, made with milk, no added fat', 4802),
+        ('Oatmeal, instant, plain, made with milk, fat added', 4802),
+        ('Oatmeal, instant, plain, made with non-dairy milk, no added fat', 4802),
+        ('Oatmeal, instant, plain, made with non-dairy milk, fat added', 4802),
+        ('Oatmeal, instant, maple flavored, no added fat', 4802),
+        ('Oatmeal, instant, maple flavored, fat added', 4802),
+        ('Oatmeal, instant, fruit flavored, no added fat', 4802),
+        ('Oatmeal, instant, fruit flavored, fat added', 4802),
+        ('Oatmeal, reduced sugar', 4802),
+        ('Oatmeal, multigrain', 4802),
+        ('Quinoa, NS as to fat', 4004),
+        ('Quinoa, no added fat', 4004),
+        ('Quinoa, fat added', 4004),
+        ('Rice, cooked, NFS', 4002),
+        ('Rice, white, cooked, NS as to fat', 4002),
+        ('Rice, white, cooked, made with oil', 4002),
+        ('Rice, white, cooked, made with butter', 4002),
+        ('Rice, white, cooked, made with margarine', 4002),
+        ('Rice, white, cooked, fat added, NS as to fat type', 4002),
+        ('Rice, white, cooked, no added fat', 4002),
+        ('Rice, brown, cooked, NS as to fat', 4002),
+        ('Rice, brown, cooked, fat added, made with oil', 4002),
+        ('Rice, brown, cooked, made with butter', 4002),
+        ('Rice, brown, cooked, made with margarine', 4002),
+        ('Rice, brown, cooked, fat added, NS as to fat type', 4002),
+        ('Rice, brown, cooked, no added fat', 4002),
+        ('Rice, cooked, with milk', 4002),
+        ('Rice, sweet, cooked with honey', 4002),
+        ('Congee', 4002),
+        ('Yellow rice, cooked, NS as to fat', 4002),
+        ('Yellow rice, cooked, no added fat', 4002),
+        ('Yellow rice, cooked, fat added', 4002),
+        ('Rice, white, cooked, glutinous', 4002),
+        ('Rice, wild, 100%, cooked, NS as to fat', 4002),
+        ('Rice, wild, 100%, cooked, no added fat', 4002),
+        ('Rice, wild, 100%, cooked, fat added', 4002),
+        ('Rice, white and wild, cooked, no added fat', 4002),
+        ('Rice, brown and wild, cooked, no added fat', 4002),
+        ('Rice, white and wild, cooked, fat added', 4002),
+        ('Rice, white and wild, cooked, NS as to fat', 4002),
+        ('Rice, brown and wild, cooked, fat added', 4002),
+        ('Rice, brown and wild, cooked, NS as to fat', 4002),
+        ('Rice, white, cooked with fat, Puerto Rican style', 4002),
+        ('Bulgur, no added fat', 4004),
+        ('Bulgur, fat added', 4004),
+        ('Bulgur, NS as to fat', 4004),
+        ('Couscous, plain, cooked', 4004),
+        ('Baby Toddler cereal, barley, dry', 9002),
+        ('Baby Toddler cereal, oatmeal, dry', 9002),
+        ('Baby Toddler cereal, rice, dry', 9002),
+        ('Baby Toddler cereal, rice with fruit, dry', 9002),
+        ('Baby Toddler cereal, multigrain with fruit, dry', 9002),
+        ('Baby Toddler cereal, multigrain, dry', 9002),
+        ('Baby Toddler cereal, oatmeal with fruit, dry', 9002),
+        ('Baby Toddler cereal, NFS', 9002),
+        ('Baby Toddler cereal, rice, ready-to-eat', 9002),
+        ('Baby Toddler cereal, oatmeal, ready-to-eat', 9002),
+        ('Baby Toddler cereal, multigrain, ready-to-eat', 9002),
+        ('Baby Toddler cereal, multigrain with fruit, ready-to-eat', 9002),
+        ('Baby Toddler cereal, oatmeal with fruit, ready-to-eat', 9002),
+        ('Baby Toddler cereal, rice with fruit, ready-to-eat', 9002),
+        ('Soupy rice with chicken, Puerto Rican style', 3804),
+        ('Soupy rice mixture with chicken and potatoes, Puerto Rican style', 3804),
+        ('Stuffed pepper, with meat', 3104),
+        ('Stuffed pepper, with rice and meat', 3104),
+        ('Stuffed pepper, with rice, meatless', 3104),
+        ('Stuffed tomato, with rice and meat', 3104),
+        ('Stuffed tomato, with rice, meatless', 3104),
+        ('Vegetable sandwich on white', 3744),
+        ('Vegetable sandwich on white, with cheese', 3744),
+        ('Vegetable sandwich on wheat', 3744),
+        ('Vegetable sandwich on wheat, with cheese', 3744),
+        ('Vegetable sandwich wrap', 3744),
+        ('Soup, NFS', 3804),
+        ('Soup, noodle, NFS', 3804),
+        ('Soup, rice', 3804),
+        ('Soup, barley', 3804),
+        ('Soup, chicken noodle, canned', 3804),
+        ('Soup, chicken noodle', 3804),
+        ('Soup, chicken, canned, reduced sodium', 3804),
+        ('Soup, Matzo ball', 3804),
+        ('Soup, ramen noodles, water added', 3808),
+        ('Ramen bowl, NFS', 3808),
+        ('Ramen bowl with beef', 3808),
+        ('Ramen bowl with chicken', 3808),
+        ('Ramen bowl with fish', 3808),
+        ('Ramen bowl, vegetarian', 3808),
+        ('Ramen bowl with meat and egg', 3808),
+        ('Ramen bowl, vegetarian with egg', 3808),
+        ('Soup, wonton', 3808),
+        ('Soup, sopa de fideo aguada', 3804),
+        ('Soup, tortilla', 3804),
+        ('Clementine, raw', 6012),
+        ('Grapefruit, raw', 6012),
+        ('Grapefruit, canned', 6012),
+        ('Kumquat, raw', 6012),
+        ('Lemon, raw', 6012),
+        ('Lime, raw', 6012),
+        ('Orange, raw', 6012),
+        ('Orange, canned, NFS', 6012),
+        ('Orange, canned, juice pack', 6012),
+        ('Orange, canned, in syrup', 6012),
+        ('Tangerine, raw', 6012),
+        ('Fruit juice blend, citrus, 100% juice', 7006),
+        ('Fruit, NFS', 6018),
+        ('Fruit, pickled', 6018),
+        ('Apple, raw', 6002),
+        ('Applesauce, regular', 6002),
+        ('Applesauce, unsweetened', 6002),
+        ('Applesauce, flavored', 6002),
+        ('Apple pie filling', 6002),
+        ('Apple, baked', 6002),
+        ('Apricot, raw', 6018),
+        ('Apricot, canned', 6018),
+        ('Avocado, raw', 6420),
+        ('Banana, raw', 6004),
+        ('Banana, baked', 6004),
+        ('Cantaloupe, raw', 6014),
+        ('Melon, frozen', 6014),
+        ('Starfruit, raw', 6018),
+        ('Cherries, maraschino', 6018),
+        ('Cherries, raw', 6018),
+        ('Cherries, canned', 6018),
+        ('Cherries, frozen', 6018),
+        ('Dragon fruit', 6018),
+        ('Fig, raw', 6018),
+        ('Fig, canned', 6018),
+        ('Guava, raw', 6018),
+        ('Kiwi fruit, raw', 6018),
+        ('Lychee', 6018),
+        ('Honeydew melon, raw', 6014),
+        ('Mango, raw', 6024),
+        ('Mango, canned', 6024),
+        ('Mango, frozen', 6024),
+        ('Nectarine, raw', 6008),
+        ('Papaya, raw', 6024),
+        ('Papaya, canned', 6024),
+        ('Passion fruit, raw', 6018),
+        ('Peach, raw', 6008),
+        ('Peach, canned, NFS', 6008),
+        ('Peach, canned, in syrup', 6008),
+        ('Peach, canned, juice pack', 6008),
+        ('Peach, frozen', 6008),
+        ('Pear, raw', 6020),
+        ('Pear, Asian, raw', 6020),
+        ('Pear, canned, NFS', 6020),
+        ('Pear, canned, in syrup', 6020),
+        ('Pear, canned, juice pack', 6020),
+        ('Persimmon, raw', 6018),
+        ('Plum, raw', 6018),
+        ('Plum, canned', 6018),
+        ('Pomegranate, raw', 6018),
+        ('Rhubarb', 6018),
+        ('Tamarind', 6018),
+        ('Watermelon, raw', 6014),
+        ('Berries, NFS', 6011),
+        ('Berries, frozen', 6011),
+        ('Blackberries, raw', 6011),
+        ('Blackberries, frozen', 6011),
+        ('Blueberries, raw', 6011),
+        ('Bluberries, canned', 6011),
+        ('Blueberries, frozen', 6011),
+        ('Cranberries, raw', 6011),
+        ('Cranberry sauce', 6011),
+        ('Raspberries, raw', 6011),
+        ('Raspberries, frozen', 6011),
+        ('Strawberries, raw', 6009),
+        ('Strawberries, canned', 6009),
+        ('Strawberries, frozen', 6009),
+        ('Ambrosia', 6018),
+        ('Fruit salad, fresh or raw, excluding citrus fruits, no dressing', 6018),
+        ('Fruit salad, fresh or raw, including citrus fruits, no dressing', 6018),
+        ('Fruit cocktail, canned, NFS', 6018),
+        ('Fruit cocktail, canned, in syrup', 6018),
+        ('Fruit cocktail, canned, juice pack', 6018),
+        ('Fruit mixture, frozen', 6018),
+        ('Apple salad with dressing', 6018),
+        ('Apple, candied', 6002),
+        ('Fruit, chocolate covered', 6018),
+        ('Fruit salad, excluding citrus fruits, with salad dressing or mayonnaise', 6018),
+        ('Fruit salad, excluding citrus fruits, with whipped cream', 6018),
+        ('Fruit salad, excluding citrus fruits, with nondairy whipped topping', 6018),
+        ('Fruit salad, excluding citrus fruits, with marshmallows', 6018),
+        ('Fruit salad, including citrus fruits, with pudding', 6018),
+        ('Fruit salad, excluding citrus fruits, with pudding', 6018),
+        ('Fruit salad, including citrus fruits, with salad dressing or mayonnaise', 6018),
+        ('Fruit salad, including citrus fruit, with whipped cream', 6018),
+        ('Fruit salad, including citrus fruits, with nondairy whipped topping', 6018),
+        ('Fruit salad, including citrus fruits, with marshmallows', 6018),
+        ('Lime souffle', 5804),
+        ('Pineapple salad with dressing', 6018),
+        ('Soup, fruit', 3804),
+        ('Fruit juice, NFS', 7006),
+        ('Fruit juice blend, 100% juice', 7006),
+        ('Cranberry juice blend, 100% juice', 7006),
+        ('Cranberry juice blend, 100% juice, with calcium added', 7006),
+        ('Blackberry juice, 100%', 7006),
+        ('Blueberry juice', 7006),
+        ('Cranberry juice, 100%, not a blend', 7006),
+        ('Grape juice, 100%', 7006),
+        ('Grape juice, 100%, with calcium added', 7006),
+        ('Papaya juice, 100%', 7006),
+        ('Passion fruit juice, 100%', 7006),
+        ('Pineapple juice, 100%', 7006),
+        ('Pomegranate juice, 100%', 7006),
+        ('Prune juice, 100%', 7006),
+        ('Strawberry juice, 100%', 7006),
+        ('Watermelon juice, 100%', 7006),
+        ('Fruit nectar, NFS', 7204),
+        ('Apricot nectar', 7204),
+        ('Banana nectar', 7204),
+        ('Cantaloupe nectar', 7204),
+        ('Guava nectar', 7204),
+        ('Mango nectar', 7204),
+        ('Peach nectar', 7204),
+        ('Papaya nectar', 7204),
+        ('Passion fruit nectar', 7204),
+        ('Pear nectar', 7204),
+        ('Soursop, nectar', 7204),
+        ('Baby Toddler fruit, NFS', 9004),
+        ('Baby Toddler multiple fruit, Stage 2', 9004),
+        ('Baby Toddler multiple fruit, Stage 3', 9004),
+        ('Baby Toddler fruit, with grain', 9007),
+        ('Baby Toddler fruit, with yogurt', 9007),
+        ('Baby Toddler fruit and vegetables, Stage 2', 9007),
+        ('Baby Toddler fruit and vegetables, Stage 3', 9007),
+        ('Baby Toddler fruit and vegetables, with grain', 9007),
+        ('Baby Toddler fruit and vegetables, with yogurt', 9007),
+        ('Baby Toddler fruit, vegetables, and meat', 9007),
+        ('Baby Toddler fruit and meat', 9007),
+        ('Baby Toddler apples, Stage 1', 9004),
+        ('Baby Toddler apples, Stage 2', 9004),
+        ('Baby Toddler bananas, Stage 1', 9004),
+        ('Baby Toddler bananas, Stage 2', 9004),
+        ('Baby Toddler peaches, Stage 1', 9004),
+        ('Baby Toddler peaches, Stage 2', 9004),
+        ('Baby Toddler pears, Stage 1', 9004),
+        ('Baby Toddler pears, Stage 2', 9004),
+        ('Baby Toddler prunes', 9004),
+        ('Baby Toddler mangoes', 9004),
+        ('Baby Toddler juice, NFS', 9202),
+        ('Baby Toddler juice, apple', 9202),
+        ('Baby Toddler juice, grape', 9202),
+        ('Baby Toddler juice, mixed fruit', 9202),
+        ('Baby Toddler juice, pear', 9202),
+        ('Baby Toddler juice, fruit and vegetable', 9202),
+        ('Baby Toddler juice, fruit and yogurt blend', 9007),
+        ('Baby Toddler pudding', 9012),
+        ('Baby Toddler yogurt melts', 9012),
+        ('Stewed potatoes, Puerto Rican style', 6806),
+        ('Potato from Puerto Rican style stuffed pot roast, with gravy', 6806),
+        ('Potato from Puerto Rican beef stew, with gravy', 6806),
+        ('Potato from Puerto Rican chicken fricassee, with sauce', 6806),
+        ('Potato, scalloped, NFS', 6806),
+        ('Potato, scalloped, from fast food or restaurant', 6806),
+        ('Potato, scalloped, from fresh', 6806),
+        ('Potato, scalloped, from fresh, with meat', 6806),
+        ('Potato, scalloped, from dry mix', 6806),
+        ('Potato, scalloped, from dry mix, with meat', 6806),
+        ('Potato, scalloped, ready-to-heat', 6806),
+        ('Potato, scalloped, ready-to-heat, with meat', 6806),
+        ('Potato, mashed, NFS', 6806),
+        ('Potato, mashed, from fast food', 6806),
+        ('Potato, mashed, from fast food, with gravy', 6806),
+        ('Potato, mashed, ready-to-heat', 6806),
+        ('Potato, mashed, from fresh, made with milk', 6806),
+        ('Potato, mashed, from fresh, made with milk, with cheese', 6806),
+        ('Potato, mashed, from fresh, made with milk, with gravy', 6806),
+        ('Potato, mashed, from fresh, NFS', 6806),
+        ('Potato, mashed, from restaurant', 6806),
+        ('Potato, mashed, from restaurant, with gravy', 6806),
+        ('Potato, mashed, from school lunch', 6806),
+        ('Potato, mashed, from dry mix, NFS', 6806),
+        ('Potato, mashed, from dry mix, made with milk', 6806),
+        ('Potato, mashed, from dry mix, made with milk, with cheese', 6806),
+        ('Potato, mashed, from dry mix, made with milk, with gravy', 6806),
+        ('Potato, mashed, ready-to-heat, NFS', 6806),
+        ('Potato, mashed, ready-to-heat, with cheese', 6806),
+        ('Potato, mashed, ready-to-heat, with gravy', 6806),
+        ('Potato salad with egg, from restaurant', 6806),
+        ('Potato salad with egg, made with mayonnaise', 6806),
+        ('Potato salad with egg, made with light mayonnaise', 6806),
+        ('Potato salad with egg, made with mayonnaise-type salad dressing', 6806),
+        ('Potato salad with egg, made with light mayonnaise-type salad dressing', 6806),
+        ('Potato salad with egg, made with creamy dressing', 6806),
+        ('Potato salad with egg, made with light creamy dressing', 6806),
+        ('Potato salad with egg, made with Italian dressing', 6806),
+        ('Potato salad with egg, made with light Italian dressing', 6806),
+        ('Potato salad with egg, made with any type of fat free dressing', 6806),
+        ('Potato salad, German style', 6806),
+        ('Potato salad, from restaurant', 6806),
+        ('Potato salad, made with mayonnaise', 6806),
+        ('Potato salad, made with light mayonnaise', 6806),
+        ('Potato salad, made with mayonnaise-type salad dressing', 6806),
+        ('Potato salad, made with light mayonnaise-type salad dressing', 6806),
+        ('Potato salad, made with creamy dressing', 6806),
+        ('Potato salad, made with light creamy dressing', 6806),
+        ('Potato salad, made with Italian dressing', 6806),
+        ('Potato salad, made with light Italian dressing', 6806),
+        ('Potato salad, made with any type of fat free dressing', 6806),
+        ('Potato pancake', 6806),
+        ('Lefse', 6806),
+        ('Stewed potatoes', 6806),
+        ('Stewed potatoes with tomatoes', 6806),
+        ('Soup, potato', 3806),
+        ('Soup, potato with meat', 3806),
+        ('Plantain, cooked, no added fat', 6418),
+        ('Plantain, cooked with oil', 6418),
+        ('Plantain, raw', 6418),
+        ('Plantain, cooked, fat added, NS as to fat type', 6418),
+        ('Plantain, cooked with butter or margarine', 6418),
+        ('Cassava, cooked', 6418),
+        ('Yuca fries', 6430),
+        ('Taro, cooked', 6418),
+        ('Fufu', 6418),
+        ('Beet greens, raw', 6411),
+        ('Beet greens, cooked', 6411),
+        ('Broccoli raab, raw', 6407),
+        ('Broccoli raab, cooked', 6407),
+        ('Chard, raw', 6411),
+        ('Chard, cooked', 6411),
+        ('Collards, raw', 6411),
+        ('Collards, fresh, cooked, no added fat', 6411),
+        ('Collards, frozen, cooked, no added fat', 6411),
+        ('Collards, NS as to form, cooked', 6411),
+        ('Collards, fresh, cooked, fat added, NS as to fat type', 6411),
+        ('Collards, frozen, cooked, fat added, NS as to fat type', 6411),
+        ('Collards, fresh, cooked with oil', 6411),
+        ('Collards, fresh, cooked with butter or margarine', 6411),
+        ('Collards, frozen, cooked with oil', 6411),
+        ('Collards, frozen, cooked with butter or margarine', 6411),
+        ('Cress, raw', 6411),
+        ('Cress, cooked', 6411),
+        ('Dandelion greens, raw', 6411),
+        ('Dandelion greens, cooked', 6411),
+        ('Escarole, cooked', 6411),
+        ('Greens, fresh, cooked, no added fat', 6411),
+        ('Greens, frozen, cooked, no added fat', 6411),
+        ('Greens, NS as to form, cooked', 6411),
+        ('Greens, fresh, cooked, fat added', 6411),
+        ('Greens, frozen, cooked, fat added', 6411),
+        ('Greens, canned, cooked', 6411),
+        ('Kale, raw', 6411),
+        ('Kale, fresh, cooked, no added fat', 6411),
+        ('Kale, frozen, cooked, no added fat', 6411),
+        ('Kale, NS as to form, cooked', 6411),
+        ('Kale, fresh, cooked, fat added', 6411),
+        ('Kale, frozen, cooked, fat added', 6411),
+        ('Lambsquarter, cooked', 6411),
+        ('Mustard greens, raw', 6411),
+        ('Mustard greens, fresh, cooked, no added fat', 6411),
+        ('Mustard greens, frozen, cooked, no added fat', 6411),
+        ('Mustard greens, NS as to form, cooked', 6411),
+        ('Mustard greens, fresh, cooked, fat added', 6411),
+        ('Mustard greens, frozen, cooked, fat added', 6411),
+        ('Poke greens, cooked', 6411),
+        ('Spinach, raw', 6409),
+        ('Spinach, fresh, cooked, no added fat', 6409),
+        ('Spinach, frozen, cooked, no added fat', 6409),
+        ('Spinach, canned, cooked, no added fat', 6409),
+        ('Spinach, fresh, cooked with oil', 6409),
+        ('Spinach, fresh, cooked with butter or margarine', 6409),
+        ('Spinach, NS as to form, cooked', 6409),
+        ('Spinach, fresh, cooked, fat added, NS as to fat type', 6409),
+        ('Spinach, frozen, cooked, fat added, NS as to fat type', 6409),
+        ('Spinach, canned, cooked, fat added, NS as to fat type', 6409),
+        ('Spinach, frozen, cooked with oil', 6409),
+        ('Spinach, frozen, cooked with butter or margarine', 6409),
+        ('Spinach, canned, cooked with oil', 6409),
+        ('Spinach, canned, cooked with butter or margarine', 6409),
+        ('Spinach, creamed', 6409),
+        ('Spinach souffle', 3104),
+        ('Spinach and cheese casserole', 3104),
+        ('Palak Paneer', 3104),
+        ('Channa Saag', 3104),
+        ('Taro leaves, cooked', 6411),
+        ('Turnip greens, fresh, cooked, no added fat', 6411),
+        ('Turnip greens, frozen, cooked, no added fat', 6411),
+        ('Turrnip greens, NS as to form, cooked', 6411),
+        ('Turnip greens, fresh, cooked, fat added', 6411),
+        ('Turnip greens, frozen, cooked, fat added', 6411),
+        ('Watercress, raw', 6411),
+        ('Watercress, cooked', 6411),
+        ('Bitter melon, horseradish, jute, or radish leaves, cooked', 6411),
+        ('Sweet potato, squash, pumpkin, chrysanthemum, or bean leaves, cooked', 6411),
+        ('Broccoli, raw', 6407),
+        ('Broccoli, cooked, from restaurant', 6407),
+        ('Broccoli, fresh, cooked, no added fat', 6407),
+        ('Broccoli, frozen, cooked, no added fat', 6407),
+        ('Broccoli, NS as to form, cooked', 6407),
+        ('Broccoli, fresh, cooked, fat added, NS as to fat type', 6407),
+        ('Broccoli, frozen, cooked, fat added, NS as to fat type', 6407),
+        ('Broccoli, fresh, cooked with oil', 6407),
+        ('Broccoli, fresh, cooked with butter or margarine', 6407),
+        ('Broccoli, frozen, cooked with oil', 6407),
+        ('Broccoli, frozen, cooked with butter or margarine', 6407),
+        ('Broccoli casserole with noodles', 3104),
+        ('Broccoli casserole with rice', 3104),
+        ('Fried broccoli', 6430),
+        ('Broccoli, chinese, raw', 6407),
+        ('Broccoli, Chinese, cooked', 6407),
+        ('Soup, broccoli cheese', 3806),
+        ('Carrots, raw', 6404),
+        ('Carrots, cooked, from restaurant', 6404),
+        ('Carrots, fresh, cooked, no added fat', 6404),
+        ('Carrots, frozen, cooked, no added fat', 6404),
+        ('Carrots, canned, cooked, no added fat', 6404),
+        ('Carrots, fresh, cooked with oil', 6404),
+        ('Carrots, fresh, cooked with butter or margarine', 6404),
+        ('Carrots, NS as to form, cooked', 6404),
+        ('Carrots, fresh, cooked, fat added, NS as to fat type', 6404),
+        ('Carrots, frozen, cooked, fat added, NS as to fat type', 6404),
+        ('Carrots, canned, cooked, fat added, NS as to fat type', 6404),
+        ('Carrots, frozen, cooked with oil', 6404),
+        ('Carrots, frozen, cooked with butter or margarine', 6404),
+        ('Carrots, canned, cooked with oil', 6404),
+        ('Carrots, canned, cooked with butter or margarine', 6404),
+        ('Carrots, glazed, cooked', 6404),
+        ('Carrots, canned, reduced sodium, cooked, no added fat', 6404),
+        ('Carrots, canned, reduced sodium, cooked, fat added, NS as to fat type', 6404),
+        ('Carrots, canned, reduced sodium, cooked with oil', 6404),
+        ('Carrots, canned, reduced sodium, cooked with butter or margarine', 6404),
+        ('Peas and carrots, fresh, cooked, no added fat', 6420),
+        ('Peas and carrots, frozen, cooked, no added fat', 6420),
+        ('Peas and carrots, canned, cooked, no added fat', 6420),
+        ('Peas and carrots, cooked, NS as to form', 6420),
+        ('Peas and carrots, fresh, cooked, fat added', 6420),
+        ('Peas and carrots, frozen, cooked, fat added', 6420),
+        ('Peas and carrots, canned, cooked, fat added', 6420),
+        ('Pumpkin, canned, cooked', 6406),
+        ('Pumpkin, cooked', 6406),
+        ('Winter squash, raw', 6406),
+        ('Winter squash, cooked, no added fat', 6406),
+        ('Winter squash, cooked, fat added', 6406),
+        ('Squash, winter, souffle', 3104),
+        ('Sweet potato, NFS', 6406),
+        ('Sweet potato, baked, NS as to fat', 6406),
+        ('Sweet potato, baked, no added fat', 6406),
+        ('Sweet potato, baked, fat added', 6406),
+        ('Sweet potato, boiled, NS as to fat', 6406),
+        ('Sweet potato, boiled, no added fat', 6406),
+        ('Sweet potato, boiled, fat added', 6406),
+        ('Sweet potato, candied', 6406),
+        ('Sweet potato, canned, NS as to fat', 6406),
+        ('Sweet potato, canned, no added fat', 6406),
+        ('Sweet potato, canned, fat added', 6406),
+        ('Sweet potato, casserole or mashed', 6406),
+        ('Sweet potato fries, NFS', 6430),
+        ('Sweet potato fries, frozen', 6430),
+        ('Sweet potato fries, from fresh', 6430),
+        ('Sweet potato fries, fast food / restaurant', 6430),
+        ('Sweet potato fries, school', 6430),
+        ('Sweet potato tots', 6430),
+        ('Sweet potato tots, fast food / restaurant', 6430),
+        ('Sweet potato tots, school', 6430),
+        ('Soup, pumpkin', 3806),
+        ('Tomatoes, scalloped', 3104),
+        ('Fried green tomatoes', 6430),
+        ('Tomato, green, pickled', 8408),
+        ('Soup, tomato', 3804),
+        ('Soup, cream of tomato', 3806),
+        ('Soup, tomato, canned', 3804),
+        ('Soup, tomato, canned / carton, reduced sodium', 3804),
+        ('Tomato sandwich on white', 3744),
+        ('Tomato sandwich on wheat', 3744),
+        ('Raw vegetable, NFS', 6420),
+        ('Sprouts, NFS', 6420),
+        ('Alfalfa sprouts, raw', 6420),
+        ('Artichoke', 6420),
+        ('Asparagus, raw', 6420),
+        ('Bean sprouts, raw', 6420),
+        ('Green beans, raw', 6412),
+        ('Beets, raw', 6420),
+        ('Broccoflower, raw', 6420),
+        ('Brussels sprouts, raw', 6420),
+        ('Cactus, raw', 6420),
+        ('Cauliflower, raw', 6420),
+        ('Celery, raw', 6420),
+        ('Fennel bulb, raw', 6420),
+        ('Corn, raw', 6416),
+        ('Cucumber, raw', 6420),
+        ('Eggplant, raw', 6420),
+        ('Jicama, raw', 6420),
+        ('Kohlrabi, raw', 6420),
+        ('Mushrooms, raw', 6420),
+        ('Green peas, raw', 6418),
+        ('Peppers, raw, NFS', 6420),
+        ('Peppers, sweet, green, raw', 6420),
+        ('Peppers, sweet, red, raw', 6406),
+        ('Peppers, banana, raw', 6420),
+        ('Radish', 6420),
+        ('Rutabaga, raw', 6420),
+        ('Seaweed, raw', 6420),
+        ('Snowpeas, raw', 6420),
+        ('Summer squash, yellow, raw', 6420),
+        ('Summer squash, green, raw', 6420),
+        ('Turnip, raw', 6420),
+        ('Lettuce, wilted, with bacon dressing', 3104),
+        ('Seven-layer salad, lettuce salad made with a combination of onion, celery, green pepper, peas, mayonnaise, cheese, eggs, and/or bacon', 3104),
+        ('Greek Salad, no dressing', 3104),
+        ('Spinach salad, no dressing', 3104),
+        ('Cobb salad, no dressing', 3104),
+        ('Aloe vera juice drink', 7006),
+        ('Asparagus, fresh, cooked, no added fat', 6420),
+        ('Asparagus, frozen, cooked, no added fat', 6420),
+        ('Asparagus, canned, cooked, no added fat', 6420),
+        ('Asparagus, NS as to form, cooked', 6420),
+        ('Asparagus, fresh, cooked, fat added, NS as to fat type', 6420),
+        ('Asparagus, frozen, cooked, fat added, NS as to fat type', 6420),
+        ('Asparagus, canned, cooked, fat added, NS as to fat type', 6420),
+        ('Asparagus, fresh, cooked with oil', 6420),
+        ('Asparagus, fresh, cooked with butter or margarine', 6420),
+        ('Asparagus, frozen, cooked with oil', 6420),
+        ('Asparagus, frozen, cooked with butter or margarine', 6420),
+        ('Asparagus, canned, cooked with oil', 6420),
+        ('Asparagus, canned, cooked with butter or margarine', 6420),
+        ('Bamboo shoots, cooked', 6420),
+        ('Lima beans, from frozen, no added fat', 6418),
+        ('Lima beans, from frozen, fat added', 6418),
+        ('Lima beans, from canned', 6418),
+        ('Green beans, cooked, from restaurant', 6412),
+        ('Green beans, fresh, cooked, no added fat', 6412),
+        ('Green beans, frozen, cooked, no added fat', 6412),
+        ('Green beans, canned, cooked, no added fat', 6412),
+        ('Green beans, NS as to form, cooked', 6412),
+        ('Green beans, fresh, cooked, fat added, NS as to fat type', 6412),
+        ('Green beans, frozen, cooked, fat added, NS as to fat type', 6412),
+        ('Green beans, canned, cooked, fat added, NS as to fat type', 6412),
+        ('Green beans, fresh, cooked with oil', 6412),
+        ('Green beans, fresh, cooked with butter or margarine', 6412),
+        ('Green beans, frozen, cooked with oil', 6412),
+        ('Green beans, frozen, cooked with butter or margarine', 6412),
+        ('Green beans, canned, cooked with oil', 6412),
+        ('Green beans, canned, cooked with butter or margarine', 6412),
+        ('Green beans, canned, reduced sodium, cooked, no added fat', 6412),
+        ('Green beans, canned, reduced sodium, cooked, fat added, NS as to fat type', 6412),
+        ('Green beans, canned, reduced sodium, cooked with oil', 6412),
+        ('Green beans, canned, reduced sodium, cooked with butter or margarine', 6412),
+        ('Fried green beans', 6430),
+        ('Yellow string beans, cooked', 6412),
+        ('Bean sprouts, cooked', 6420),
+        ('Beets, fresh, cooked, no added fat', 6420),
+        ('Beets, canned, cooked, no added fat', 6420),
+        ('Beets, NS as to form, cooked', 6420),
+        ('Beets, fresh, cooked, fat added', 6420),
+        ('Beets, canned, cooked, fat added', 6420),
+        ('Beets, canned, reduced sodium, cooked', 6420),
+        ('Bitter melon, cooked', 6420),
+        ('Breadfruit, cooked', 6418),
+        ('Broccoflower, cooked', 6420),
+        ('Brussels sprouts, fresh, cooked, no added fat', 6420),
+        ('Brussels sprouts, frozen, cooked, no added fat', 6420),
+        ('Brussels sprouts, NS as to form, cooked', 6420),
+        ('Brussels sprouts, fresh, cooked, fat added', 6420),
+        ('Brussels sprouts, frozen, cooked, fat added', 6420),
+        ('Burdock, cooked', 6420),
+        ('Cactus, cooked, no added fat', 6420),
+        ('Cactus, cooked, fat added', 6420),
+        ('Cauliflower, fresh, cooked, no added fat', 6420),
+        ('Cauliflower, frozen, cooked, no added fat', 6420),
+        ('Cauliflower, NS as to form, cooked', 6420),
+        ('Cauliflower, fresh, cooked, fat added, NS as to fat type', 6420),
+        ('Cauliflower, frozen, cooked, fat added, NS as to fat type', 6420),
+        ('Cauliflower, fresh, cooked with oil', 6420),
+        ('Cauliflower, fresh, cooked with butter or margarine', 6420),
+        ('Cauliflower, frozen, cooked with oil', 6420),
+        ('Cauliflower, frozen, cooked with butter or margarine', 6420),
+        ('Celery, cooked', 6420),
+        ('Fennel bulb, cooked', 6420),
+        ('Christophine, cooked', 6420),
+        ('Corn, cooked, from restaurant', 6416),
+        ('Corn, fresh, cooked, no added fat', 6416),
+        ('Corn, frozen, cooked, no added fat', 6416),
+        ('Corn, canned, cooked, no added fat', 6416),
+        ('Corn, NS as to form, cooked', 6416),
+        ('Corn, fresh, cooked, fat added, NS as to fat type', 6416),
+        ('Corn, frozen, cooked, fat added, NS as to fat type', 6416),
+        ('Corn, canned, cooked, fat added, NS as to fat type', 6416),
+        ('Corn, fresh, cooked with oil', 6416),
+        ('Corn, fresh, cooked with butter or margarine', 6416),
+        ('Corn, frozen, cooked with oil', 6416),
+        ('Corn, frozen, cooked with butter or margarine', 6416),
+        ('Corn, canned, cooked with oil', 6416),
+        ('Corn, canned, cooked with butter or margarine', 6416),
+        ('Corn, creamed', 6416),
+        ('Corn, canned, reduced sodium, cooked, no added fat', 6416),
+        ('Corn, canned, reduced sodium, cooked, fat added, NS as to fat type', 6416),
+        ('Corn, canned, reduced sodium, cooked with oil', 6416),
+        ('Corn, canned, reduced sodium, cooked with butter or margarine', 6416),
+        ('Cucumber, cooked', 6420),
+        ('Eggplant, cooked, no added fat', 6420),
+        ('Eggplant, cooked, fat added', 6420),
+        ('Flowers or blossoms of sesbania, squash, or lily, cooked', 6420),
+        ('Kohlrabi, cooked', 6420),
+        ('Lotus root, cooked', 6420),
+        ('Mushrooms, fresh, cooked, no added fat', 6420),
+        ('Mushrooms, NS as to form, cooked', 6420),
+        ('Mushrooms, fresh, cooked, fat added, NS as to fat type', 6420),
+        ('Mushrooms, canned, cooked', 6420),
+        ('Mushrooms, fresh, cooked with oil', 6420),
+        ('Mushrooms, fresh, cooked with butter or margarine', 6420),
+        ('Mushroom, Asian, cooked, from dried', 6420),
+        ('Okra, fresh, cooked, no added fat', 6420),
+        ('Okra, frozen, cooked, no added fat', 6420),
+        ('Okra, NS as to form, cooked', 6420),
+        ('Okra, fresh, cooked, fat added', 6420),
+        ('Okra, frozen, cooked, fat added', 6420),
+        ('Palm hearts, cooked', 6420),
+        ('Parsnips, cooked', 6420),
+        ('Blackeyed peas, from frozen', 6418),
+        ('Blackeyed peas, from canned', 6418),
+        ('Green peas, cooked, from restaurant', 6418),
+        ('Green peas, fresh, cooked, no added fat', 6418),
+        ('Green peas, frozen, cooked, no added fat', 6418),
+        ('Green peas, canned, cooked, no added fat', 6418),
+        ('Green peas, NS as to form, cooked', 6418),
+        ('Green peas, fresh, cooked, fat added, NS as to fat type', 6418),
+        ('Green peas, frozen, cooked, fat added, NS as to fat type', 6418),
+        ('Green peas, canned, cooked, fat added, NS as to fat type', 6418),
+        ('Green peas, fresh, cooked with oil', 6418),
+        ('Green peas, fresh, cooked with butter or margarine', 6418),
+        ('Green peas, frozen, cooked with oil', 6418),
+        ('Green peas, frozen, cooked with butter or margarine', 6418),
+        ('Green peas, canned, cooked with oil', 6418),
+        ('Green peas, canned, cooked with butter or margarine', 6418),
+        ('Green peas, canned, reduced sodium, cooked, no added fat', 6418),
+        ('Green peas, canned, reduced sodium, cooked, fat added, NS as to fat type', 6418),
+        ('Green peas, canned, reduced sodium, cooked with oil', 6418),
+        ('Green peas, canned, reduced sodium, cooked with butter or margarine', 6418),
+        ('Peppers, green, cooked', 6420),
+        ('Peppers, red, cooked', 6406),
+        ('Rutabaga, cooked', 6420),
+        ('Salsify, cooked', 6420),
+        ('Sauerkraut', 8408),
+        ('Snowpeas, fresh, cooked, no added fat', 6420),
+        ('Snowpeas, frozen, cooked, no added fat', 6420),
+        ('Snowpeas, NS as to form, cooked', 6420),
+        ('Snowpeas, fresh, cooked, fat added', 6420),
+        ('Snowpeas, frozen, cooked, fat added', 6420),
+        ('Seaweed, cooked, no added fat', 6420),
+        ('Seaweed, cooked, fat added', 6420),
+        ('Summer squash, yellow or green, fresh, cooked, no added fat', 6420),
+        ('Summer squash, yellow or green, frozen, cooked, no added fat', 6420),
+        ('Summer squash, yellow or green, NS as to form, cooked', 6420),
+        ('Summer squash, yellow or green, fresh, cooked, fat added, NS as to fat type', 6420),
+        ('Summer squash, yellow or green, frozen, cooked, fat added, NS as to fat type', 6420),
+        ('Summer squash, yellow or green, canned, cooked, fat added, NS as to fat type', 6420),
+        ('Summer squash, yellow or green, fresh, cooked with oil', 6420),
+        ('Summer squash, yellow or green, fresh, cooked with butter or margarine', 6420),
+        ('Summer squash, yellow or green, frozen, cooked with oil', 6420),
+        ('Summer squash, yellow or green, frozen, cooked with butter or margarine', 6420),
+        ('Spaghetti squash, cooked', 6406),
+        ('Turnip, cooked', 6420),
+        ('Water Chesnut', 6418),
+        ('Winter melon, cooked', 6420),
+        ('Lima beans and corn, cooked, no added fat', 6418),
+        ('Lima beans and corn, cooked, fat added', 6418),
+        ('Peppers and onions, cooked, no added fat', 6420),
+        ('Peppers and onions, cooked, fat added', 6420),
+        ('Classic mixed vegetables, cooked, from restaurant', 6420),
+        ('Classic mixed vegetables, frozen, cooked, no added fat', 6420),
+        ('Classic mixed vegetables, canned, cooked, no added fat', 6420),
+        ('Classic mixed vegetables, NS as to form, cooked', 6420),
+        ('Classic mixed vegetables, frozen, cooked, fat added, NS as to fat type', 6420),
+        ('Classic mixed vegetables, canned, cooked, fat added, NS as to fat type', 6420),
+        ('Classic mixed vegetables, frozen, cooked with oil', 6420),
+        ('Classic mixed vegetables, frozen, cooked with butter or margarine', 6420),
+        ('Classic mixed vegetables, canned, cooked with oil', 6420),
+        ('Classic mixed vegetables, canned, cooked with butter or margarine', 6420),
+        ('Classic mixed vegetables, canned, reduced sodium, cooked, no added fat', 6420),
+        ('Classic mixed vegetables, canned, reduced sodium, cooked, fat added, NS as to fat type', 6420),
+        ('Classic mixed vegetables, canned, reduced sodium, cooked with oil', 6420),
+        ('Classic mixed vegetables, canned, reduced sodium, cooked with butter or margarine', 6420),
+        ('Peas and corn, cooked, no added fat', 6418),
+        ('Peas and corn, cooked, fat added', 6418),
+        ('Ratatouille', 3104),
+        ('Vegetables, stew type, cooked, fat added', 6420),
+        ('Vegetables, stew type, cooked, no added fat', 6420),
+        ('Broccoli and cauliflower, cooked, no added fat', 6420),
+        ('Broccoli and cauliflower, cooked, fat added', 6420),
+        ('Broccoli, cauliflower and carrots, cooked, no added fat', 6420),
+        ('Broccoli, cauliflower and carrots, cooked, fat added', 6420),
+        ('Asian stir fry vegetables, cooked, no added fat', 6420),
+        ('Asian stir fry vegetables, cooked, fat added', 6420),
+        ('Jai, Monk''s Food', 6420),
+        ('Artichokes, stuffed', 3104),
+        ('Green bean casserole', 3104),
+        ('Fried cauliflower', 6430),
+        ('Corn, scalloped or pudding', 3104),
+        ('Fried eggplant', 6430),
+        ('Eggplant parmesan casserole, regular', 3104),
+        ('Eggplant with cheese and tomato sauce', 3104),
+        ('Mushrooms, stuffed', 3104),
+        ('Fried mushrooms', 6430),
+        ('Fried okra', 6430),
+        ('Fried onion rings', 6430),
+        ('Fried summer squash, yellow or green', 6430),
+        ('Squash, summer, casserole with tomato and cheese', 3104),
+        ('Squash, summer, casserole, with rice and tomato sauce', 3104),
+        ('Squash, summer, casserole, with cheese sauce', 3104),
+        ('Squash, summer, souffle', 3104),
+        ('Stew, vegetable', 3104),
+        ('Vegetable tempura', 6430),
+        ('Pakora', 6430),
+        ('Vegetable curry', 3104),
+        ('Vegetable curry with rice', 3104),
+        ('Green beans, pickled', 8408),
+        ('Beets, pickled', 8408),
+        ('Celery, pickled', 8408),
+        ('Relish, corn', 8408),
+        ('Cauliflower, pickled', 8408),
+        ('Cabbage, green, pickled', 8408),
+        ('Cabbage, red, pickled', 8408),
+        ('Kimchi', 8408),
+        ('Pickles, dill', 8408),
+        ('Relish, pickle', 8408),
+        ('Pickles, sweet', 8408),
+        ('Eggplant, pickled', 8408),
+        ('Ginger root, pickled', 8408),
+        ('Mushrooms, pickled', 8408),
+        ('Okra, pickled', 8408),
+        ('Olives, NFS', 8408),
+        ('Olives, green', 8408),
+        ('Olives, black', 8408),
+        ('Olives, stuffed', 8408),
+        ('Olive tapenade', 8408),
+        ('Peppers, sweet, pickled', 8408),
+        ('Peppers, hot, pickled', 8408),
+        ('Peppers, jalapenos', 6420),
+        ('Pickles, NFS', 8408),
+        ('Pickles, fried', 6430),
+        ('Radishes, pickled', 8408),
+        ('Seaweed, pickled', 8408),
+        ('Vegetables, pickled', 8408),
+        ('Turnip, pickled', 8408),
+        ('Zucchini, pickled', 8408),
+        ('Soup, borscht', 3804),
+        ('Soup, gazpacho', 3804),
+        ('Soup, cream of mushroom', 3806),
+        ('Soup, French onion', 3806),
+        ('Soup, cream of vegetable', 3806),
+        ('Soup, seaweed', 3808),
+        ('Soup, vegetable, canned', 3804),
+        ('Soup, vegetable, canned, reduced sodium', 3804),
+        ('Soup, vegetable', 3804),
+        ('Soup, minestrone', 3804),
+        ('Soup, beef', 3804),
+        ('Soup, vegetable, with meat', 3804),
+        ('Baby Toddler vegetable, NFS', 9006),
+        ('Baby Toddler carrots, Stage 1', 9006),
+        ('Baby Toddler carrots, Stage 2', 9006),
+        ('Baby Toddler squash, Stage 1', 9006),
+        ('Baby Toddler squash, Stage 2', 9006),
+        ('Baby Toddler sweet potatoes, Stage 1', 9006),
+        ('Baby Toddler sweet potatoes, Stage 2', 9006),
+        ('Baby Toddler green beans, Stage 1', 9006),
+        ('Baby Toddler green beans, Stage 2', 9006),
+        ('Baby Toddler beets', 9006),
+        ('Baby Toddler multiple vegetables, Stage 2', 9006),
+        ('Baby Toddler multiple vegetables, Stage 3', 9006),
+        ('Baby Toddler vegetables, with grain', 9007),
+        ('Baby Toddler vegetables and meat', 9007),
+        ('Baby Toddler peas, Stage 1', 9006),
+        ('Baby Toddler peas, Stage 2', 9006),
+        ('Toddler meal, NFS', 9008),
+        ('Toddler meal, meat and vegetables', 9008),
+        ('Toddler meal, rice and vegetables', 9008),
+        ('Toddler meal, pasta', 9008),
+        ('Toddler meal, pasta and vegetables', 9008),
+        ('Fried stuffed potatoes, Puerto Rican style', 6806),
+        ('Green plantain with cracklings, Puerto Rican style', 6418),
+        ('Vegetable and fruit juice, 100% juice, with high vitamin C', 7006),
+        ('Haupia', 5804),
+        ('Fruit juice drink, citrus, carbonated', 7204),
+        ('Fruit juice drink, noncitrus, carbonated', 7204),
+        ('Fruit juice drink', 7204),
+        ('Tamarind drink', 7204),
+        ('Fruit punch, made with fruit juice and soda', 7204),
+        ('Lemonade, fruit juice drink', 7204),
+        ('Lemonade, fruit flavored drink', 7204),
+        ('Lemonade, frozen concentrate, not reconstituted', 7204),
+        ('Fruit flavored drink', 7204),
+        ('Pina Colada, nonalcoholic', 7204),
+        ('Margarita mix, nonalcoholic', 7204),
+        ('Slush frozen drink', 7204),
+        ('Fruit flavored drink, with high vitamin C', 7204),
+        ('Cranberry juice drink, with high vitamin C', 7204),
+        ('Fruit juice drink, with high vitamin C', 7204),
+        ('Vegetable and fruit juice drink, with high vitamin C', 7204),
+        ('Fruit juice drink (Sunny D)', 7204),
+        ('Fruit flavored drink, powdered, reconstituted', 7204),
+        ('Fruit flavored drink, with high vitamin C, powdered, reconstituted', 7204),
+        ('Fruit juice drink, with high vitamin C, light', 7204),
+        ('Fruit juice drink, light', 7204),
+        ('Fruit juice drink, diet', 7204),
+        ('Cranberry juice drink, with high vitamin C, light', 7204),
+        ('Grape juice drink, light', 7204),
+        ('Orange juice beverage, 40-50% juice, light', 7204),
+        ('Apple juice beverage, 40-50% juice, light', 7204),
+        ('Lemonade, fruit juice drink, light', 7204),
+        ('Pomegranate juice beverage, 40-50% juice, light', 7204),
+        ('Vegetable and fruit juice drink, with high vitamin C, light', 7204),
+        ('Fruit juice drink (Capri Sun)', 7204),
+        ('Fruit juice drink, added calcium (Sunny D)', 7204),
+        ('Sugar cane beverage', 7204),
+        ('Wine, nonalcoholic', 7204),
+        ('Beer, nonalcoholic', 7204),
+        ('Shirley Temple', 7204),
+        ('Water, baby', 9204),
+        ('Fruit juice, acai blend', 7204)
+) AS c (name, code)
+WHERE
+    f.name = c.name;
+
 -- Ingredients Data
 INSERT INTO
     public.ingredients (name)
@@ -21036,4 +22662,6 @@ VALUES (1301, 6, 0.14),
     (1307, 6, 0.12),
     (1308, 6, 0.0),
     (1309, 6, 0.0),
-    (1310, 6, 0.83);
\ No newline at end of file
+    (1310, 6, 0.83);
+
+SELECT refresh_food_beverages();
@@ -28,6 +28,11 @@ const getGrowthRecords = () => {
 const updateGrowthRecords = (payload) => {
     return UserService.updateGrowthRecords(payload)
         .then(handleResponse)
+        .then((data) => {
+            // The profile carried in the token changed; keep the reissued one
+            if (data?.access_token) localStorage.setItem('access_token', data.access_token);
+            return data;
+        })
         .catch(handleError);
 }
 